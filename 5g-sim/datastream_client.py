@@ -1,42 +1,134 @@
 # windows_etl_client.py - Windows Side
 import asyncio
 import websockets
-import json
+import orjson
 import socket
 import threading
 import time
+from array import array
+import numpy as np
 import pandas as pd
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import logging
-from dataclasses import dataclass
-from queue import Queue
+import os
+from collections import deque
 import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class NS3Packet:
-    timestamp: float
-    node_id: int
-    packet_type: str
-    packet_size: int
-    source: Optional[str] = None
-    destination: Optional[str] = None
-    delay: Optional[float] = None
-    throughput: Optional[float] = None
+class PacketBatch:
+    """Columnar (struct-of-arrays) buffer for a batch of NS-3 packets"""
+    __slots__ = (
+        'timestamps', 'node_ids', 'packet_types', 'packet_sizes',
+        'sources', 'destinations', 'delays', 'throughput'
+    )
+    
+    def __init__(self):
+        self.timestamps = array('d')
+        self.node_ids = array('q')
+        self.packet_types: List[str] = []
+        self.packet_sizes = array('q')
+        # Optional columns stay as lists so missing values map to NULL
+        self.sources: List[Optional[str]] = []
+        self.destinations: List[Optional[str]] = []
+        self.delays: List[Optional[float]] = []
+        self.throughput: List[Optional[float]] = []
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def extend(self, messages: Iterable[Dict]):
+        """Append many parsed NS-3 messages, binding the column appenders once"""
+        now = time.time()
+        add_timestamp = self.timestamps.append
+        add_node_id = self.node_ids.append
+        add_packet_type = self.packet_types.append
+        add_packet_size = self.packet_sizes.append
+        add_source = self.sources.append
+        add_destination = self.destinations.append
+        add_delay = self.delays.append
+        add_throughput = self.throughput.append
+        
+        for data in messages:
+            get = data.get
+            # Coerce typed columns up front so a bad message can't misalign them
+            timestamp = float(get('timestamp', now))
+            node_id = int(get('node_id', 0))
+            packet_size = int(get('packet_size', 0))
+            
+            add_timestamp(timestamp)
+            add_node_id(node_id)
+            add_packet_type(get('type', 'unknown'))
+            add_packet_size(packet_size)
+            add_source(get('source'))
+            add_destination(get('destination'))
+            add_delay(get('delay'))
+            add_throughput(get('throughput_mbps'))
+    
+    def rows(self):
+        """Iterate row tuples in INSERT_PACKET_SQL column order"""
+        return zip(
+            self.timestamps, self.node_ids, self.packet_types, self.packet_sizes,
+            self.sources, self.destinations, self.delays, self.throughput
+        )
+    
+    def clear(self):
+        """Empty all columns in place so the buffers can be reused"""
+        for name in self.__slots__:
+            del getattr(self, name)[:]
+
+INSERT_PACKET_SQL = '''
+    INSERT INTO packets (timestamp, node_id, packet_type, packet_size,
+                       source, destination, delay, throughput)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_STATS_SQL = '''
+    INSERT INTO throughput_stats (node_id, avg_throughput, max_throughput, min_throughput,
+                                  packet_count, throughput_count, total_bytes,
+                                  window_start, window_end)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA wal_autocheckpoint=10000',
+)
 
 class DatabaseManager:
     def __init__(self, db_path: str = "ns3_data.db"):
         self.db_path = db_path
         self.init_database()
+        
+        # Single persistent writer connection shared with the data_processor
+        # thread; autocommit mode so we control transactions with BEGIN/COMMIT
+        self._writer = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.configure_connection(self._writer)
+        self._writer_lock = threading.Lock()
+        
+        # Read-only connection reused by dashboard queries (see get_reader)
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+    
+    @staticmethod
+    def configure_connection(conn: sqlite3.Connection):
+        """Apply WAL journaling and cache tuning to a connection"""
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
     
     def init_database(self):
         """Initialize SQLite database with tables"""
         conn = sqlite3.connect(self.db_path)
+        self.configure_connection(conn)
         cursor = conn.cursor()
         
         # Create packets table
@@ -64,73 +156,169 @@ class DatabaseManager:
                 max_throughput REAL,
                 min_throughput REAL,
                 packet_count INTEGER,
+                throughput_count INTEGER,
+                total_bytes INTEGER,
                 window_start DATETIME,
                 window_end DATETIME,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        # Columns added after the first release of throughput_stats
+        existing = {row[1] for row in cursor.execute('PRAGMA table_info(throughput_stats)')}
+        for column in ('throughput_count', 'total_bytes'):
+            if column not in existing:
+                cursor.execute(f'ALTER TABLE throughput_stats ADD COLUMN {column} INTEGER')
+        
         # Create indexes for performance
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON packets(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_node_id ON packets(node_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_stats_window_end ON throughput_stats(window_end)')
         
         conn.commit()
         conn.close()
         logger.info(f"Database initialized: {self.db_path}")
     
-    def insert_packet(self, packet: NS3Packet):
-        """Insert packet data into database"""
+    def insert_packets(self, batch: PacketBatch):
+        """Insert a batch of packets in a single transaction"""
+        with self._writer_lock:
+            cursor = self._writer.cursor()
+            try:
+                cursor.execute('BEGIN')
+                cursor.executemany(INSERT_PACKET_SQL, batch.rows())
+                cursor.execute('COMMIT')
+            except Exception as e:
+                if self._writer.in_transaction:
+                    cursor.execute('ROLLBACK')
+                logger.error(f"Database insert error: {e}")
+                return 0
+        
+        return len(batch)
+    
+    def insert_throughput_stats(self, rows: List[tuple]):
+        """Insert one aggregated throughput_stats row per node for a closed window"""
+        with self._writer_lock:
+            cursor = self._writer.cursor()
+            try:
+                cursor.execute('BEGIN')
+                cursor.executemany(INSERT_STATS_SQL, rows)
+                cursor.execute('COMMIT')
+            except Exception as e:
+                if self._writer.in_transaction:
+                    cursor.execute('ROLLBACK')
+                logger.error(f"Throughput stats insert error: {e}")
+    
+    def get_stats_summary(self, minutes: int = 5) -> Optional[Dict]:
+        """Aggregate the throughput_stats windows that closed in the last N minutes"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._reader_lock:
+                row = self.get_reader().execute(
+                    '''
+                    SELECT SUM(packet_count),
+                           SUM(avg_throughput * throughput_count) / SUM(throughput_count),
+                           MAX(max_throughput),
+                           COUNT(DISTINCT node_id),
+                           SUM(total_bytes)
+                    FROM throughput_stats
+                    WHERE window_end > ?
+                    ''',
+                    (time.time() - minutes * 60,)
+                ).fetchone()
             
-            cursor.execute('''
-                INSERT INTO packets (timestamp, node_id, packet_type, packet_size, 
-                                   source, destination, delay, throughput)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                packet.timestamp, packet.node_id, packet.packet_type,
-                packet.packet_size, packet.source, packet.destination,
-                packet.delay, packet.throughput
-            ))
+            total_packets, avg_throughput, max_throughput, active_nodes, total_bytes = row
+            if not total_packets:
+                return None
             
-            conn.commit()
-            conn.close()
+            return {
+                'total_packets': total_packets,
+                'avg_throughput': avg_throughput or 0,
+                'max_throughput': max_throughput or 0,
+                'active_nodes': active_nodes,
+                'avg_packet_size': total_bytes / total_packets,
+                'total_data_mb': total_bytes / (1024 * 1024)
+            }
             
         except Exception as e:
-            logger.error(f"Database insert error: {e}")
+            logger.error(f"Database query error: {e}")
+            return None
     
-    def get_recent_data(self, minutes: int = 5) -> pd.DataFrame:
-        """Get recent data for dashboard"""
+    def get_reader(self) -> sqlite3.Connection:
+        """Return the shared read-only connection so dashboard queries never take write locks"""
+        if self._reader is None:
+            self._reader = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, timeout=5, check_same_thread=False
+            )
+        return self._reader
+    
+    def get_recent_packets(self, minutes: int = 5, limit: int = 100) -> List[Dict]:
+        """Get the newest packets in the window as records, bounded in SQL"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            with self._reader_lock:
+                cursor = self.get_reader().execute(
+                    'SELECT * FROM packets WHERE timestamp > ? ORDER BY timestamp DESC LIMIT ?',
+                    (time.time() - minutes * 60, limit)
+                )
+                columns = [col[0] for col in cursor.description]
+                rows = cursor.fetchall()
             
-            query = '''
-                SELECT * FROM packets 
-                WHERE timestamp > (strftime('%s', 'now') - ?)
-                ORDER BY timestamp DESC
-            '''
+            return [dict(zip(columns, row)) for row in rows]
             
-            df = pd.read_sql_query(query, conn, params=[minutes * 60])
-            conn.close()
+        except Exception as e:
+            logger.error(f"Database query error: {e}")
+            return []
+    
+    def get_recent_data(self, minutes: int = 5) -> pd.DataFrame:
+        """Get recent data for dashboard"""
+        try:
+            with self._reader_lock:
+                cursor = self.get_reader().execute(
+                    'SELECT * FROM packets WHERE timestamp > ? ORDER BY timestamp DESC',
+                    (time.time() - minutes * 60,)
+                )
+                columns = [col[0] for col in cursor.description]
+                rows = cursor.fetchall()
             
-            return df
+            return pd.DataFrame.from_records(rows, columns=columns)
             
         except Exception as e:
             logger.error(f"Database query error: {e}")
             return pd.DataFrame()
 
+class UDPIngestProtocol(asyncio.DatagramProtocol):
+    """Feeds datagrams received on the event loop into the ETL client"""
+    
+    def __init__(self, client: 'NS3ETLClient'):
+        self.client = client
+    
+    def datagram_received(self, data: bytes, addr):
+        try:
+            self.client.process_incoming_data(orjson.loads(data))
+            self.client.stats['packets_received'] += 1
+        except orjson.JSONDecodeError as e:
+            logger.error(f"UDP JSON decode error: {e}")
+    
+    def error_received(self, exc: Exception):
+        logger.error(f"UDP error: {exc}")
+
 class NS3ETLClient:
     def __init__(self, config: Dict):
         self.config = config
         self.db_manager = DatabaseManager()
-        self.data_queue = Queue(maxsize=50000)
+        # SPSC ring buffer: append/popleft are atomic, maxlen drops the oldest
+        self.data_queue = deque(maxlen=50000)
+        self._data_ready = threading.Event()
+        self._udp_transport: Optional[asyncio.DatagramTransport] = None
+        
+        # Rolling per-node aggregates for the open throughput_stats window:
+        # node_id -> [packet_count, total_bytes, throughput_count, sum, max, min]
+        self._node_window: Dict[int, list] = {}
+        self._window_start = time.time()
         self.running = False
         self.stats = {
             'packets_received': 0,
             'packets_processed': 0,
             'connection_status': 'disconnected',
-            'last_activity': None
+            'last_activity_ns': None  # time.time_ns(); converted when rendered
         }
     
     async def websocket_client(self):
@@ -149,12 +337,11 @@ class NS3ETLClient:
                             break
                             
                         try:
-                            data = json.loads(message)
+                            data = orjson.loads(message)
                             self.process_incoming_data(data)
                             self.stats['packets_received'] += 1
-                            self.stats['last_activity'] = datetime.now()
                             
-                        except json.JSONDecodeError as e:
+                        except orjson.JSONDecodeError as e:
                             logger.error(f"JSON decode error: {e}")
                         except Exception as e:
                             logger.error(f"Message processing error: {e}")
@@ -180,23 +367,30 @@ class NS3ETLClient:
                     sock.connect((self.config['vm_host'], self.config['tcp_port']))
                     logger.info("TCP connected successfully")
                     
-                    buffer = ""
+                    chunk = bytearray(65536)
+                    chunk_view = memoryview(chunk)
+                    buffer = bytearray()
                     while self.running:
                         try:
-                            data = sock.recv(4096).decode('utf-8')
-                            if not data:
+                            n = sock.recv_into(chunk)
+                            if not n:
                                 break
                             
-                            buffer += data
-                            while '\n' in buffer:
-                                line, buffer = buffer.split('\n', 1)
+                            # Frame newline-delimited JSON at the byte level;
+                            # del from the front of a bytearray is amortized O(1)
+                            buffer += chunk_view[:n]
+                            idx = buffer.find(b'\n')
+                            while idx != -1:
+                                line = buffer[:idx]
+                                del buffer[:idx + 1]
                                 if line.strip():
                                     try:
-                                        json_data = json.loads(line.strip())
+                                        json_data = orjson.loads(line)
                                         self.process_incoming_data(json_data)
                                         self.stats['packets_received'] += 1
-                                    except json.JSONDecodeError:
+                                    except orjson.JSONDecodeError:
                                         pass
+                                idx = buffer.find(b'\n')
                         
                         except socket.timeout:
                             continue
@@ -211,104 +405,136 @@ class NS3ETLClient:
                 logger.info("TCP reconnecting in 5 seconds...")
                 time.sleep(5)
     
-    def udp_listener(self):
-        """UDP listener for high-throughput data"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.bind(('0.0.0.0', self.config['udp_port']))
-            sock.settimeout(1.0)
-            
-            logger.info(f"UDP listener started on port {self.config['udp_port']}")
-            
-            while self.running:
-                try:
-                    data, addr = sock.recvfrom(65536)
-                    json_data = json.loads(data.decode('utf-8'))
-                    self.process_incoming_data(json_data)
-                    self.stats['packets_received'] += 1
-                    
-                except socket.timeout:
-                    continue
-                except json.JSONDecodeError as e:
-                    logger.error(f"UDP JSON decode error: {e}")
-                except Exception as e:
-                    logger.error(f"UDP error: {e}")
+    async def start_udp_listener(self):
+        """UDP listener for high-throughput data, served by the asyncio loop"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Large kernel receive buffer absorbs bursts while Python is busy parsing
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF,
+            self.config.get('udp_recv_buffer', 4 * 1024 * 1024)
+        )
+        sock.bind(('0.0.0.0', self.config['udp_port']))
         
-        except Exception as e:
-            logger.error(f"UDP listener error: {e}")
-        finally:
-            sock.close()
+        loop = asyncio.get_running_loop()
+        self._udp_transport, _ = await loop.create_datagram_endpoint(
+            lambda: UDPIngestProtocol(self), sock=sock
+        )
+        logger.info(f"UDP listener started on port {self.config['udp_port']}")
     
     def process_incoming_data(self, data: Dict):
-        """Process incoming NS-3 data"""
+        """Hand a parsed NS-3 message to the processor thread"""
+        # Runs on the receive threads: only enqueue, row building happens at batch time
+        self.data_queue.append(data)
+        self._data_ready.set()
+        self.stats['last_activity_ns'] = time.time_ns()
+    
+    def pin_writer_thread(self):
+        """Pin the calling (writer) thread to config['writer_cpu'] where supported"""
+        writer_cpu = self.config.get('writer_cpu')
+        if writer_cpu is None:
+            return
+        if not hasattr(os, 'sched_setaffinity'):
+            logger.info("CPU affinity not supported on this platform; writer thread not pinned")
+            return
         try:
-            # Convert to NS3Packet object
-            packet = NS3Packet(
-                timestamp=data.get('timestamp', time.time()),
-                node_id=data.get('node_id', 0),
-                packet_type=data.get('type', 'unknown'),
-                packet_size=data.get('packet_size', 0),
-                source=data.get('source'),
-                destination=data.get('destination'),
-                delay=data.get('delay'),
-                throughput=data.get('throughput_mbps')
-            )
-            
-            # Add to processing queue
-            if not self.data_queue.full():
-                self.data_queue.put(packet)
-            else:
-                logger.warning("Processing queue full - dropping data")
-        
-        except Exception as e:
-            logger.error(f"Data processing error: {e}")
+            # pid 0 targets the calling thread on Linux
+            os.sched_setaffinity(0, {writer_cpu})
+            logger.info(f"Writer thread pinned to CPU {writer_cpu}")
+        except OSError as e:
+            logger.warning(f"Could not pin writer thread to CPU {writer_cpu}: {e}")
     
     def data_processor(self):
         """Process queued data for ETL pipeline"""
+        self.pin_writer_thread()
         batch_size = 100
-        batch = []
+        stats_window = self.config.get('stats_window', 10)
+        batch = PacketBatch()
         
         while self.running:
             try:
-                # Collect batch
-                while len(batch) < batch_size and not self.data_queue.empty():
-                    packet = self.data_queue.get(timeout=1)
-                    batch.append(packet)
+                # Block until the receive side signals new data
+                if not self.data_queue:
+                    self._data_ready.wait(timeout=0.5)
+                    self._data_ready.clear()
                 
-                # Process batch
-                if batch:
+                # Drain the whole backlog in batch_size chunks before waiting again
+                queue = self.data_queue
+                while queue:
+                    take = min(batch_size - len(batch), len(queue))
+                    popleft = queue.popleft
+                    batch.extend(popleft() for _ in range(take))
+                    
                     self.process_batch(batch)
                     batch.clear()
+                    
+                    # Under sustained ingest the queue never empties, so windows
+                    # must also close from inside the drain loop
+                    if time.time() - self._window_start >= stats_window:
+                        self.flush_throughput_stats()
                 
-                time.sleep(0.1)  # Small delay to prevent CPU spinning
+                if time.time() - self._window_start >= stats_window:
+                    self.flush_throughput_stats()
                 
             except Exception as e:
                 logger.error(f"Batch processing error: {e}")
     
-    def process_batch(self, batch: List[NS3Packet]):
+    def process_batch(self, batch: PacketBatch):
         """Process a batch of packets"""
         try:
             # Insert into database
-            for packet in batch:
-                self.db_manager.insert_packet(packet)
-                self.stats['packets_processed'] += 1
+            self.stats['packets_processed'] += self.db_manager.insert_packets(batch)
+            self.update_node_window(batch)
+            
+            # NumPy views over the batch columns (None -> NaN, then dropped)
+            throughput = np.array(batch.throughput, dtype=np.float64)
+            throughput = throughput[~np.isnan(throughput)]
+            packet_types = np.asarray(batch.packet_types)
             
             # Trigger real-time analytics
-            self.trigger_analytics(batch)
+            self.trigger_analytics(throughput, packet_types)
             
             logger.debug(f"Processed batch of {len(batch)} packets")
             
         except Exception as e:
             logger.error(f"Batch processing error: {e}")
     
-    def trigger_analytics(self, batch: List[NS3Packet]):
+    def update_node_window(self, batch: PacketBatch):
+        """Fold a batch into the rolling per-node aggregates"""
+        window = self._node_window
+        for node_id, packet_size, throughput in zip(batch.node_ids, batch.packet_sizes, batch.throughput):
+            agg = window.get(node_id)
+            if agg is None:
+                agg = window[node_id] = [0, 0, 0, 0.0, None, None]
+            agg[0] += 1
+            agg[1] += packet_size
+            if throughput is not None:
+                agg[2] += 1
+                agg[3] += throughput
+                agg[4] = throughput if agg[4] is None else max(agg[4], throughput)
+                agg[5] = throughput if agg[5] is None else min(agg[5], throughput)
+    
+    def flush_throughput_stats(self):
+        """Close the current window and persist one throughput_stats row per node"""
+        window_start, window_end = self._window_start, time.time()
+        window, self._node_window = self._node_window, {}
+        self._window_start = window_end
+        
+        if not window:
+            return
+        
+        rows = [
+            (node_id, (thr_sum / thr_count) if thr_count else None, thr_max, thr_min,
+             count, thr_count, total_bytes, window_start, window_end)
+            for node_id, (count, total_bytes, thr_count, thr_sum, thr_max, thr_min) in window.items()
+        ]
+        self.db_manager.insert_throughput_stats(rows)
+    
+    def trigger_analytics(self, throughput: np.ndarray, packet_types: np.ndarray):
         """Trigger real-time analytics and alerts"""
         try:
             # Calculate throughput statistics
-            throughput_data = [p.throughput for p in batch if p.throughput is not None]
-            
-            if throughput_data:
-                avg_throughput = sum(throughput_data) / len(throughput_data)
+            if throughput.size:
+                avg_throughput = throughput.mean()
                 
                 # Alert if throughput drops below threshold
                 if avg_throughput < self.config.get('throughput_threshold', 10.0):
@@ -316,8 +542,8 @@ class NS3ETLClient:
                     # Here you could send alerts to monitoring system
             
             # Calculate packet loss (simplified)
-            tx_packets = len([p for p in batch if p.packet_type == 'packet_tx'])
-            rx_packets = len([p for p in batch if p.packet_type == 'packet_rx'])
+            tx_packets = int((packet_types == 'packet_tx').sum())
+            rx_packets = int((packet_types == 'packet_rx').sum())
             
             if tx_packets > 0:
                 packet_loss = max(0, (tx_packets - rx_packets) / tx_packets * 100)
@@ -327,28 +553,26 @@ class NS3ETLClient:
         except Exception as e:
             logger.error(f"Analytics error: {e}")
     
+    def get_stats(self) -> Dict:
+        """Snapshot client statistics with last_activity as a datetime"""
+        stats = self.stats.copy()
+        last_activity_ns = stats.pop('last_activity_ns')
+        stats['last_activity'] = datetime.fromtimestamp(last_activity_ns / 1e9) if last_activity_ns else None
+        return stats
+    
     def get_dashboard_data(self) -> Dict:
         """Get data for dashboard"""
         try:
-            recent_data = self.db_manager.get_recent_data(minutes=5)
+            # Metrics come from the pre-aggregated windows, not a packet scan
+            metrics = self.db_manager.get_stats_summary(minutes=5)
             
-            if recent_data.empty:
+            if metrics is None:
                 return {"error": "No recent data"}
             
-            # Calculate metrics
-            throughput_data = recent_data[recent_data['throughput'].notna()]
-            
             dashboard_data = {
-                'stats': self.stats.copy(),
-                'metrics': {
-                    'total_packets': len(recent_data),
-                    'avg_throughput': throughput_data['throughput'].mean() if not throughput_data.empty else 0,
-                    'max_throughput': throughput_data['throughput'].max() if not throughput_data.empty else 0,
-                    'active_nodes': recent_data['node_id'].nunique(),
-                    'avg_packet_size': recent_data['packet_size'].mean(),
-                    'total_data_mb': recent_data['packet_size'].sum() / (1024 * 1024)
-                },
-                'recent_data': recent_data.tail(100).to_dict('records')
+                'stats': self.get_stats(),
+                'metrics': metrics,
+                'recent_data': self.db_manager.get_recent_packets(minutes=5, limit=100)
             }
             
             return dashboard_data
@@ -370,17 +594,16 @@ class NS3ETLClient:
         tcp_thread = threading.Thread(target=self.tcp_client, daemon=True)
         tcp_thread.start()
         
-        # Start UDP listener
-        udp_thread = threading.Thread(target=self.udp_listener, daemon=True)
-        udp_thread.start()
-        
         logger.info("ETL Client started successfully")
-        logger.info(f"Listening for UDP on port {self.config['udp_port']}")
         logger.info(f"TCP fallback: {self.config['vm_host']}:{self.config['tcp_port']}")
     
     def stop_client(self):
         """Stop all services"""
         self.running = False
+        self._data_ready.set()
+        if self._udp_transport is not None:
+            self._udp_transport.close()
+            self._udp_transport = None
         logger.info("Stopping NS3 ETL Client...")
 
 
@@ -391,8 +614,11 @@ def get_default_config():
         'websocket_port': 8765,
         'tcp_port': 8766,
         'udp_port': 9001,  # Local UDP listening port
+        'udp_recv_buffer': 4 * 1024 * 1024,  # SO_RCVBUF bytes
         'throughput_threshold': 10.0,  # Mbps
         'packet_loss_threshold': 5.0,  # Percentage
+        'stats_window': 10,  # Seconds per throughput_stats row
+        'writer_cpu': None,  # CPU to pin the DB writer thread to (Linux only)
         'db_path': 'ns3_realtime.db'
     }
 
@@ -404,6 +630,7 @@ async def main():
     
     # Start client services
     client.start_client()
+    await client.start_udp_listener()
     
     # Start WebSocket client
     websocket_task = asyncio.create_task(client.websocket_client())
@@ -2,6 +2,7 @@
 import asyncio
 import websockets
 import json
+import orjson
 import socket
 import threading
 import time
@@ -14,10 +15,16 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum messages broadcast per wakeup before yielding to the event loop
+BROADCAST_BURST_SIZE = 32
+
+# Per-WebSocket-client backlog; messages for a client this far behind are dropped
+WS_SEND_QUEUE_SIZE = 1000
+
 class NS3StreamServer:
     def __init__(self, config: Dict):
         self.config = config
-        self.websocket_clients = set()
+        self.websocket_clients: Dict[object, asyncio.Queue] = {}  # websocket -> send queue
         self.tcp_clients = set()
         self.data_queue = queue.Queue(maxsize=10000)  # Buffer for high-throughput
         self.running = False
@@ -26,16 +33,14 @@ class NS3StreamServer:
         self.stats = {
             'packets_sent': 0,
             'clients_connected': 0,
-            'last_activity': None
+            'ws_messages_dropped': 0,
+            'last_activity_ns': None  # time.time_ns(); converted in get_stats
         }
     
     async def websocket_handler(self, websocket, path):
         """Handle WebSocket connections"""
+        writer_task = None
         try:
-            self.websocket_clients.add(websocket)
-            self.stats['clients_connected'] += 1
-            logger.info(f"WebSocket client connected. Total: {len(self.websocket_clients)}")
-            
             # Send connection confirmation
             await websocket.send(json.dumps({
                 'type': 'connection',
@@ -43,13 +48,36 @@ class NS3StreamServer:
                 'timestamp': datetime.now().isoformat()
             }))
             
+            send_queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+            self.websocket_clients[websocket] = send_queue
+            self.stats['clients_connected'] += 1
+            logger.info(f"WebSocket client connected. Total: {len(self.websocket_clients)}")
+            
+            # A dedicated writer per client so a slow reader never stalls the others
+            writer_task = asyncio.create_task(self._websocket_writer(websocket, send_queue))
+            
             # Keep connection alive
             await websocket.wait_closed()
             
         except websockets.exceptions.ConnectionClosed:
             logger.info("WebSocket client disconnected")
         finally:
-            self.websocket_clients.discard(websocket)
+            self.websocket_clients.pop(websocket, None)
+            if writer_task is not None:
+                writer_task.cancel()
+    
+    async def _websocket_writer(self, websocket, send_queue: asyncio.Queue):
+        """Drain one client's send queue onto its socket"""
+        try:
+            while True:
+                payload = await send_queue.get()
+                await websocket.send(payload)
+                self.stats['packets_sent'] += 1
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"WebSocket send error: {e}")
+            await websocket.close()
     
     def tcp_server_handler(self):
         """Handle TCP socket connections"""
@@ -99,12 +127,13 @@ class NS3StreamServer:
             try:
                 if not self.data_queue.empty():
                     data = self.data_queue.get_nowait()
+                    payload = orjson.dumps(data)
                     
                     # Send to all registered UDP clients
                     for client_addr in self.config.get('udp_clients', []):
                         try:
                             udp_socket.sendto(
-                                json.dumps(data).encode('utf-8'),
+                                payload,
                                 (client_addr['host'], client_addr['port'])
                             )
                         except Exception as e:
@@ -123,48 +152,51 @@ class NS3StreamServer:
         """Broadcast data to all connected clients"""
         while self.running:
             try:
-                if not self.data_queue.empty():
-                    data = self.data_queue.get_nowait()
-                    json_data = json.dumps(data)
-                    
-                    # WebSocket broadcast
-                    if self.websocket_clients:
-                        disconnected = set()
-                        for websocket in self.websocket_clients.copy():
-                            try:
-                                await websocket.send(json_data)
-                                self.stats['packets_sent'] += 1
-                            except websockets.exceptions.ConnectionClosed:
-                                disconnected.add(websocket)
-                            except Exception as e:
-                                logger.error(f"WebSocket send error: {e}")
-                                disconnected.add(websocket)
-                        
-                        # Remove disconnected clients
-                        self.websocket_clients -= disconnected
-                    
-                    # TCP broadcast
-                    if self.tcp_clients:
-                        disconnected = set()
-                        for client_socket in self.tcp_clients.copy():
-                            try:
-                                client_socket.send((json_data + '\n').encode('utf-8'))
-                            except Exception as e:
-                                logger.error(f"TCP send error: {e}")
-                                disconnected.add(client_socket)
-                        
-                        # Remove disconnected clients
-                        self.tcp_clients -= disconnected
-                    
-                    self.stats['last_activity'] = datetime.now()
+                # Drain a burst of queued messages per wakeup
+                drained = 0
+                while drained < BROADCAST_BURST_SIZE:
+                    try:
+                        data = self.data_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    drained += 1
+                    self._broadcast_message(data)
                 
-                await asyncio.sleep(0.001)  # 1ms delay for high throughput
+                # Just yield when busy; back off briefly when idle
+                await asyncio.sleep(0 if drained else 0.001)
                 
-            except queue.Empty:
-                await asyncio.sleep(0.01)
             except Exception as e:
                 logger.error(f"Broadcast error: {e}")
     
+    def _broadcast_message(self, data: Dict):
+        """Send one message to every WebSocket and TCP client"""
+        # Encode once; every client gets the same frame
+        json_data = orjson.dumps(data)
+        ws_payload = json_data.decode('utf-8')
+        tcp_payload = json_data + b'\n'
+        
+        # WebSocket broadcast: enqueue only, per-client writers do the sends
+        for send_queue in self.websocket_clients.values():
+            try:
+                send_queue.put_nowait(ws_payload)
+            except asyncio.QueueFull:
+                self.stats['ws_messages_dropped'] += 1
+        
+        # TCP broadcast
+        if self.tcp_clients:
+            disconnected = set()
+            for client_socket in self.tcp_clients.copy():
+                try:
+                    client_socket.send(tcp_payload)
+                except Exception as e:
+                    logger.error(f"TCP send error: {e}")
+                    disconnected.add(client_socket)
+            
+            # Remove disconnected clients
+            self.tcp_clients -= disconnected
+        
+        self.stats['last_activity_ns'] = time.time_ns()
+    
     def add_ns3_data(self, data: Dict):
         """Add NS-3 data to streaming queue"""
         try:
@@ -189,8 +221,11 @@ class NS3StreamServer:
     
     def get_stats(self) -> Dict:
         """Get server statistics"""
+        stats = self.stats.copy()
+        last_activity_ns = stats.pop('last_activity_ns')
         return {
-            **self.stats,
+            **stats,
+            'last_activity': datetime.fromtimestamp(last_activity_ns / 1e9) if last_activity_ns else None,
             'websocket_clients': len(self.websocket_clients),
             'tcp_clients': len(self.tcp_clients),
             'queue_size': self.data_queue.qsize(),
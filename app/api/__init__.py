@@ -5,61 +5,32 @@ This package contains all the API endpoints and routes for the application.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
+from app.api import dashboard as dashboard_stats
 from app.api.routers import (
     auth,
     users,
     slices,
     devices,
     metrics,
+    ns3,
     dashboard
 )
 
-api_router = APIRouter(prefix="/api/v1")
-
-# Include all API routes
-api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["auth"]
-)
-
-api_router.include_router(
-    users.router,
-    prefix="/users",
-    tags=["users"]
-)
-
-api_router.include_router(
-    slices.router,
-    prefix="/slices",
-    tags=["slices"]
-)
-
-api_router.include_router(
-    devices.router,
-    prefix="/devices",
-    tags=["devices"]
-)
-
-api_router.include_router(
-    metrics.router,
-    prefix="/metrics",
-    tags=["metrics"]
-)
-
-api_router.include_router(
-    dashboard.router,
-    prefix="/dashboard",
-    tags=["dashboard"]
-)
-
-# Include dashboard routes if needed
-# api_router.include_router(
-#     dashboard.router,
-#     prefix="/dashboard",
-#     tags=["dashboard"]
-# )
+# The single composition of the API routers. Each router carries its own
+# prefix and tags, so they are included as-is.
+api_router = APIRouter(prefix="/api/v1", default_response_class=ORJSONResponse)
+
+api_router.include_router(auth.router)
+api_router.include_router(users.router)
+api_router.include_router(slices.router)
+api_router.include_router(devices.router)
+api_router.include_router(metrics.router)
+api_router.include_router(ns3.router)
+api_router.include_router(dashboard.router)
+# /dashboard/stats lives outside app.api.routers; same prefix, no path overlap
+api_router.include_router(dashboard_stats.router)
 
 # This makes the router available when importing from app.api
 __all__ = ['api_router']
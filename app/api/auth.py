@@ -2,14 +2,18 @@
 Authentication routes for user registration, login, and token management.
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Form
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
+from jinja2 import Template
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+
 from app.db.database import get_db
 from app.db.models import User, UserInDB
 from app.auth.deps import create_access_token, get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES
@@ -19,12 +23,26 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 
 # HTML Templates
 templates = Jinja2Templates(directory="app/templates")
+# Outside debug, templates don't change under a running server; skip the mtime check
+templates.env.auto_reload = settings.DEBUG
+
+
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> Template:
+    """Look up a compiled template once; later renders skip the loader entirely."""
+    return templates.get_template(name)
+
+
+def _render(name: str, request: Request, status_code: int = 200, **context: Any) -> HTMLResponse:
+    """Render a template straight to an HTMLResponse, without TemplateResponse."""
+    html = _get_template(name).render(request=request, **context)
+    return HTMLResponse(html, status_code=status_code)
 
 
 @router.get("/register", response_class=HTMLResponse)
 async def register_page(request: Request):
     """Render the registration page"""
-    return templates.TemplateResponse("register.html", {"request": request})
+    return _render("register.html", request)
 
 
 @router.post("/register", response_class=HTMLResponse)
@@ -40,11 +58,7 @@ async def register_user(
     # Check if user already exists
     db_user = User.get_user(db, username=username)
     if db_user:
-        return templates.TemplateResponse(
-            "register.html",
-            {"request": request, "error": "Username already registered"},
-            status_code=400,
-        )
+        return _render("register.html", request, status_code=400, error="Username already registered")
 
     # Create new user
     user = User.create_user(db, username=username, email=email, password=password)
@@ -69,7 +83,7 @@ async def register_user(
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     """Render the login page"""
-    return templates.TemplateResponse("login.html", {"request": request})
+    return _render("login.html", request)
 
 
 @router.post("/login", response_class=HTMLResponse)
@@ -83,11 +97,7 @@ async def login_for_access_token(
     # Authenticate user
     user = User.authenticate_user(db, username=form_data.username, password=form_data.password)
     if not user:
-        return templates.TemplateResponse(
-            "login.html",
-            {"request": request, "error": "Incorrect username or password"},
-            status_code=401,
-        )
+        return _render("login.html", request, status_code=401, error="Incorrect username or password")
 
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -1,77 +1,144 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import DateTime, Select, func, and_, select, case, type_coerce
+from sqlalchemy.sql import ColumnElement
 
-from app.db.database import get_db
-from app.db.models import Slice, Device, Metric, Alert, User
-from app.core.security import get_current_active_user
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.db.database import async_engine, async_session_factory
+from app.db.models import Slice, Device, Metric, Alert, User, metric_hourly, metric_hour_bucket
+from app.api.deps import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+async def _fetch_all(stmt: Select) -> List[Any]:
+    """Run one statement on its own session so independent queries can overlap.
+    
+    An AsyncSession can't execute concurrently, hence a session per statement.
+    """
+    async with async_session_factory() as session:
+        result = await session.execute(stmt)
+        return result.all()
+
+def _weighted_avg(column: ColumnElement) -> ColumnElement:
+    """Combine per-slice hourly averages from metric_hourly into one average."""
+    samples = metric_hourly.c.samples
+    return func.sum(column * samples) / func.nullif(
+        func.sum(case((column.isnot(None), samples), else_=0)), 0
+    )
+
+def _hour(column: ColumnElement) -> ColumnElement:
+    """Truncate a timestamp column to the hour on either backend."""
+    if async_engine.dialect.name == "postgresql":
+        return func.date_trunc('hour', column)
+    # SQLite has no date_trunc(); format the hour and read it back as a datetime
+    return type_coerce(func.strftime('%Y-%m-%d %H:00:00', column), DateTime)
 
 @router.get("/stats")
 async def get_dashboard_stats(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
     Get dashboard statistics for the authenticated user.
     """
+    # The aggregates are the same for every user, so all users share one entry
+    body = await response_cache.get_or_set_swr("dashboard:stats", _load_dashboard_stats)
+    return Response(body, media_type="application/json")
+
+async def _load_dashboard_stats() -> Dict[str, Any]:
+    """Compute the dashboard statistics payload."""
     try:
         # Get current time and time 24 hours ago
         now = datetime.utcnow()
         one_day_ago = now - timedelta(days=1)
+        bucket_cutoff = one_day_ago.replace(minute=0, second=0, microsecond=0)
         
-        # Get active slices count
-        active_slices = db.query(Slice).filter(
-            Slice.status == "active"
-        ).count()
-        
-        # Get connected devices count
-        connected_devices = db.query(Device).filter(
-            Device.status == "connected"
-        ).count()
+        # Window filter for raw metric rows. On PostgreSQL the (redundant) hour
+        # bucket filter lets the planner prune by bucket; other backends have no
+        # timezone()/date_trunc(), so they get the timestamp filter alone
+        metric_window = [Metric.timestamp >= one_day_ago]
+        if async_engine.dialect.name == "postgresql":
+            metric_window.insert(0, metric_hour_bucket >= bucket_cutoff)
         
-        # Get active alerts count
-        active_alerts = db.query(Alert).filter(
-            Alert.status == "active"
-        ).count()
-        
-        # Get average throughput from metrics
-        avg_throughput = db.query(
-            func.avg(Metric.throughput).label('avg_throughput')
-        ).filter(
-            Metric.timestamp >= one_day_ago
-        ).scalar() or 0
+        # Counts and the average come back as one row: each is a scalar subquery
+        # of a single SELECT, so they cost one round trip instead of four
+        summary_stmt = select(
+            select(func.count()).select_from(Slice).where(
+                Slice.status == "active"
+            ).scalar_subquery().label('active_slices'),
+            select(func.count()).select_from(Device).where(
+                Device.status == "connected"
+            ).scalar_subquery().label('connected_devices'),
+            select(func.count()).select_from(Alert).where(
+                Alert.resolved == False
+            ).scalar_subquery().label('active_alerts'),
+            select(func.avg(Metric.throughput)).where(
+                *metric_window
+            ).scalar_subquery().label('avg_throughput')
+        )
         
         # Get recent metrics for the chart (last 24 hours, grouped by hour)
-        metrics = db.query(
-            func.date_trunc('hour', Metric.timestamp).label('hour'),
-            func.avg(Metric.throughput).label('avg_throughput'),
-            func.avg(Metric.latency).label('avg_latency'),
-            func.avg(Metric.packet_loss).label('avg_packet_loss')
-        ).filter(
-            Metric.timestamp >= one_day_ago
-        ).group_by(
-            'hour'
-        ).order_by('hour').all()
+        if settings.TIMESCALEDB_ENABLED:
+            # Read ~24 precomputed rows per slice; weight the per-slice hourly
+            # averages by their sample counts to get the all-slice average
+            metrics_stmt = select(
+                metric_hourly.c.hour,
+                _weighted_avg(metric_hourly.c.avg_throughput).label('avg_throughput'),
+                _weighted_avg(metric_hourly.c.avg_latency).label('avg_latency'),
+                _weighted_avg(metric_hourly.c.avg_packet_loss).label('avg_packet_loss')
+            ).where(
+                metric_hourly.c.hour >= bucket_cutoff
+            ).group_by(
+                metric_hourly.c.hour
+            ).order_by(metric_hourly.c.hour)
+        else:
+            metrics_stmt = select(
+                _hour(Metric.timestamp).label('hour'),
+                func.avg(Metric.throughput).label('avg_throughput'),
+                func.avg(Metric.latency).label('avg_latency'),
+                func.avg(Metric.packet_loss).label('avg_packet_loss')
+            ).where(
+                *metric_window
+            ).group_by(
+                'hour'
+            ).order_by('hour')
         
         # Get slice distribution
-        slice_distribution = db.query(
+        slice_distribution_stmt = select(
             Slice.name,
             func.count(Device.id).label('device_count')
         ).join(
             Device, Device.slice_id == Slice.id
         ).group_by(
             Slice.name
-        ).all()
+        )
         
         # Get recent activity
-        recent_activity = db.query(Alert).order_by(
+        recent_activity_stmt = select(Alert).order_by(
             Alert.timestamp.desc()
-        ).limit(10).all()
+        ).limit(10)
+        
+        # The queries are independent; wall time is the slowest one, not the sum
+        (
+            summary_rows,
+            metrics,
+            slice_distribution,
+            recent_activity_rows
+        ) = await asyncio.gather(
+            _fetch_all(summary_stmt),
+            _fetch_all(metrics_stmt),
+            _fetch_all(slice_distribution_stmt),
+            _fetch_all(recent_activity_stmt)
+        )
+        summary = summary_rows[0]
+        active_slices = summary.active_slices
+        connected_devices = summary.connected_devices
+        active_alerts = summary.active_alerts
+        avg_throughput = summary.avg_throughput or 0
+        recent_activity = [row[0] for row in recent_activity_rows]
         
         # Format the response
         return {
@@ -92,10 +159,10 @@ async def get_dashboard_stats(
             "recent_activity": [{
                 "id": a.id,
                 "timestamp": a.timestamp.isoformat(),
-                "severity": a.severity,
+                "severity": a.level,
                 "message": a.message,
-                "status": a.status,
-                "slice_id": a.slice_id
+                "status": "resolved" if a.resolved else "active",
+                "slice_id": a.entity_id if a.entity_type == "slice" else None
             } for a in recent_activity]
         }
         
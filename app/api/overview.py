@@ -0,0 +1,63 @@
+"""
+Read-only dashboard feed for the 5G Slice Manager.
+
+Serves the /api/slices, /api/kpis and /api/activity endpoints the dashboard
+shell polls. Both entrypoints (main.py and app.main) include this router
+before mounting the Flask dashboard, which otherwise matches every path.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import orjson
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+
+from app.core.cache import conditional_json_response, etag_for
+from app.dashboard.app import (
+    CACHE_TTL,
+    get_activity_from_db,
+    get_kpis_from_db,
+    get_slices_from_db,
+)
+
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
+
+# Serialized bodies of the read-only dashboard endpoints: key -> (expires_at, body, etag)
+_json_cache: Dict[str, Tuple[float, bytes, str]] = {}
+
+async def cached_json(request: Request, key: str, producer: Callable[[], Awaitable[Any]]) -> Response:
+    """Serve producer()'s payload as JSON, reusing the encoded bytes for CACHE_TTL seconds.
+    
+    The ETag is hashed once per cached body; a poll whose copy is still current
+    gets a bodiless 304.
+    """
+    now = time.monotonic()
+    cached = _json_cache.get(key)
+    if cached and cached[0] > now:
+        _, body, etag = cached
+    else:
+        try:
+            body = orjson.dumps(await producer(), option=orjson.OPT_SERIALIZE_NUMPY)
+        except Exception as e:
+            return ORJSONResponse({"error": str(e)}, status_code=500)
+        etag = etag_for(body)
+        _json_cache[key] = (now + CACHE_TTL, body, etag)
+    return conditional_json_response(
+        request, body, etag=etag, cache_control=f"private, max-age={CACHE_TTL}"
+    )
+
+@router.get("/slices")
+async def get_slices(request: Request):
+    """API endpoint to get all slices."""
+    return await cached_json(request, "slices", get_slices_from_db)
+
+@router.get("/kpis")
+async def get_kpis(request: Request):
+    """API endpoint to get KPI summary."""
+    return await cached_json(request, "kpis", get_kpis_from_db)
+
+@router.get("/activity")
+async def get_activity(request: Request, limit: int = Query(10, ge=1, le=100)):
+    """API endpoint to get recent activity."""
+    return await cached_json(request, f"activity:{limit}", lambda: get_activity_from_db(limit))
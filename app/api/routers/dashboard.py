@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from sqlalchemy import select, func, desc, tuple_
+from sqlalchemy.orm import aliased
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, AsyncIterator
 import json
 
-from app.db.database import get_db
-from app.db.models import Slice, Metric, SliceKPI, Alert
+import orjson
+
+from app.core.cache import conditional_json_response, response_cache
+from app.core.config import settings
+from app.db.database import get_db, async_session_factory, async_engine
+from app.db.models import Slice, Metric, SliceKPI, Alert, metric_hourly, metric_hour_bucket
 from app.schemas.dashboard import (
     SliceMetricsResponse,
     KPIResponse,
@@ -16,50 +22,92 @@ from app.schemas.dashboard import (
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Rows fetched from the cursor and serialized per chunk of a streamed response
+HISTORY_STREAM_BATCH = 500
+
+# How far back each selectable time range reaches
+_RANGE_DELTAS = {
+    TimeRange.last_hour: timedelta(hours=1),
+    TimeRange.last_6_hours: timedelta(hours=6),
+    TimeRange.last_24_hours: timedelta(days=1),
+}
+
+def _start_time(time_range: TimeRange) -> datetime:
+    """Start of the window covered by time_range, in naive UTC."""
+    return datetime.utcnow() - _RANGE_DELTAS[time_range]
+
+# Latest metric per slice for the asyncpg fast path; same ranking as the ORM query.
+# asyncpg prepares it on first use and keeps it in each connection's statement cache.
+LATEST_SLICE_METRICS_SQL = """
+    SELECT slice_id, slice_name, throughput, latency, packet_loss, timestamp
+    FROM (
+        SELECT m.slice_id, s.name AS slice_name, m.throughput, m.latency,
+               m.packet_loss, m.timestamp,
+               row_number() OVER (PARTITION BY m.slice_id ORDER BY m.timestamp DESC) AS rn
+        FROM metrics m
+        JOIN slices s ON s.id = m.slice_id
+        WHERE m.timestamp >= $1
+    ) latest
+    WHERE rn = 1
+"""
+
 @router.get("/slices/metrics", response_model=List[SliceMetricsResponse])
 async def get_slice_metrics(
-    time_range: TimeRange = TimeRange.last_hour,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    time_range: TimeRange = TimeRange.last_hour
 ):
     """
     Get metrics for all slices within the specified time range.
     """
-    # Calculate time filter based on the selected range
-    now = datetime.utcnow()
-    if time_range == TimeRange.last_hour:
-        start_time = now - timedelta(hours=1)
-    elif time_range == TimeRange.last_6_hours:
-        start_time = now - timedelta(hours=6)
-    else:  # last_24_hours
-        start_time = now - timedelta(days=1)
-
-    # Get latest metrics for each slice
-    subq = (
+    pg_pool = getattr(request.app.state, "pg_pool", None)
+    body = await response_cache.get_or_set_swr(
+        f"dashboard:slices:metrics:{time_range.value}",
+        lambda: _load_slice_metrics(pg_pool, time_range)
+    )
+    return Response(body, media_type="application/json")
+
+async def _load_slice_metrics(pg_pool, time_range: TimeRange) -> List[Any]:
+    """Latest metric per slice; runs on its own connection so it can refresh in the background."""
+    start_time = _start_time(time_range)
+
+    # On PostgreSQL, read straight from asyncpg and serialize the records as-is,
+    # skipping ORM row and response-model construction
+    if pg_pool is not None:
+        async with pg_pool.acquire() as conn:
+            rows = await conn.fetch(LATEST_SLICE_METRICS_SQL, start_time.replace(tzinfo=timezone.utc))
+        return [dict(row) for row in rows]
+
+    # Get latest metrics for each slice: rank each slice's rows newest-first in a
+    # single pass instead of aggregating max(timestamp) and joining back
+    ranked = (
         select(
-            Metric.slice_id,
-            func.max(Metric.timestamp).label("max_timestamp")
+            Metric,
+            func.row_number().over(
+                partition_by=Metric.slice_id,
+                order_by=Metric.timestamp.desc()
+            ).label("rn")
         )
         .where(Metric.timestamp >= start_time)
-        .group_by(Metric.slice_id)
         .subquery()
     )
+    latest = aliased(Metric, ranked)
 
     query = (
         select(
             Slice.id,
             Slice.name,
-            Metric.throughput,
-            Metric.latency,
-            Metric.packet_loss,
-            Metric.timestamp
+            latest.throughput,
+            latest.latency,
+            latest.packet_loss,
+            latest.timestamp
         )
-        .join(subq, (Metric.slice_id == subq.c.slice_id) & 
-                     (Metric.timestamp == subq.c.max_timestamp))
-        .join(Slice, Slice.id == Metric.slice_id)
+        .join(Slice, Slice.id == latest.slice_id)
+        .where(ranked.c.rn == 1)
     )
 
-    result = await db.execute(query)
-    metrics = result.all()
+    async with async_session_factory() as db:
+        result = await db.execute(query)
+        metrics = result.all()
 
     return [
         SliceMetricsResponse(
@@ -75,44 +123,47 @@ async def get_slice_metrics(
 
 @router.get("/kpis", response_model=List[KPIResponse])
 async def get_kpis(
-    time_range: TimeRange = TimeRange.last_hour,
-    db: AsyncSession = Depends(get_db)
+    time_range: TimeRange = TimeRange.last_hour
 ):
     """
     Get KPIs for all slices within the specified time range.
     """
-    # Calculate time filter based on the selected range
-    now = datetime.utcnow()
-    if time_range == TimeRange.last_hour:
-        start_time = now - timedelta(hours=1)
-    elif time_range == TimeRange.last_6_hours:
-        start_time = now - timedelta(hours=6)
-    else:  # last_24_hours
-        start_time = now - timedelta(days=1)
-
-    # Get latest KPIs for each slice
-    subq = (
+    body = await response_cache.get_or_set_swr(
+        f"dashboard:kpis:{time_range.value}",
+        lambda: _load_kpis(time_range)
+    )
+    return Response(body, media_type="application/json")
+
+async def _load_kpis(time_range: TimeRange) -> List[KPIResponse]:
+    """Latest KPI per slice; runs on its own session so it can refresh in the background."""
+    start_time = _start_time(time_range)
+
+    # Get latest KPIs for each slice, ranked in a single pass as above
+    ranked = (
         select(
-            SliceKPI.slice_id,
-            func.max(SliceKPI.timestamp).label("max_timestamp")
+            SliceKPI,
+            func.row_number().over(
+                partition_by=SliceKPI.slice_id,
+                order_by=SliceKPI.timestamp.desc()
+            ).label("rn")
         )
         .where(SliceKPI.timestamp >= start_time)
-        .group_by(SliceKPI.slice_id)
         .subquery()
     )
+    latest = aliased(SliceKPI, ranked, name="SliceKPI")
 
     query = (
         select(
-            SliceKPI,
+            latest,
             Slice.name.label("slice_name")
         )
-        .join(subq, (SliceKPI.slice_id == subq.c.slice_id) & 
-                     (SliceKPI.timestamp == subq.c.max_timestamp))
-        .join(Slice, Slice.id == SliceKPI.slice_id)
+        .join(Slice, Slice.id == latest.slice_id)
+        .where(ranked.c.rn == 1)
     )
 
-    result = await db.execute(query)
-    kpis = result.all()
+    async with async_session_factory() as db:
+        result = await db.execute(query)
+        kpis = result.all()
 
     return [
         KPIResponse(
@@ -130,23 +181,46 @@ async def get_kpis(
 
 @router.get("/alerts", response_model=List[AlertResponse])
 async def get_active_alerts(
+    request: Request,
     limit: int = 10,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get active alerts.
+    Get active alerts, newest first.
+    
+    Pass the ``timestamp`` and ``id`` of the last alert received as ``before``
+    and ``before_id`` to fetch the next page; unlike OFFSET this costs the same
+    however deep the page is. The id breaks ties between alerts raised at the
+    same timestamp, so none are skipped at a page boundary.
     """
+    # Ordered like ix_alerts_active_timestamp, so pages are read in index order
     query = (
-        select(Alert)
+        select(
+            Alert.id,
+            Alert.level,
+            Alert.message,
+            Alert.entity_type,
+            Alert.entity_id,
+            Alert.timestamp,
+            Alert.context
+        )
         .where(Alert.resolved == False)
-        .order_by(desc(Alert.timestamp))
+        .order_by(desc(Alert.timestamp), desc(Alert.id))
         .limit(limit)
     )
+    if before is not None:
+        if before_id is not None:
+            query = query.where(tuple_(Alert.timestamp, Alert.id) < tuple_(before, before_id))
+        else:
+            query = query.where(Alert.timestamp < before)
     
     result = await db.execute(query)
-    alerts = result.scalars().all()
+    alerts = result.all()
 
-    return [
+    # Polled by the dashboard: an unchanged page is answered with a 304
+    body = orjson.dumps([
         AlertResponse(
             id=alert.id,
             level=alert.level,
@@ -155,48 +229,75 @@ async def get_active_alerts(
             entity_id=alert.entity_id,
             timestamp=alert.timestamp,
             context=alert.context
-        )
+        ).model_dump()
         for alert in alerts
-    ]
+    ])
+    return conditional_json_response(request, body)
 
 @router.get("/slices/{slice_id}/history", response_model=List[Dict[str, Any]])
 async def get_slice_history(
     slice_id: str,
-    time_range: TimeRange = TimeRange.last_hour,
-    db: AsyncSession = Depends(get_db)
+    time_range: TimeRange = TimeRange.last_hour
 ):
     """
     Get historical metrics for a specific slice.
+    
+    Raw history can run to many thousands of rows, so it is streamed from a
+    server-side cursor rather than built up as one list.
     """
-    # Calculate time filter based on the selected range
-    now = datetime.utcnow()
-    if time_range == TimeRange.last_hour:
-        start_time = now - timedelta(hours=1)
-    elif time_range == TimeRange.last_6_hours:
-        start_time = now - timedelta(hours=6)
-    else:  # last_24_hours
-        start_time = now - timedelta(days=1)
+    start_time = _start_time(time_range)
 
-    query = (
-        select(
-            Metric.timestamp,
-            Metric.throughput,
-            Metric.latency,
-            Metric.packet_loss
+    if settings.TIMESCALEDB_ENABLED and time_range == TimeRange.last_24_hours:
+        # A day of raw samples only gets plotted hourly; read the rollup instead
+        query = (
+            select(
+                metric_hourly.c.hour.label("timestamp"),
+                metric_hourly.c.avg_throughput.label("throughput"),
+                metric_hourly.c.avg_latency.label("latency"),
+                metric_hourly.c.avg_packet_loss.label("packet_loss")
+            )
+            .where(
+                (metric_hourly.c.slice_id == slice_id) &
+                (metric_hourly.c.hour >= start_time.replace(minute=0, second=0, microsecond=0))
+            )
+            .order_by(metric_hourly.c.hour)
         )
-        .where(
-            (Metric.slice_id == slice_id) &
-            (Metric.timestamp >= start_time)
+    else:
+        query = (
+            select(
+                Metric.timestamp,
+                Metric.throughput,
+                Metric.latency,
+                Metric.packet_loss
+            )
+            .where(
+                (Metric.slice_id == slice_id) &
+                (Metric.timestamp >= start_time)
+            )
+            .order_by(Metric.timestamp)
         )
-        .order_by(Metric.timestamp)
-    )
+        if async_engine.dialect.name == "postgresql":
+            # Redundant with the timestamp filter, but lets the planner prune by bucket
+            query = query.where(metric_hour_bucket >= start_time.replace(minute=0, second=0, microsecond=0))
 
-    result = await db.execute(query)
-    metrics = result.all()
-
-    return [{
-        "timestamp": row.timestamp.isoformat(),
-        "throughput": row.throughput,
-        "latency": row.latency,
-        "packet_loss": row.packet_loss
-    } for row in metrics]
+    return StreamingResponse(_stream_history(query), media_type="application/json")
+
+async def _stream_history(query) -> AsyncIterator[bytes]:
+    """Serialize history rows into a JSON array one cursor batch at a time."""
+    # The session is opened here, not injected: the body is sent after the
+    # handler (and its dependencies) have returned
+    opener = b"["
+    async with async_session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=HISTORY_STREAM_BATCH))
+        async for rows in result.partitions():
+            yield opener + b",".join(
+                orjson.dumps({
+                    "timestamp": row.timestamp.isoformat(),
+                    "throughput": row.throughput,
+                    "latency": row.latency,
+                    "packet_loss": row.packet_loss
+                })
+                for row in rows
+            )
+            opener = b","
+    yield b"[]" if opener == b"[" else b"]"
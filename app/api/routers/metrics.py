@@ -8,14 +8,18 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Dedicated generator so mock series don't contend on the shared module-level one
+_rng = random.Random()
+
 def generate_metric_data():
     """Generate mock metric data"""
     now = datetime.utcnow()
     timestamps = [now - timedelta(minutes=i) for i in range(60)][::-1]
+    uniform = _rng.uniform
     return [
         {
             "timestamp": ts.isoformat(),
-            "value": random.uniform(0, 100),
+            "value": uniform(0, 100),
             "unit": "%"
         }
         for ts in timestamps
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from app.db.database import get_db
 from app.db.models import User, UserInDB, UserCreate, UserBase, UserUpdate
 from app.api.deps import get_current_active_user, get_current_active_superuser
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password
 
 router = APIRouter(
     prefix="/users",
@@ -26,27 +29,35 @@ async def create_user(
     
     Only superusers can create new users.
     """
-    db_user = await User.get_user_async(db, username=user_in.username)
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="The username is already registered"
-        )
+    user_dict = user_in.model_dump(exclude={"password"})
+    user_dict["hashed_password"] = await get_password_hash_async(user_in.password)
+    
+    # A single atomic statement: the unique username/email indexes decide
+    # duplicates, so there's no check-then-insert race, and RETURNING hands
+    # back the server defaults without a refresh
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    db_user = (await db.scalars(
+        insert(User)
+        .values(**user_dict)
+        .on_conflict_do_nothing()
+        .returning(User)
+    )).one_or_none()
     
-    db_user = await User.get_by_email(db, email=user_in.email)
-    if db_user:
+    if db_user is None:
+        await db.rollback()
+        # Only the failure path pays for finding out which field clashed
+        existing = (await db.execute(
+            select(User.username)
+            .where(or_(User.username == user_in.username, User.email == user_in.email))
+            .limit(1)
+        )).first()
+        field = "username" if existing and existing.username == user_in.username else "email"
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="The email is already registered"
+            detail=f"The {field} is already registered"
         )
     
-    user_dict = user_in.model_dump(exclude={"password"})
-    user_dict["hashed_password"] = get_password_hash(user_in.password)
-    db_user = User(**user_dict)
-    
-    db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 @router.get("/me", response_model=UserInDB)
@@ -1,17 +1,22 @@
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 router = APIRouter()
 
-@router.get("/")
+# Constant bodies, serialized once instead of on every request
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to the 5G Slicing API",
+    "status": "operational",
+    "version": "1.0.0"
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+@router.get("/", response_class=Response)
 async def root():
-    return {
-        "message": "Welcome to the 5G Slicing API",
-        "status": "operational",
-        "version": "1.0.0"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
-@router.get("/health")
+@router.get("/health", response_class=Response)
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
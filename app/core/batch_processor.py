@@ -6,28 +6,71 @@ with configurable batch sizes and timeouts.
 """
 
 import asyncio
+import logging
+import random
+import sys
 import time
 from collections import deque
-from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable, Deque, List, Optional, TypeVar, Union
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _atimeout
+else:
+    from async_timeout import timeout as _atimeout
+
 from app.core.config import settings
-from app.core.error_handling import async_retry, sync_retry
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
-@dataclass
 class BatchResult:
-    """Result of processing a batch of items."""
+    """Result of processing a batch of items.
+
+    One is produced per batch, so instances are slotted, recycled through a
+    small pool (``acquire``/``release``), and only allocate ``errors`` and
+    ``metadata`` when a batch fails.
+    """
+
+    __slots__ = ("success", "processed_count", "failed_count", "processing_time", "errors", "metadata")
+
+    _pool: Deque["BatchResult"] = deque(maxlen=32)
+
+    def __init__(
+        self,
+        success: bool,
+        processed_count: int = 0,
+        failed_count: int = 0,
+        processing_time: float = 0.0,
+        errors: Optional[List[Exception]] = None,
+        metadata: Optional[dict] = None,
+    ):
+        self.success = success
+        self.processed_count = processed_count
+        self.failed_count = failed_count
+        self.processing_time = processing_time
+        self.errors = errors
+        self.metadata = metadata
+
+    @classmethod
+    def acquire(cls) -> "BatchResult":
+        """Get a reset, successful result from the pool, or a new one."""
+        if not cls._pool:
+            return cls(success=True)
+        result = cls._pool.pop()
+        result.success = True
+        result.processed_count = result.failed_count = 0
+        result.processing_time = 0.0
+        result.errors = result.metadata = None
+        return result
 
-    success: bool
-    processed_count: int = 0
-    failed_count: int = 0
-    errors: List[Exception] = field(default_factory=list)
-    metadata: dict = field(default_factory=dict)
+    @classmethod
+    def release(cls, result: "BatchResult") -> None:
+        """Return a result to the pool once nothing refers to it any more."""
+        cls._pool.append(result)
 
 
 class BatchProcessor:
@@ -44,7 +87,9 @@ class BatchProcessor:
         """Initialize the batch processor.
 
         Args:
-            process_batch: Function to process a batch of items
+            process_batch: Function to process a batch of items. The list it
+                receives is reused for a later batch once it returns, so it must
+                copy the list if it keeps it.
             batch_size: Maximum number of items in a batch
             max_wait_seconds: Maximum seconds to wait before processing a partial batch
             retry_attempts: Number of retry attempts for failed batches
@@ -56,11 +101,20 @@ class BatchProcessor:
         self.retry_attempts = retry_attempts or settings.MAX_RETRY_ATTEMPTS
         self.retry_delay = retry_delay or settings.RETRY_BACKOFF_FACTOR
 
+        # Adaptive batch sizing around the configured size
+        self.min_batch_size = settings.STREAM_BATCH_MIN_SIZE or max(1, self.batch_size // 4)
+        self.max_batch_size = settings.STREAM_BATCH_MAX_SIZE or self.batch_size * 4
+        self.target_seconds_per_item = settings.STREAM_BATCH_TARGET_MS_PER_ITEM / 1000
+        self._ewma_seconds_per_item: Optional[float] = None
+
         self._queue: Deque[T] = deque()
         self._last_processed = time.monotonic()
         self._shutdown = False
-        self._lock = asyncio.Lock()
-        self._not_empty = asyncio.Condition(self._lock)
+        # Single consumer on one event loop: the deque needs no lock, and one
+        # event is set only when the consumer may have something to do
+        self._wake = asyncio.Event()
+        # Batch lists handed back after processing, reused instead of reallocated
+        self._batch_pool: Deque[List[T]] = deque(maxlen=4)
         self._background_task: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
@@ -73,8 +127,7 @@ class BatchProcessor:
         """Stop the background processing task and process any remaining items."""
         if self._background_task:
             self._shutdown = True
-            async with self._lock:
-                self._not_empty.notify_all()
+            self._wake.set()
             await self._background_task
             self._background_task = None
 
@@ -84,101 +137,186 @@ class BatchProcessor:
         Args:
             item: The item to add to the queue
         """
-        async with self._lock:
-            self._queue.append(item)
-            if len(self._queue) >= self.batch_size:
-                self._not_empty.notify()
+        queue = self._queue
+        size = len(queue) + 1
+        queue.append(item)
+        # Wake the consumer only on the edges it waits for: the queue becoming
+        # non-empty and a batch filling up. Appends past a full batch don't
+        # wake it again; it drains the backlog without waiting.
+        if size == 1 or size == self.batch_size:
+            self._wake.set()
 
     async def _get_batch(self) -> List[T]:
         """Get a batch of items to process."""
-        async with self._lock:
-            # Wait until we have at least one item or the shutdown flag is set
-            while not self._queue and not self._shutdown:
-                await self._not_empty.wait()
-
-            if self._shutdown and not self._queue:
-                return []
-
-            # Get up to batch_size items
-            batch_size = min(len(self._queue), self.batch_size)
-            batch = [self._queue.popleft() for _ in range(batch_size)]
-            return batch
+        queue = self._queue
+        # Wait until we have at least one item or the shutdown flag is set
+        while not queue and not self._shutdown:
+            self._wake.clear()
+            await self._wake.wait()
+
+        # Give a partial batch up to max_wait_seconds to fill
+        if len(queue) < self.batch_size and not self._shutdown:
+            self._wake.clear()
+            # A timeout context cancels the wait in place; wait_for would wrap
+            # it in a new task on every batch
+            try:
+                async with _atimeout(self.max_wait_seconds):
+                    await self._wake.wait()
+            except asyncio.TimeoutError:
+                pass
+
+        if self._shutdown and not queue:
+            return []
+
+        # Get up to batch_size items. Usually that is the whole queue, which is
+        # copied out and cleared in C; only a backlog is popped one by one.
+        batch = self._batch_pool.pop() if self._batch_pool else []
+        if len(queue) <= self.batch_size:
+            batch.extend(queue)
+            queue.clear()
+        else:
+            popleft = queue.popleft
+            batch.extend(popleft() for _ in range(self.batch_size))
+        return batch
 
-    @async_retry(max_retries=3)
     async def _process_batch(self, batch: List[T]) -> BatchResult:
-        """Process a batch of items.
+        """Process a batch of items, retrying failures.
+
+        A failed attempt is retried up to ``retry_attempts`` times after a
+        random delay between 0 and ``retry_delay * 2**attempt`` seconds (capped
+        at settings.RETRY_MAX_DELAY). The full jitter keeps processors that
+        failed together, e.g. on a DB deadlock, from retrying in lockstep.
 
         Args:
             batch: The batch of items to process
 
         Returns:
-            BatchResult with the result of processing the batch
+            BatchResult with the result of processing the batch; unsuccessful
+            if every attempt failed
         """
+        result = BatchResult.acquire()
         if not batch:
-            return BatchResult(success=True)
-
-        start_time = time.monotonic()
-        result = BatchResult(success=True)
+            return result
 
-        try:
-            # Call the process_batch function with the batch
-            if asyncio.iscoroutinefunction(self.process_batch):
-                await self.process_batch(batch)
-            else:
-                self.process_batch(batch)
+        is_async = asyncio.iscoroutinefunction(self.process_batch)
+        attempt = 0
+        while True:
+            start_time = time.monotonic()
+            try:
+                # Call the process_batch function with the batch
+                if is_async:
+                    await self.process_batch(batch)
+                else:
+                    self.process_batch(batch)
+            except Exception as e:
+                if attempt >= self.retry_attempts:
+                    result.success = False
+                    result.failed_count = len(batch)
+                    result.errors = [e]
+                    result.metadata = {"error": str(e), "attempts": attempt + 1}
+                    result.processing_time = time.monotonic() - start_time
+                    return result
+
+                cap = min(settings.RETRY_MAX_DELAY, self.retry_delay * 2 ** attempt)
+                delay = random.uniform(0, cap)
+                attempt += 1
+                logger.warning(
+                    f"Batch attempt {attempt}/{self.retry_attempts + 1} failed: {e}. "
+                    f"Retrying in {delay:.2f}s..."
+                )
+                await asyncio.sleep(delay)
+                continue
 
             result.processed_count = len(batch)
-            result.metadata["processing_time"] = time.monotonic() - start_time
+            result.processing_time = time.monotonic() - start_time
+            self._adapt_batch_size(len(batch), result.processing_time)
+            return result
 
-        except Exception as e:
-            result.success = False
-            result.failed_count = len(batch)
-            result.errors.append(e)
-            result.metadata["error"] = str(e)
-            result.metadata["processing_time"] = time.monotonic() - start_time
-            raise  # Will be caught by the retry decorator
+    def _adapt_batch_size(self, count: int, elapsed: float, alpha: float = 0.2) -> None:
+        """Steer batch_size by the smoothed processing time per item.
 
-        return result
+        Bulk sinks such as DB inserts cost less per item in bigger batches, so
+        the batch grows by 25% while the per-item time stays under target and
+        shrinks by 20% once it goes over, within the configured bounds.
+
+        Args:
+            count: Number of items in the processed batch
+            elapsed: Seconds it took to process the batch
+            alpha: Weight of the latest sample in the moving average
+        """
+        per_item = elapsed / count
+        ewma = self._ewma_seconds_per_item
+        ewma = per_item if ewma is None else alpha * per_item + (1 - alpha) * ewma
+        self._ewma_seconds_per_item = ewma
+
+        if ewma < self.target_seconds_per_item:
+            self.batch_size = min(self.max_batch_size, max(self.batch_size + 1, int(self.batch_size * 1.25)))
+        else:
+            self.batch_size = max(self.min_batch_size, int(self.batch_size * 0.8))
 
     async def _process_batches(self) -> None:
-        """Process batches of items in a loop."""
-        while not self._shutdown:
-            try:
-                # Wait for a batch to be ready
-                batch = await self._get_batch()
-                if not batch and self._shutdown:
-                    break
-
-                # Process the batch with retry logic
-                result = await self._process_batch(batch)
-
-                # Log the result
-                if result.success:
-                    logger.info(
-                        "Successfully processed batch",
-                        extra={
-                            "batch_size": len(batch),
-                            "processing_time": result.metadata.get("processing_time", 0),
-                        },
-                    )
-                else:
-                    logger.error(
-                        "Failed to process batch",
-                        extra={
-                            "batch_size": len(batch),
-                            "error": result.metadata.get("error", "Unknown error"),
-                            "processing_time": result.metadata.get("processing_time", 0),
-                        },
-                    )
-
-            except asyncio.CancelledError:
-                # Handle cancellation
-                logger.info("Batch processing task was cancelled")
-                raise
-            except Exception as e:
-                logger.error("Error in batch processing loop", exc_info=True)
-                # Add a small delay to prevent tight loops on repeated errors
-                await asyncio.sleep(1)
+        """Process batches of items in a loop.
+
+        The next batch is collected while the current one is processed, so an
+        I/O-bound ``process_batch`` doesn't leave items waiting for the batch
+        window to start. At most one batch is prefetched. After shutdown the
+        loop keeps going until the queue is drained.
+        """
+        next_batch = asyncio.create_task(self._get_batch())
+        try:
+            while True:
+                try:
+                    # Wait for a batch to be ready
+                    batch = await next_batch
+                    if not batch:
+                        if self._shutdown:
+                            break
+                        next_batch = asyncio.create_task(self._get_batch())
+                        continue
+
+                    # Start collecting the next batch before processing this one
+                    next_batch = asyncio.create_task(self._get_batch())
+
+                    # Process the batch with retry logic
+                    result = await self._process_batch(batch)
+
+                    # Log the result
+                    if result.success:
+                        logger.info(
+                            "Successfully processed batch",
+                            extra={
+                                "batch_size": len(batch),
+                                "processing_time": result.processing_time,
+                            },
+                        )
+                    else:
+                        logger.error(
+                            "Failed to process batch",
+                            extra={
+                                "batch_size": len(batch),
+                                "error": (result.metadata or {}).get("error", "Unknown error"),
+                                "processing_time": result.processing_time,
+                            },
+                        )
+                    BatchResult.release(result)
+
+                    # Processing is done with the list; keep it for a later batch
+                    batch.clear()
+                    self._batch_pool.append(batch)
+
+                except asyncio.CancelledError:
+                    # Handle cancellation
+                    logger.info("Batch processing task was cancelled")
+                    raise
+                except Exception as e:
+                    logger.error("Error in batch processing loop", exc_info=True)
+                    if next_batch.done():
+                        next_batch = asyncio.create_task(self._get_batch())
+                    # Add a small delay to prevent tight loops on repeated errors
+                    await asyncio.sleep(1)
+        finally:
+            if not next_batch.done():
+                next_batch.cancel()
 
     async def __aenter__(self):
         await self.start()
@@ -190,10 +328,7 @@ class BatchProcessor:
 
 # Example usage:
 if __name__ == "__main__":
-    import logging
-
     logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
 
     async def example_processor(batch):
         print(f"Processing batch of {len(batch)} items")
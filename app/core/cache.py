@@ -0,0 +1,202 @@
+"""
+Response caching for the 5G Slice Manager.
+
+This module provides an in-process stale-while-revalidate cache for the
+read-heavy dashboard endpoints. Payloads are stored already serialized, so a
+hit is a dict lookup plus sending the bytes.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """Serialize Pydantic models that orjson does not handle natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def etag_for(body: bytes) -> str:
+    """Weak ETag for a serialized JSON body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    cache_control: str = "private, max-age=2",
+) -> Response:
+    """Send ``body`` as JSON, or a bodiless 304 if the client's copy is current.
+
+    Args:
+        request: Incoming request, checked for ``If-None-Match``
+        body: Serialized JSON body
+        etag: Precomputed ETag of ``body``; computed here when omitted
+        cache_control: Value of the ``Cache-Control`` header
+
+    Returns:
+        A 200 JSON response or a 304 Not Modified
+    """
+    etag = etag or etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@dataclass
+class _Entry:
+    """A cached body and the monotonic times it stops being fresh and usable."""
+    body: bytes
+    fresh_until: float
+    stale_until: float
+
+
+class SWRCache:
+    """Stale-while-revalidate cache of serialized JSON bodies.
+
+    Within ``ttl`` an entry is served as-is. Between ``ttl`` and ``stale_ttl`` it
+    is still served immediately, while one background task recomputes it. Past
+    ``stale_ttl``, or on a miss, callers wait for the recompute. Concurrent
+    callers for the same key share a single recompute, so an expiry never turns
+    into a stampede of identical queries.
+
+    ``invalidate`` bumps a per-key generation; a recompute that started before
+    the bump returns its result to the callers already waiting on it but does
+    not store it, so no later caller is served data read before the write.
+    """
+
+    def __init__(self, ttl: float = 5.0, stale_ttl: float = 30.0):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served without triggering a refresh
+            stale_ttl: Seconds an entry may be served at all
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._generations: Dict[str, int] = {}
+        # invalidate() is also called from the WSGI threads of the mounted Flask app
+        self._lock = threading.Lock()
+
+    async def get_or_set_swr(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> bytes:
+        """Get the serialized body for ``key``, computing it with ``factory`` as needed.
+
+        The factory may run after the request that scheduled it has finished, so
+        it must not capture request-scoped resources such as a DB session.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function returning the payload to serialize
+            ttl: Override for the fresh period of this entry
+            stale_ttl: Override for the usable period of this entry
+
+        Returns:
+            The payload serialized as JSON bytes
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.stale_until:
+            if now >= entry.fresh_until and key not in self._inflight:
+                self._schedule(key, factory, ttl, stale_ttl)
+            return entry.body
+
+        task = self._inflight.get(key) or self._schedule(key, factory, ttl, stale_ttl)
+        # Shielded so a cancelled request doesn't cancel the shared recompute
+        return await asyncio.shield(task)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose key starts with ``prefix`` (all entries by default).
+
+        Recomputes already in flight for those keys are detached: their result
+        is not stored, and the next caller starts a fresh one.
+        """
+        with self._lock:
+            keys = [k for k in (*self._entries, *self._inflight) if k.startswith(prefix)]
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                self._entries.pop(key, None)
+                self._inflight.pop(key, None)
+
+    def _schedule(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        stale_ttl: Optional[float],
+    ) -> asyncio.Task:
+        with self._lock:
+            generation = self._generations.get(key, 0)
+            task = asyncio.create_task(
+                self._recompute_and_store(key, generation, factory, ttl, stale_ttl)
+            )
+            self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        # An invalidation may already have replaced this task with a newer one
+        with self._lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Waiting callers see the exception; this covers background refreshes
+            logger.warning(f"Refreshing cache entry {key!r} failed: {task.exception()}")
+
+    async def _recompute_and_store(
+        self,
+        key: str,
+        generation: int,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        stale_ttl: Optional[float],
+    ) -> bytes:
+        body = orjson.dumps(
+            await factory(),
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
+        now = time.monotonic()
+        with self._lock:
+            # Read before an invalidation: hand it to the callers already
+            # waiting, but don't let it outlive the write
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = _Entry(
+                    body=body,
+                    fresh_until=now + (self.ttl if ttl is None else ttl),
+                    stale_until=now + (self.stale_ttl if stale_ttl is None else stale_ttl),
+                )
+        return body
+
+
+# Shared cache for the dashboard API
+response_cache = SWRCache(
+    ttl=settings.CACHE_TTL_SECONDS,
+    stale_ttl=settings.CACHE_STALE_TTL_SECONDS,
+)
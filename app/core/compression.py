@@ -5,16 +5,49 @@ This module provides functions for compressing and decompressing data
 using various algorithms to optimize network transfer and storage.
 """
 
+import asyncio
+import functools
 import gzip
 import lzma
+import os
+import threading
 import zlib
-import json
+from concurrent.futures import ThreadPoolExecutor
 import pickle
 from enum import Enum, auto
-from typing import Any, Dict, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Union, Tuple
+
+import orjson
 
 from app.core.config import settings
 
+# ISA-L is gzip/zlib-compatible and considerably faster; use it when installed
+try:
+    from isal import igzip, isal_zlib
+    _HAS_ISAL = True
+except ImportError:
+    _HAS_ISAL = False
+
+try:
+    import zstandard as zstd
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
+
+# zlib, lzma, ISA-L and zstd release the GIL while compressing, so large
+# payloads compress in parallel here instead of blocking the event loop
+_compress_pool = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="compress"
+)
+
+# Anything Compressor.compress accepts; bytes-like input is used without copying
+CompressInput = Union[str, bytes, bytearray, memoryview, Dict[str, Any]]
+
+
+def _isal_level(level: int) -> int:
+    """Map a zlib compression level (1-9) onto ISA-L's range (0-3)."""
+    return (level + 2) // 3
+
 
 class CompressionAlgorithm(Enum):
     """Supported compression algorithms."""
@@ -22,26 +55,146 @@ class CompressionAlgorithm(Enum):
     GZIP = auto()
     LZMA = auto()
     ZLIB = auto()
+    ZSTD = auto()
     
     @classmethod
     def from_string(cls, name: str) -> 'CompressionAlgorithm':
         """Get compression algorithm from string name."""
-        name = name.upper()
-        if name == 'NONE':
-            return cls.NONE
-        elif name == 'GZIP':
-            return cls.GZIP
-        elif name == 'LZMA':
-            return cls.LZMA
-        elif name == 'ZLIB':
-            return cls.ZLIB
-        else:
-            raise ValueError(f"Unsupported compression algorithm: {name}")
+        # Enum keeps a name -> member dict; look the name up there directly
+        try:
+            return cls.__members__[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unsupported compression algorithm: {name}") from None
+
+
+def _none_compress(data: bytes, level: int) -> bytes:
+    # bytes() is a no-op for bytes and copies only other buffer types
+    return bytes(data)
+
+
+def _none_decompress(data: bytes) -> bytes:
+    return data
+
+
+def _lzma_compress(data: bytes, level: int) -> bytes:
+    return lzma.compress(data, preset=level, format=lzma.FORMAT_XZ)
+
+
+def _lzma_compressobj(level: int, size: int) -> 'lzma.LZMACompressor':
+    return lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=level)
+
+
+if _HAS_ISAL:
+    def _gzip_compress(data: bytes, level: int) -> bytes:
+        return igzip.compress(data, compresslevel=_isal_level(level))
+
+    def _zlib_compress(data: bytes, level: int) -> bytes:
+        return isal_zlib.compress(data, level=_isal_level(level))
+
+    def _gzip_compressobj(level: int, size: int) -> Any:
+        # wbits=31 selects the gzip container
+        return isal_zlib.compressobj(_isal_level(level), zlib.DEFLATED, 31)
+
+    def _zlib_compressobj(level: int, size: int) -> Any:
+        return isal_zlib.compressobj(_isal_level(level))
+
+    _gzip_decompress = igzip.decompress
+    _zlib_decompress = isal_zlib.decompress
+else:
+    def _gzip_compress(data: bytes, level: int) -> bytes:
+        return gzip.compress(data, compresslevel=level)
+
+    def _zlib_compress(data: bytes, level: int) -> bytes:
+        return zlib.compress(data, level=level)
+
+    def _gzip_compressobj(level: int, size: int) -> Any:
+        # wbits=31 selects the gzip container
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def _zlib_compressobj(level: int, size: int) -> Any:
+        return zlib.compressobj(level)
+
+    _gzip_decompress = gzip.decompress
+    _zlib_decompress = zlib.decompress
+
+
+# zstd contexts are reusable but not safe for concurrent use, so each thread
+# keeps its own compressor per level and one decompressor
+_zstd_local = threading.local()
+
+
+@functools.lru_cache(maxsize=1)
+def _zstd_dict() -> Optional['zstd.ZstdCompressionDict']:
+    """The configured zstd dictionary, or None to compress without one."""
+    if not settings.COMPRESSION_ZSTD_DICT_PATH:
+        return None
+    with open(settings.COMPRESSION_ZSTD_DICT_PATH, 'rb') as f:
+        return zstd.ZstdCompressionDict(f.read())
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    compressors = getattr(_zstd_local, 'compressors', None)
+    if compressors is None:
+        compressors = _zstd_local.compressors = {}
+    cctx = compressors.get(level)
+    if cctx is None:
+        cctx = compressors[level] = zstd.ZstdCompressor(level=level, dict_data=_zstd_dict())
+    return cctx.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    dctx = getattr(_zstd_local, 'decompressor', None)
+    if dctx is None:
+        dctx = _zstd_local.decompressor = zstd.ZstdDecompressor(dict_data=_zstd_dict())
+    # Frames written by ZstdCompressor.compress carry their content size
+    return dctx.decompress(data)
+
+
+def _zstd_compressobj(level: int, size: int) -> Any:
+    # A dedicated context: a suspended compress_stream must not share one with
+    # other compress calls on the same thread. size is recorded in the frame
+    # header so one-shot decompression works on the result.
+    cctx = zstd.ZstdCompressor(level=level, dict_data=_zstd_dict())
+    return cctx.compressobj(size=size)
+
+
+def _to_bytes(data: CompressInput, encoding: str) -> bytes:
+    """Convert compressor input to bytes."""
+    if isinstance(data, str):
+        return data.encode(encoding)
+    elif isinstance(data, dict):
+        # orjson produces UTF-8 bytes directly, no intermediate str
+        return orjson.dumps(data)
+    elif isinstance(data, memoryview) and data.format != 'B':
+        # Codecs read any buffer, but sizes and slicing should count bytes
+        return data.cast('B')
+    # bytes, bytearray and byte memoryviews go to the codec as-is
+    return data
 
 
 class Compressor:
     """Compresses and decompresses data using the specified algorithm."""
     
+    # algorithm -> (compress(data, level), decompress(data))
+    _DISPATCH: Dict[
+        CompressionAlgorithm,
+        Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes]],
+    ] = {
+        CompressionAlgorithm.NONE: (_none_compress, _none_decompress),
+        CompressionAlgorithm.GZIP: (_gzip_compress, _gzip_decompress),
+        CompressionAlgorithm.LZMA: (_lzma_compress, lzma.decompress),
+        CompressionAlgorithm.ZLIB: (_zlib_compress, _zlib_decompress),
+    }
+    # algorithm -> factory(level, size) of an incremental compress()/flush() object
+    _STREAMERS: Dict[CompressionAlgorithm, Callable[[int, int], Any]] = {
+        CompressionAlgorithm.GZIP: _gzip_compressobj,
+        CompressionAlgorithm.LZMA: _lzma_compressobj,
+        CompressionAlgorithm.ZLIB: _zlib_compressobj,
+    }
+    if _HAS_ZSTD:
+        _DISPATCH[CompressionAlgorithm.ZSTD] = (_zstd_compress, _zstd_decompress)
+        _STREAMERS[CompressionAlgorithm.ZSTD] = _zstd_compressobj
+    
     def __init__(
         self,
         algorithm: Union[CompressionAlgorithm, str] = CompressionAlgorithm.GZIP,
@@ -63,44 +216,109 @@ class Compressor:
         if self.level is not None:
             if not 1 <= self.level <= 9:
                 raise ValueError("Compression level must be between 1 and 9")
+        
+        # Resolve the codec once instead of dispatching on every call
+        try:
+            self._compress_fn, self._decompress_fn = self._DISPATCH[algorithm]
+        except KeyError:
+            if algorithm == CompressionAlgorithm.ZSTD:
+                raise ValueError("ZSTD compression requires the zstandard package") from None
+            raise ValueError(f"Unsupported compression algorithm: {algorithm}") from None
     
     def compress(
         self,
-        data: Union[str, bytes, Dict[str, Any]],
+        data: CompressInput,
         encoding: str = 'utf-8',
     ) -> bytes:
         """Compress data using the configured algorithm.
         
         Args:
-            data: Data to compress (string, bytes, or JSON-serializable dict)
+            data: Data to compress (string, bytes-like object, or JSON-serializable dict)
             encoding: Encoding to use for string data
             
         Returns:
             Compressed data as bytes
         """
-        # Convert input to bytes if needed
-        if isinstance(data, str):
-            data_bytes = data.encode(encoding)
-        elif isinstance(data, dict):
-            data_bytes = json.dumps(data).encode(encoding)
-        else:
-            data_bytes = data
+        return self._compress_fn(_to_bytes(data, encoding), self.level)
+    
+    async def acompress(
+        self,
+        data: CompressInput,
+        encoding: str = 'utf-8',
+    ) -> bytes:
+        """Compress data without blocking the event loop.
+        
+        Payloads under settings.COMPRESSION_OFFLOAD_THRESHOLD bytes are
+        compressed inline, where a thread handoff would cost more than it saves.
+        
+        Args:
+            data: Data to compress (string, bytes-like object, or JSON-serializable dict)
+            encoding: Encoding to use for string data
+            
+        Returns:
+            Compressed data as bytes
+        """
+        data_bytes = _to_bytes(data, encoding)
+        if len(data_bytes) < settings.COMPRESSION_OFFLOAD_THRESHOLD:
+            return self._compress_fn(data_bytes, self.level)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_compress_pool, self._compress_fn, data_bytes, self.level)
+    
+    async def adecompress(
+        self,
+        data: bytes,
+        encoding: str = 'utf-8',
+        as_json: bool = False,
+    ) -> Union[str, bytes, Dict[str, Any]]:
+        """Decompress data without blocking the event loop.
+        
+        Same as ``decompress``; inputs under settings.COMPRESSION_OFFLOAD_THRESHOLD
+        bytes are handled inline.
+        """
+        if len(data) < settings.COMPRESSION_OFFLOAD_THRESHOLD:
+            return self.decompress(data, encoding=encoding, as_json=as_json)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _compress_pool, functools.partial(self.decompress, data, encoding=encoding, as_json=as_json)
+        )
+    
+    def compress_stream(
+        self,
+        data: CompressInput,
+        encoding: str = 'utf-8',
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """Compress data incrementally, yielding the output as it is produced.
         
-        # Apply compression
+        The concatenated output decompresses (with ``decompress``) to the same
+        data as ``compress``'s output for the same algorithm, though the bytes
+        themselves may differ; the caller can write it out piece by piece
+        instead of holding the whole compressed payload in memory.
+        
+        Args:
+            data: Data to compress (string, bytes-like object, or JSON-serializable dict)
+            encoding: Encoding to use for string data
+            chunk_size: Bytes fed to the compressor per step
+                (defaults to settings.COMPRESSION_CHUNK_SIZE)
+            
+        Yields:
+            Chunks of compressed data
+        """
+        data_bytes = _to_bytes(data, encoding)
         if self.algorithm == CompressionAlgorithm.NONE:
-            return data_bytes
-        elif self.algorithm == CompressionAlgorithm.GZIP:
-            return gzip.compress(data_bytes, compresslevel=self.level)
-        elif self.algorithm == CompressionAlgorithm.LZMA:
-            return lzma.compress(
-                data_bytes,
-                preset=self.level,
-                format=lzma.FORMAT_XZ,
-            )
-        elif self.algorithm == CompressionAlgorithm.ZLIB:
-            return zlib.compress(data_bytes, level=self.level)
-        else:
-            raise ValueError(f"Unsupported compression algorithm: {self.algorithm}")
+            yield bytes(data_bytes)
+            return
+        
+        chunk_size = chunk_size or settings.COMPRESSION_CHUNK_SIZE
+        co = self._STREAMERS[self.algorithm](self.level, len(data_bytes))
+        view = memoryview(data_bytes)
+        for start in range(0, len(view), chunk_size):
+            out = co.compress(view[start:start + chunk_size])
+            if out:
+                yield out
+        out = co.flush()
+        if out:
+            yield out
     
     def decompress(
         self,
@@ -118,21 +336,11 @@ class Compressor:
         Returns:
             Decompressed data (bytes, str, or dict if as_json=True)
         """
-        # Detect compression algorithm if not specified
-        if self.algorithm == CompressionAlgorithm.NONE:
-            decompressed = data
-        elif self.algorithm == CompressionAlgorithm.GZIP:
-            decompressed = gzip.decompress(data)
-        elif self.algorithm == CompressionAlgorithm.LZMA:
-            decompressed = lzma.decompress(data)
-        elif self.algorithm == CompressionAlgorithm.ZLIB:
-            decompressed = zlib.decompress(data)
-        else:
-            raise ValueError(f"Unsupported compression algorithm: {self.algorithm}")
+        decompressed = self._decompress_fn(data)
         
         # Convert to desired output format
         if as_json:
-            return json.loads(decompressed.decode(encoding))
+            return orjson.loads(decompressed)
         elif encoding:
             try:
                 return decompressed.decode(encoding)
@@ -151,44 +359,65 @@ class Compressor:
         Returns:
             Detected compression algorithm or None if unknown
         """
-        # Check for GZIP magic number
-        if len(data) >= 2 and data[0] == 0x1F and data[1] == 0x8B:
+        n = len(data)
+        if n < 2:
+            return None
+        
+        # Read the first four bytes once as a big-endian uint32 (zero-padded
+        # for shorter input) and compare against the magic numbers
+        head = int.from_bytes(data[:4], 'big')
+        if n < 4:
+            head <<= 8 * (4 - n)
+        hdr = head >> 16
+        
+        # GZIP: 1F 8B
+        if hdr == 0x1F8B:
             return CompressionAlgorithm.GZIP
         
-        # Check for XZ magic number
-        if len(data) >= 6 and data[0] == 0xFD and data[1:4] == b'7zXZ' and data[4:6] == b'\x00\x00':
+        # XZ: FD '7zXZ' 00
+        if head == 0xFD377A58 and data[4:6] == b'Z\x00':
             return CompressionAlgorithm.LZMA
         
-        # Check for ZLIB header (first byte: CMF, second byte: FLG)
-        if len(data) >= 2:
-            cmf = data[0]
-            flg = data[1]
-            
-            # Check for zlib header (RFC 1950)
-            if (cmf & 0x0F) == 8:  # CM = 8 means "deflate"
-                if (cmf * 256 + flg) % 31 == 0:  # FCHECK must be valid
-                    return CompressionAlgorithm.ZLIB
+        # Zstandard frame: 28 B5 2F FD
+        if head == 0x28B52FFD:
+            return CompressionAlgorithm.ZSTD
+        
+        # ZLIB (RFC 1950): CM = 8 ("deflate") and CMF*256 + FLG divisible by 31
+        if (hdr & 0x0F00) == 0x0800 and hdr % 31 == 0:
+            return CompressionAlgorithm.ZLIB
         
         return None
 
 
+@functools.lru_cache(maxsize=16)
+def _get_compressor(alg_str: str, level: Optional[int]) -> Compressor:
+    """Shared Compressor for an algorithm name and level (Compressors are stateless)."""
+    return Compressor(algorithm=alg_str, level=level)
+
+
+def _algorithm_key(algorithm: Union[CompressionAlgorithm, str]) -> str:
+    """Canonical algorithm name, so 'gzip', 'GZIP' and the enum share a cache entry."""
+    if isinstance(algorithm, CompressionAlgorithm):
+        return algorithm.name
+    return algorithm.upper()
+
+
 def compress(
-    data: Union[str, bytes, Dict[str, Any]],
+    data: CompressInput,
     algorithm: Union[CompressionAlgorithm, str] = 'gzip',
     level: Optional[int] = None,
 ) -> bytes:
     """Compress data using the specified algorithm.
     
     Args:
-        data: Data to compress (string, bytes, or JSON-serializable dict)
+        data: Data to compress (string, bytes-like object, or JSON-serializable dict)
         algorithm: Compression algorithm to use
         level: Compression level (1-9)
         
     Returns:
         Compressed data as bytes
     """
-    compressor = Compressor(algorithm=algorithm, level=level)
-    return compressor.compress(data)
+    return _get_compressor(_algorithm_key(algorithm), level).compress(data)
 
 
 def decompress(
@@ -214,36 +443,33 @@ def decompress(
             raise ValueError("Could not detect compression algorithm")
         algorithm = detected
     
-    compressor = Compressor(algorithm=algorithm)
+    compressor = _get_compressor(_algorithm_key(algorithm), None)
     return compressor.decompress(data, encoding=encoding, as_json=as_json)
 
 
 def estimate_compression_ratio(
-    data: Union[str, bytes, Dict[str, Any]],
+    data: CompressInput,
     algorithm: Union[CompressionAlgorithm, str] = 'gzip',
     level: Optional[int] = None,
 ) -> float:
     """Estimate the compression ratio for the given data.
     
     Args:
-        data: Data to compress (string, bytes, or JSON-serializable dict)
+        data: Data to compress (string, bytes-like object, or JSON-serializable dict)
         algorithm: Compression algorithm to use
         level: Compression level (1-9)
         
     Returns:
         Compression ratio (original_size / compressed_size)
     """
-    if isinstance(data, str):
-        original_size = len(data.encode('utf-8'))
-    elif isinstance(data, dict):
-        original_size = len(json.dumps(data).encode('utf-8'))
-    else:
-        original_size = len(data)
+    # Serialize once and compress those bytes, rather than letting compress() redo it
+    data = _to_bytes(data, 'utf-8')
+    original_size = len(data)
     
     if original_size == 0:
         return 1.0
     
-    compressed = compress(data, algorithm=algorithm, level=level)
+    compressed = _get_compressor(_algorithm_key(algorithm), level).compress(data)
     compressed_size = len(compressed)
     
     return original_size / compressed_size
@@ -269,7 +495,7 @@ if __name__ == "__main__":
     
     # Compress the data
     compressed = compressor.compress(sample_data)
-    print(f"Original size: {len(json.dumps(sample_data).encode('utf-8'))} bytes")
+    print(f"Original size: {len(orjson.dumps(sample_data))} bytes")
     print(f"Compressed size: {len(compressed)} bytes")
     
     # Decompress the data
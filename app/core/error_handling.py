@@ -7,6 +7,8 @@ retry logic with exponential backoff.
 
 import asyncio
 import functools
+import heapq
+import itertools
 import logging
 import random
 import time
@@ -180,22 +182,46 @@ class DeadLetterQueue:
     """
     A simple in-memory dead letter queue for storing failed operations.
     
+    It is meant to be used from a single event loop thread. No method awaits,
+    so each call runs to completion without interleaving and needs no lock.
+    
+    Every entry is stored by an integer ``_id`` assigned in ``put``. Entries
+    waiting for a retry are scheduled in a heap ordered by ``next_retry``, so a
+    poll only touches the items that are due. Items handed out by
+    ``claim_batch`` (or ``get_retry_items``) stay in flight until they are
+    acknowledged or their claim expires; items that run out of retries stay
+    stored but are no longer scheduled.
+    
     This can be replaced with a persistent storage implementation for production use.
     """
 
-    def __init__(self, max_retries: int = None, retry_delay: int = None):
+    def __init__(
+        self,
+        max_retries: int = None,
+        retry_delay: int = None,
+        visibility_timeout: float = None,
+    ):
         """Initialize the dead letter queue.
         
         Args:
             max_retries: Maximum number of retry attempts for each item
             retry_delay: Initial delay between retries in seconds
+            visibility_timeout: Seconds a claimed item may stay unacknowledged
         """
         self.max_retries = max_retries or settings.DLQ_MAX_RETRIES
         self.retry_delay = retry_delay or settings.DLQ_RETRY_DELAY
-        self._queue: list[dict] = []
-        self._lock = asyncio.Lock()
-
-    async def put(
+        self.visibility_timeout = visibility_timeout or settings.DLQ_VISIBILITY_TIMEOUT
+        # Insertion-ordered, and ids only grow, so the first entry is the oldest
+        self._items: dict[int, dict] = {}
+        # (next_retry, _id); ids are unique so entries are never compared
+        self._ready_heap: list[tuple[float, int]] = []
+        self._in_flight: set[int] = set()
+        # (claim_deadline, _id); stale once the item is acknowledged or reclaimed
+        self._claims: list[tuple[float, int]] = []
+        self._exhausted = 0
+        self._ids = itertools.count()
+
+    def put(
         self,
         item: Any,
         error: Exception,
@@ -218,88 +244,157 @@ class DeadLetterQueue:
             return
 
         entry = {
+            "_id": next(self._ids),
             "item": item,
             "error": str(error),
             "error_type": error.__class__.__name__,
             "metadata": metadata or {},
             "context": context or {},
             "attempts": 0,
+            "in_flight": False,
+            "claim_deadline": None,
             "next_retry": time.time() + self.retry_delay,
             "created_at": time.time(),
             "last_updated": time.time(),
         }
 
-        async with self._lock:
-            self._queue.append(entry)
+        self._items[entry["_id"]] = entry
+        heapq.heappush(self._ready_heap, (entry["next_retry"], entry["_id"]))
 
         logger.warning(
             "Item added to dead letter queue",
             extra={
                 "item": str(item)[:500],  # Truncate to avoid log flooding
                 "error": str(error),
-                "queue_size": len(self._queue),
+                "queue_size": len(self._items),
             },
         )
 
-    async def get_retry_items(self) -> list[dict]:
-        """Get items that are ready for retry."""
+    def get_retry_items(self) -> list[dict]:
+        """Get items that are ready for retry.
+        
+        The returned items are claimed as by ``claim_batch`` until they are
+        passed to ``mark_processed``; each one carries its ``_id``.
+        """
+        return self._claim(len(self._ready_heap), time.time())
+
+    def claim_batch(self, n: int) -> list[dict]:
+        """Claim up to ``n`` items that are ready for retry.
+        
+        Claimed items are marked ``in_flight`` with a ``claim_deadline``. An
+        item not acknowledged through ``ack_batch`` by its deadline counts as
+        a failed attempt and becomes claimable again.
+        
+        Args:
+            n: Maximum number of items to claim
+        """
+        return self._claim(n, time.time())
+
+    def ack_batch(self, claimed: list[dict], results: list[bool]) -> None:
+        """Report the outcome of a batch returned by ``claim_batch``.
+        
+        Args:
+            claimed: The claimed items
+            results: Whether each item was processed successfully, in order
+        """
         now = time.time()
-        async with self._lock:
-            ready_items = [
-                item
-                for item in self._queue
-                if item["attempts"] < self.max_retries
-                and item["next_retry"] <= now
-            ]
-        return ready_items
-
-    async def mark_processed(self, item: dict, success: bool = True) -> None:
+        for item, success in zip(claimed, results):
+            self._ack(item, success, now)
+
+    def mark_processed(self, item: dict, success: bool = True) -> None:
         """Mark an item as processed.
         
         Args:
             item: The item to mark as processed
             success: Whether the processing was successful
         """
-        async with self._lock:
-            if item in self._queue:
-                if success:
-                    self._queue.remove(item)
-                    logger.info(
-                        "Item successfully processed and removed from DLQ",
-                        extra={"item_id": id(item)},
-                    )
-                else:
-                    item["attempts"] += 1
-                    item["last_updated"] = time.time()
-                    # Exponential backoff with jitter
-                    jitter = random.uniform(0.5, 1.5)
-                    item["next_retry"] = time.time() + min(
-                        self.retry_delay * (2 ** (item["attempts"] - 1)) * jitter,
-                        settings.RETRY_MAX_DELAY,
-                    )
-                    logger.warning(
-                        "Item processing failed, will retry later",
-                        extra={
-                            "item_id": id(item),
-                            "attempts": item["attempts"],
-                            "next_retry": item["next_retry"],
-                        },
-                    )
+        self._ack(item, success, time.time())
+
+    def _claim(self, n: int, now: float) -> list[dict]:
+        # Claims past their deadline were never acknowledged; fail them first
+        # so they compete for this batch like any other due item
+        claims = self._claims
+        while claims and claims[0][0] <= now:
+            deadline, item_id = heapq.heappop(claims)
+            item = self._items.get(item_id)
+            if item is not None and item["in_flight"] and item["claim_deadline"] == deadline:
+                logger.warning(
+                    "DLQ claim expired without acknowledgement",
+                    extra={"item_id": item_id},
+                )
+                self._ack(item, False, now)
+
+        claimed = []
+        heap = self._ready_heap
+        deadline = now + self.visibility_timeout
+        while heap and heap[0][0] <= now and len(claimed) < n:
+            item_id = heapq.heappop(heap)[1]
+            item = self._items[item_id]
+            item["in_flight"] = True
+            item["claim_deadline"] = deadline
+            self._in_flight.add(item_id)
+            heapq.heappush(claims, (deadline, item_id))
+            claimed.append(item)
+        return claimed
+
+    def _ack(self, item: dict, success: bool, now: float) -> None:
+        item_id = item["_id"]
+        if item_id not in self._in_flight:
+            return
+        self._in_flight.discard(item_id)
+        item["in_flight"] = False
+        if success:
+            del self._items[item_id]
+            logger.info(
+                "Item successfully processed and removed from DLQ",
+                extra={"item_id": item_id},
+            )
+            return
+
+        item["attempts"] += 1
+        item["last_updated"] = now
+        if item["attempts"] >= self.max_retries:
+            self._exhausted += 1
+            logger.error(
+                "Item exceeded its retries and will not be retried again",
+                extra={"item_id": item_id, "attempts": item["attempts"]},
+            )
+            return
 
-    async def get_stats(self) -> dict:
+        # Exponential backoff with jitter
+        jitter = random.uniform(0.5, 1.5)
+        item["next_retry"] = now + min(
+            self.retry_delay * (2 ** (item["attempts"] - 1)) * jitter,
+            settings.RETRY_MAX_DELAY,
+        )
+        heapq.heappush(self._ready_heap, (item["next_retry"], item_id))
+        logger.warning(
+            "Item processing failed, will retry later",
+            extra={
+                "item_id": item_id,
+                "attempts": item["attempts"],
+                "next_retry": item["next_retry"],
+            },
+        )
+
+    def get_stats(self) -> dict:
         """Get statistics about the dead letter queue."""
         now = time.time()
-        async with self._lock:
-            return {
-                "total_items": len(self._queue),
-                "items_pending_retry": sum(
-                    1
-                    for item in self._queue
-                    if item["attempts"] < self.max_retries
-                    and item["next_retry"] <= now
-                ),
-                "items_exceeded_retries": sum(
-                    1 for item in self._queue if item["attempts"] >= self.max_retries
-                ),
-                "oldest_item_age": now - min((item["created_at"] for item in self._queue), default=now),
-            }
+        heap = self._ready_heap
+        # Walk only the part of the heap that is due: a node past `now`
+        # has no due descendants
+        pending = 0
+        stack = [0] if heap and heap[0][0] <= now else []
+        while stack:
+            i = stack.pop()
+            pending += 1
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap) and heap[child][0] <= now:
+                    stack.append(child)
+        oldest = next(iter(self._items.values()), None)
+        return {
+            "total_items": len(self._items),
+            "items_pending_retry": pending + len(self._in_flight),
+            "items_exceeded_retries": self._exhausted,
+            "oldest_item_age": now - oldest["created_at"] if oldest else 0.0,
+        }
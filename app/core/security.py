@@ -5,16 +5,33 @@ This module provides functions for password hashing, JWT token handling,
 and other security-related functionality.
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+import orjson
+from jwt import InvalidTokenError as JWTError
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only looks at the first 72 bytes of a password. Older bcrypt releases
+# truncated silently, newer ones reject longer input, so truncate here to keep
+# existing hashes verifying.
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# bcrypt releases the GIL while hashing, so a thread per core runs hashes in
+# parallel and keeps them off the event loop
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pwd-hash")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -27,7 +44,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        # Not a bcrypt hash
+        return False
 
 def get_password_hash(password: str) -> str:
     """
@@ -39,7 +63,57 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: The hashed password
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES],
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS),
+    ).decode("utf-8")
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hash without blocking the event loop.
+    
+    Args:
+        plain_password: The plain text password to verify
+        hashed_password: The hashed password to compare against
+        
+    Returns:
+        bool: True if the password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Generate a password hash without blocking the event loop.
+    
+    Args:
+        password: The plain text password to hash
+        
+    Returns:
+        str: The hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, get_password_hash, password)
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used for JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# HS256 tokens all share the same header and key: encode the header once and
+# keep a keyed HMAC to copy, instead of redoing both for every token
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+_JWT_HMAC = hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+# Prepared keys and accepted algorithms for the PyJWT paths, built once so the
+# key isn't re-parsed (a PEM, for asymmetric algorithms) on every call. With an
+# asymmetric algorithm SECRET_KEY is the private key: tokens are signed with it
+# and verified with its public half. HMAC keys sign and verify alike.
+_JWT_SIGNING_KEY = jwt.algorithms.get_default_algorithms()[settings.ALGORITHM].prepare_key(settings.SECRET_KEY)
+_JWT_VERIFY_KEY = (
+    _JWT_SIGNING_KEY.public_key() if hasattr(_JWT_SIGNING_KEY, "public_key") else _JWT_SIGNING_KEY
+)
+_JWT_ALGORITHMS = (settings.ALGORITHM,)
+_JWT_DECODE_OPTIONS = {"verify_aud": False}
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -57,14 +131,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    if settings.ALGORITHM != "HS256":
+        to_encode.update({"exp": expire})
+        return jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=settings.ALGORITHM)
+    
+    to_encode.update({"exp": int(expire.timestamp())})
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(to_encode))
+    signature = _JWT_HMAC.copy()
+    signature.update(signing_input)
+    return (signing_input + b"." + _b64url(signature.digest())).decode()
+
+# Decoded token payloads, most recently used last: token -> (payload, expires_at).
+# A client presents the same token on every request until it expires, and
+# decoding is a pure function of the token (key and algorithm are fixed), so
+# the signature check and JSON parse only need to happen once per token.
+_token_cache: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 def decode_token(token: str) -> dict:
     """
     Decode a JWT token.
     
+    Valid tokens are cached until their ``exp`` claim, or for at most
+    settings.TOKEN_CACHE_TTL_SECONDS. A cached token is still rejected once it
+    expires.
+    
     Args:
         token: The JWT token to decode
         
@@ -74,9 +165,28 @@ def decode_token(token: str) -> dict:
     Raises:
         JWTError: If the token is invalid or expired
     """
-    return jwt.decode(
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            if now < cached[1]:
+                _token_cache.move_to_end(token)
+                return dict(cached[0])
+            del _token_cache[token]
+    
+    payload = jwt.decode(
         token,
-        settings.SECRET_KEY,
-        algorithms=[settings.ALGORITHM],
-        options={"verify_aud": False}
+        _JWT_VERIFY_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options=_JWT_DECODE_OPTIONS,
     )
+    
+    expires_at = now + settings.TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    with _token_cache_lock:
+        _token_cache[token] = (payload, expires_at)
+        if len(_token_cache) > settings.TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return dict(payload)
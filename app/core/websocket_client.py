@@ -176,10 +176,10 @@ class WebSocketClient:
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
-            await self.dlq.put(message, e, {"type": "json_parse_error"})
+            self.dlq.put(message, e, {"type": "json_parse_error"})
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
-            await self.dlq.put(message, e, {"type": "processing_error"})
+            self.dlq.put(message, e, {"type": "processing_error"})
     
     async def _process_message_batch(self, batch: list) -> None:
         """Process a batch of messages.
@@ -192,7 +192,7 @@ class WebSocketClient:
                 self.on_message(message)
             except Exception as e:
                 logger.error(f"Error in message handler: {e}", exc_info=True)
-                await self.dlq.put(message, e, {"type": "handler_error"})
+                self.dlq.put(message, e, {"type": "handler_error"})
 
     async def _handle_reconnect(self) -> None:
         """Handle reconnection logic."""
@@ -1,14 +1,19 @@
 import os
 import uuid
-from flask import Flask, render_template_string, jsonify, redirect, url_for, request, json
+from flask import Flask, Response, render_template, jsonify, redirect, url_for, request
+from flask.json.provider import DefaultJSONProvider
 from datetime import datetime, timedelta
-import random
 import asyncio
+import time
 from sqlalchemy.sql import text, and_
 from sqlalchemy.orm import aliased
 from functools import wraps
+from flask_caching import Cache
+from flask_compress import Compress
 from typing import Any, Dict, List, Tuple, Optional
 import nest_asyncio
+import numpy as np
+import orjson
 import hashlib
 
 # Create Flask app
@@ -22,6 +27,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import models and database utilities
+from app.core.cache import response_cache
 from app.db.database import async_engine, async_session_factory, get_db
 from app.db.models import Slice, SliceKPI, Alert, User
 from app.db.dashboard_queries import (
@@ -37,10 +43,20 @@ def md5_hash(text):
     return hashlib.md5(str(text).encode('utf-8')).hexdigest()
 
 def to_json(value, indent=None):
-    """Convert value to JSON with optional indentation."""
-    if value is None:
-        return 'null'
-    return json.dumps(value, default=str, ensure_ascii=False, indent=indent)
+    """Convert value to JSON with optional (two-space) indentation."""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(value, default=str, option=option).decode('utf-8')
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify and request.get_json skip stdlib json."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
 # Decorator to allow async routes in Flask
 def async_route(f):
@@ -57,14 +73,34 @@ def async_route(f):
 
 # Constants
 SLICE_TYPES = ["eMBB", "URLLC", "mMTC", "V2X", "Industrial IoT"]
+# Lowercased slice status -> Bootstrap badge color
 STATUS_COLORS = {
-    "Active": "success",
-    "Inactive": "secondary",
-    "Warning": "warning",
-    "Error": "danger",
-    "Degraded": "warning",
-    "Maintenance": "info"
+    "active": "success",
+    "inactive": "secondary",
+    "warning": "warning",
+    "error": "danger",
+    "degraded": "warning",
+    "maintenance": "info"
 }
+DEFAULT_STATUS_COLOR = "secondary"
+
+def capacity_color(capacity_pct: int) -> str:
+    """Bootstrap progress-bar color for a slice capacity percentage."""
+    return 'success' if capacity_pct < 80 else 'warning' if capacity_pct < 95 else 'danger'
+
+# Placeholder slices shown when the database has none
+SAMPLE_SLICES = (
+    {'id': 'slice_embb_001', 'name': 'eMBB Slice', 'type': 'eMBB', 'status': 'active'},
+    {'id': 'slice_urllc_001', 'name': 'URLLC Slice', 'type': 'URLLC', 'status': 'active'},
+    {'id': 'slice_mmtc_001', 'name': 'mMTC Slice', 'type': 'mMTC', 'status': 'active'}
+)
+
+# Activity type -> (Bootstrap color, Bootstrap icon) for the activity feed
+ACTIVITY_ICONS = {
+    'alert_triggered': ('danger', 'bi-exclamation-triangle-fill'),
+    'device_connect': ('success', 'bi-phone-fill')
+}
+DEFAULT_ACTIVITY_ICON = ('primary', 'bi-sliders')
 
 # Database session manager
 async def get_db_session():
@@ -261,7 +297,7 @@ async def get_latest_kpi(slice_id: str):
         print(f"Error in get_latest_kpi for slice {slice_id}: {e}")
         return None
 
-async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tuple[List[float], List[float]]:
+async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tuple[List[str], List[float], List[float]]:
     """Retrieve throughput and latency data for a slice.
     
     Args:
@@ -269,7 +305,7 @@ async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tupl
         hours: Number of hours of data to retrieve
         
     Returns:
-        Tuple of (throughput_data, latency_data) where each is a list of values
+        Tuple of (timestamps, throughput_data, latency_data) where each is a list of values
     """
     session_gen = get_db_session()
     session = await anext(session_gen)
@@ -293,7 +329,7 @@ async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tupl
         
         if not table_exists.scalar():
             print("slice_kpis table does not exist")
-            return [], []
+            return [], [], []
             
         # Query for throughput and latency data
         result = await session.execute(
@@ -316,11 +352,12 @@ async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tupl
         if not rows:
             print(f"No data found for slice {slice_id}")
             # Return empty lists if no data
-            return [], []
+            return [], [], []
             
         print(f"Found {len(rows)} data points for slice {slice_id}")
         
         # Extract data and ensure we have valid numbers
+        timestamps_data = []
         throughput_data = []
         latency_data = []
         
@@ -336,6 +373,7 @@ async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tupl
                 if latency < 0:
                     latency = 0
                     
+                timestamps_data.append(row.time)
                 throughput_data.append(throughput)
                 latency_data.append(latency)
                 
@@ -346,27 +384,231 @@ async def get_throughput_latency_from_db(slice_id: str, hours: int = 24) -> Tupl
         # If we have no valid data, return empty lists
         if not throughput_data or not latency_data:
             print("No valid data points found")
-            return [], []
+            return [], [], []
             
         print(f"Returning {len(throughput_data)} data points")
-        return throughput_data, latency_data
+        return timestamps_data, throughput_data, latency_data
         
     except Exception as e:
         print(f"Error in get_throughput_latency_from_db: {e}")
         import traceback
         traceback.print_exc()
-        return [], []
+        return [], [], []
     finally:
         await session.close()
 
+# Seconds a dashboard payload is reused, server-side and by clients
+# (also used by the natively served endpoints in app.main)
+CACHE_TTL = 2
+
+# Upper bound on chart points sent to the browser (about one per horizontal pixel)
+SERIES_MAX_POINTS = 800
+
+# Chart time ranges selectable on the dashboard, in hours
+SERIES_RANGES = {'1h': 1, '6h': 6, '24h': 24}
+
+# Unified hover is costly in WebGL; only enable it for series up to this length
+HOVER_UNIFIED_MAX_POINTS = 200
+
+# Chart series -> (trace name, line color, fill color, y-axis title)
+CHART_STYLES = {
+    'throughput': ('Throughput', '#4361ee', 'rgba(67, 97, 238, 0.1)', 'Mbps'),
+    'latency': ('Latency', '#4cc9a0', 'rgba(76, 201, 160, 0.1)', 'ms')
+}
+
+# Shared generator for placeholder chart data
+_RNG = np.random.default_rng()
+
+def generate_mock_chart_data(points: int = 12) -> Tuple[List[str], List[float], List[float]]:
+    """Generate placeholder throughput/latency series for the dashboard charts.
+    
+    Args:
+        points: Number of data points, spaced 5 minutes apart and ending now
+        
+    Returns:
+        Tuple of (timestamps, throughput_data, latency_data)
+    """
+    # Format from struct_time fields rather than a datetime.strftime per point
+    now = time.time()
+    timestamps = []
+    for i in reversed(range(points)):
+        t = time.localtime(now - i * 300)
+        timestamps.append(f'{t.tm_hour:02d}:{t.tm_min:02d}')
+    
+    # One vectorized draw per series instead of a random.uniform call per point
+    throughput = np.maximum(10, _RNG.uniform(50, 200) + _RNG.uniform(-20, 50, points))  # Mbps
+    latency = np.maximum(1, _RNG.uniform(10, 30) + _RNG.uniform(-5, 10, points))  # ms
+    
+    return timestamps, throughput.tolist(), latency.tolist()
+
+def orjson_response(payload: Any, status: int = 200, max_age: Optional[int] = None) -> Response:
+    """Serialize a payload with orjson into a JSON response (NumPy values included).
+    
+    With max_age set, the response also tells browsers and proxies they may reuse
+    it for that many seconds, matching the server-side cache window.
+    """
+    response = Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+    if max_age is not None:
+        response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+def series_stats(values: List[float]) -> Dict[str, float]:
+    """Summarize a chart series as min/avg/max, all 0 for an empty series."""
+    if not values:
+        return {'min': 0.0, 'avg': 0.0, 'max': 0.0}
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        'min': round(float(arr.min()), 2),
+        'avg': round(float(arr.mean()), 2),
+        'max': round(float(arr.max()), 2)
+    }
+
+def lttb_indices(values: List[float], n_out: int) -> np.ndarray:
+    """Pick the indices of n_out points that preserve a series' visual shape.
+    
+    Largest-Triangle-Three-Buckets: the first and last points are kept and,
+    for each bucket in between, the point forming the largest triangle with
+    the previously kept point and the mean of the next bucket.
+    
+    Args:
+        values: Evenly spaced series values
+        n_out: Maximum number of points to keep
+        
+    Returns:
+        Sorted array of indices into values
+    """
+    n = len(values)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    y = np.asarray(values, dtype=np.float64)
+    x = np.arange(n, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            avg_x = x[end:edges[i + 2]].mean()
+            avg_y = y[end:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    
+    return indices
+
+def downsample_series(timestamps: List[str], values: List[float],
+                      n_out: int = SERIES_MAX_POINTS) -> Tuple[List[str], List[float]]:
+    """Downsample one chart series to at most n_out points, selected on its own values."""
+    if len(values) <= n_out:
+        return timestamps, values
+    idx = lttb_indices(values, n_out)
+    return [timestamps[i] for i in idx], [values[i] for i in idx]
+
+def chart_figure(series: str, timestamps: List[str], values: List[float]) -> Dict[str, Any]:
+    """Build the Plotly figure (data and layout) for one dashboard chart.
+    
+    Plain dicts in the shape Plotly.js expects; the browser hands them straight
+    to Plotly.react without assembling traces itself. Each trace is downsampled
+    on its own values, so a latency spike survives even where throughput is flat.
+    """
+    timestamps, values = downsample_series(timestamps, values)
+    name, color, fillcolor, unit = CHART_STYLES[series]
+    axis_line = {'showline': True, 'linecolor': '#e9ecef', 'linewidth': 1, 'zeroline': False}
+    tickfont = {'size': 10, 'color': '#6c757d'}
+    return {
+        'data': [{
+            'x': timestamps,
+            'y': values,
+            'type': 'scattergl',
+            'mode': 'lines',
+            'name': name,
+            'line': {'color': color, 'width': 2},
+            'fill': 'tozeroy',
+            'fillcolor': fillcolor
+        }],
+        'layout': {
+            'plot_bgcolor': 'rgba(0,0,0,0)',
+            'paper_bgcolor': 'rgba(0,0,0,0)',
+            'margin': {'t': 30, 'b': 40, 'l': 50, 'r': 30},
+            'showlegend': False,
+            'xaxis': {'showgrid': False, 'tickfont': tickfont, **axis_line},
+            'yaxis': {
+                'title': {'text': unit, 'font': {'size': 12, 'color': '#6c757d'}},
+                'tickfont': tickfont,
+                'gridcolor': 'rgba(0,0,0,0.05)',
+                **axis_line
+            },
+            'hovermode': 'x unified' if len(timestamps) <= HOVER_UNIFIED_MAX_POINTS else False
+        }
+    }
+
 # App configuration
 app.config.update(
     SECRET_KEY=os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key'),
     JSON_AS_ASCII=False,
     JSON_SORT_KEYS=False,
-    JSONIFY_PRETTYPRINT_REGULAR=True
+    JSONIFY_PRETTYPRINT_REGULAR=True,
+    # Short-lived in-process cache so clients polling the dashboard share one render
+    CACHE_TYPE='SimpleCache',
+    CACHE_DEFAULT_TIMEOUT=CACHE_TTL,
+    # Compress the HTML shell and JSON API responses on the wire
+    COMPRESS_MIMETYPES=['text/html', 'application/json', 'text/css', 'application/javascript'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_LEVEL=6,
+    COMPRESS_BR_LEVEL=4
+)
+
+app.json = ORJSONProvider(app)
+cache = Cache(app)
+Compress(app)
+
+# Front-end vendor assets, keyed by their path under static/vendor/. A copy placed
+# there is served from our origin; otherwise the template falls back to the pinned
+# CDN build. Paths carry the version so they can be cached as immutable.
+VENDOR_ASSETS = {
+    'bootstrap-5.1.3/bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css',
+    'bootstrap-5.1.3/bootstrap.bundle.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js',
+    'bootstrap-icons-1.10.0/bootstrap-icons.css': 'https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css',
+    # The gl2d partial bundle carries scatter and scattergl without the 3D/geo/mapbox traces
+    'plotly-gl2d-2.24.1.min.js': 'https://cdn.plot.ly/plotly-gl2d-2.24.1.min.js'
+}
+VENDOR_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+_LOCAL_VENDOR_ASSETS = frozenset(
+    name for name in VENDOR_ASSETS
+    if os.path.isfile(os.path.join(app.static_folder, 'vendor', name))
 )
 
+@app.template_global()
+def vendor_url(name: str) -> str:
+    """URL for a vendor asset, preferring the local static copy over the CDN."""
+    if name in _LOCAL_VENDOR_ASSETS:
+        return url_for('static', filename=f'vendor/{name}')
+    return VENDOR_ASSETS[name]
+
+@app.after_request
+def add_vendor_cache_headers(response):
+    """Let browsers keep versioned vendor assets for a year without revalidating."""
+    if request.path.startswith(f'{app.static_url_path}/vendor/'):
+        response.headers['Cache-Control'] = VENDOR_CACHE_CONTROL
+    return response
+
+def _cacheable(response):
+    """Only cache successful responses; error paths return (body, status) tuples."""
+    return not isinstance(response, tuple)
+
 # Add security headers
 @app.after_request
 def add_security_headers(response):
@@ -470,6 +712,8 @@ async def create_slice():
             # Commit the transaction
             await session.commit()
             print(f"Successfully committed transaction. New slice ID: {new_slice.id}")
+            # New slice and KPI row: drop the cached /dashboard API responses
+            response_cache.invalidate("dashboard:")
             
             # Return success response
             response_data = {
@@ -520,1336 +764,344 @@ async def create_slice():
         if session:
             await session.close()
 
-@app.route('/dashboard')
-@async_route
-async def dashboard():
-    """Render the main dashboard page."""
+async def build_dashboard_data() -> Dict[str, Any]:
+    """Collect the slices, KPIs, activity feed and chart series shown on the dashboard."""
+    print("Fetching dashboard data...")
+    
+    # Initialize default values with the structure expected by the new template
+    slices_data = []
+    kpis_data = {
+        'active_slices': 0,
+        'total_devices': 0,
+        'avg_latency': 0.0,
+        'alerts': 0
+    }
+    activities_data = []
+    timestamps_data = []
+    throughput_data = []
+    latency_data = []
+    
     try:
-        print("Fetching dashboard data...")
+        print("Fetching slices data...")
+        slices_from_db = await get_slices_from_db()
+        print(f"Retrieved {len(slices_from_db)} slices")  # Debug log
+        print("Raw slices data from DB:", slices_from_db)  # Debug log
         
-        # Initialize default values with the structure expected by the new template
+        # Map slices to the format expected by the template
         slices_data = []
-        kpis_data = {
-            'active_slices': 0,
-            'total_devices': 0,
-            'avg_latency': 0.0,
-            'alerts': 0
-        }
-        activities_data = []
-        timestamps_data = []
-        throughput_data = []
-        latency_data = []
+        if not slices_from_db:
+            print("No slices found in the database")
+            # Add some sample slices for demonstration
+            slices_from_db = SAMPLE_SLICES
+            print("Using sample slice data")
         
-        try:
-            print("Fetching slices data...")
-            slices_from_db = await get_slices_from_db()
-            print(f"Retrieved {len(slices_from_db)} slices")  # Debug log
-            print("Raw slices data from DB:", slices_from_db)  # Debug log
-            
-            # Map slices to the format expected by the template
-            slices_data = []
-            if not slices_from_db:
-                print("No slices found in the database")
-                # Add some sample slices for demonstration
-                sample_slices = [
-                    {'id': 'slice_embb_001', 'name': 'eMBB Slice', 'type': 'eMBB', 'status': 'active'},
-                    {'id': 'slice_urllc_001', 'name': 'URLLC Slice', 'type': 'URLLC', 'status': 'active'},
-                    {'id': 'slice_mmtc_001', 'name': 'mMTC Slice', 'type': 'mMTC', 'status': 'active'}
-                ]
-                slices_from_db = sample_slices
-                print("Using sample slice data")
-            
-            for slice_data in slices_from_db:
-                try:
-                    # Handle both dictionary and object access
-                    slice_id = str(
-                        getattr(slice_data, 'id', '') 
-                        if hasattr(slice_data, 'id') 
-                        else slice_data.get('id', f'slice_{len(slices_data) + 1:03d}')
-                    )
-                    
-                    slice_name = (
-                        getattr(slice_data, 'name', f'Slice {slice_id}') 
-                        if hasattr(slice_data, 'name') 
-                        else slice_data.get('name', f'Slice {slice_id}')
-                    )
-                    
-                    # Get status with fallback
-                    status = 'inactive'
-                    if hasattr(slice_data, 'status'):
-                        status = (getattr(slice_data, 'status') or 'inactive').lower()
-                    elif isinstance(slice_data, dict) and 'status' in slice_data:
-                        status = (slice_data.get('status') or 'inactive').lower()
-                    
-                    # Try to get KPI data
-                    connected_devices = 0
-                    try:
-                        kpi = await get_latest_kpi(slice_id)
-                        connected_devices = int(kpi.get('connected_devices', random.randint(1, 100))) if kpi else 0
-                    except Exception as kpi_err:
-                        print(f"Error getting KPI for slice {slice_id}: {kpi_err}")
-                        connected_devices = random.randint(1, 100)  # Fallback to random data
-                    
-                    # Determine slice type
-                    slice_type = 'default'
-                    if hasattr(slice_data, 'type') and getattr(slice_data, 'type'):
-                        slice_type = getattr(slice_data, 'type')
-                    elif isinstance(slice_data, dict) and 'type' in slice_data and slice_data.get('type'):
-                        slice_type = slice_data.get('type')
-                    elif 'embb' in slice_id.lower():
-                        slice_type = 'eMBB'
-                    elif 'urllc' in slice_id.lower():
-                        slice_type = 'URLLC'
-                    elif 'm2m' in slice_id.lower() or 'mmtc' in slice_id.lower():
-                        slice_type = 'mMTC'
-                    
-                    # Get description with fallback
-                    description = ''
-                    if hasattr(slice_data, 'description'):
-                        description = getattr(slice_data, 'description', '')
-                    elif isinstance(slice_data, dict) and 'description' in slice_data:
-                        description = slice_data.get('description', '')
-                    
-                    # Build slice info
-                    slice_info = {
-                        'id': slice_id,
-                        'name': slice_name,
-                        'type': slice_type,
-                        'status': status,
-                        'capacity': f"{random.randint(10, 100)}%",
-                        'connected_devices': connected_devices,
-                        'description': str(description) if description else f"{slice_type} Network Slice"
-                    }
-                    print(f"Processed slice info: {slice_info}")  # Debug log
-                    slices_data.append(slice_info)
-                except Exception as e:
-                    print(f"Error processing slice {slice_data.get('id')}: {e}")
-                    # Add a minimal slice with just the ID if processing fails
-                    slices_data.append({
-                        'id': str(slice_data.get('id', 'unknown')),
-                        'name': 'Error Loading Slice',
-                        'type': 'error',
-                        'status': 'error',
-                        'capacity': '0%',
-                        'connected_devices': 0,
-                        'description': 'Error loading slice data'
-                    })
-                
-            print("Fetching KPIs...")
-            kpis_from_db = await get_kpis_from_db()
-            
-            # Map the database KPIs to the structure expected by the template
+        # Placeholder figures drawn in one batch instead of per slice
+        capacities = _RNG.integers(10, 101, len(slices_from_db)).tolist()
+        fallback_devices = _RNG.integers(1, 101, len(slices_from_db)).tolist()
+        
+        for index, slice_data in enumerate(slices_from_db):
             try:
-                kpis_data = {
-                    'active_slices': int(kpis_from_db.get('active_slices', 0)) if kpis_from_db else 0,
-                    'total_devices': int(kpis_from_db.get('total_devices', 0)) if kpis_from_db else 0,
-                    'avg_latency': round(float(kpis_from_db.get('avg_latency', 0.0) or 0), 2),
-                    'alerts': int(kpis_from_db.get('alerts', 0)) if kpis_from_db else 0
-                }
+                # Handle both dictionary and object access
+                slice_id = str(
+                    getattr(slice_data, 'id', '') 
+                    if hasattr(slice_data, 'id') 
+                    else slice_data.get('id', f'slice_{len(slices_data) + 1:03d}')
+                )
                 
-                # If we have no active slices but we have slices_data, update the count
-                if kpis_data['active_slices'] == 0 and slices_data:
-                    active_count = sum(1 for s in slices_data if s.get('status') == 'active')
-                    kpis_data['active_slices'] = active_count
+                slice_name = (
+                    getattr(slice_data, 'name', f'Slice {slice_id}') 
+                    if hasattr(slice_data, 'name') 
+                    else slice_data.get('name', f'Slice {slice_id}')
+                )
                 
-                # If we have no devices but have slices, calculate from slices
-                if kpis_data['total_devices'] == 0 and slices_data:
-                    total_devices = sum(int(s.get('connected_devices', 0)) for s in slices_data)
-                    kpis_data['total_devices'] = total_devices
+                # Get status with fallback
+                status = 'inactive'
+                if hasattr(slice_data, 'status'):
+                    status = (getattr(slice_data, 'status') or 'inactive').lower()
+                elif isinstance(slice_data, dict) and 'status' in slice_data:
+                    status = (slice_data.get('status') or 'inactive').lower()
                 
-                # If we have no latency data but have slices, calculate average
-                if kpis_data['avg_latency'] == 0 and slices_data:
-                    latencies = [s.get('latency', 0) for s in slices_data if s.get('latency')]
-                    if latencies:
-                        kpis_data['avg_latency'] = round(sum(latencies) / len(latencies), 2)
+                # get_slices_from_db already loaded the latest KPI; no second query per slice
+                if isinstance(slice_data, dict) and 'connected_devices' in slice_data:
+                    connected_devices = int(slice_data.get('connected_devices') or 0)
+                else:
+                    connected_devices = fallback_devices[index]  # Fallback to random data
                 
-                print(f"Final KPI Data: {kpis_data}")
+                # Determine slice type
+                slice_type = 'default'
+                if hasattr(slice_data, 'type') and getattr(slice_data, 'type'):
+                    slice_type = getattr(slice_data, 'type')
+                elif isinstance(slice_data, dict) and 'type' in slice_data and slice_data.get('type'):
+                    slice_type = slice_data.get('type')
+                elif 'embb' in slice_id.lower():
+                    slice_type = 'eMBB'
+                elif 'urllc' in slice_id.lower():
+                    slice_type = 'URLLC'
+                elif 'm2m' in slice_id.lower() or 'mmtc' in slice_id.lower():
+                    slice_type = 'mMTC'
                 
-            except (TypeError, ValueError) as e:
-                print(f"Error formatting KPIs: {e}")
-                # Fallback to calculating from slices_data if available
-                if slices_data:
-                    active_slices = sum(1 for s in slices_data if s.get('status') == 'active')
-                    total_devices = sum(int(s.get('connected_devices', 0)) for s in slices_data)
-                    latencies = [s.get('latency', 0) for s in slices_data if s.get('latency')]
-                    avg_latency = round(sum(latencies) / len(latencies), 2) if latencies else 0.0
-                    
-                    kpis_data = {
-                        'active_slices': active_slices,
-                        'total_devices': total_devices,
-                        'avg_latency': avg_latency,
-                        'alerts': 0  # Default to 0 if we can't get alerts
-                    }
-                else:
-                    kpis_data = {
-                        'active_slices': 0,
-                        'total_devices': 0,
-                        'avg_latency': 0.0,
-                        'alerts': 0
-                    }
-            
-            print(f"Retrieved KPIs: {kpis_data}")
-            
-            print("Fetching recent activity...")
-            activity_from_db = await get_activity_from_db(limit=10)
-            activities_data = []
-            
-            # Map activity data to the format expected by the template
-            for activity in activity_from_db:
-                timestamp = activity.get('timestamp')
-                if timestamp and not isinstance(timestamp, str):
-                    if hasattr(timestamp, 'strftime'):
-                        timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                    else:
-                        timestamp = str(timestamp)
+                # Get description with fallback
+                description = ''
+                if hasattr(slice_data, 'description'):
+                    description = getattr(slice_data, 'description', '')
+                elif isinstance(slice_data, dict) and 'description' in slice_data:
+                    description = slice_data.get('description', '')
                 
-                activities_data.append({
-                    'type': 'alert_triggered' if activity.get('level') == 'ERROR' else 'device_connect',
-                    'message': activity.get('message', 'No message'),
-                    'timestamp': timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                # Build slice info
+                slice_info = {
+                    'id': slice_id,
+                    'name': slice_name,
+                    'type': slice_type,
+                    'status': status,
+                    'status_css': STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR),
+                    'capacity_pct': capacities[index],
+                    'bar_css': capacity_color(capacities[index]),
+                    'connected_devices': connected_devices,
+                    'description': str(description) if description else f"{slice_type} Network Slice"
+                }
+                print(f"Processed slice info: {slice_info}")  # Debug log
+                slices_data.append(slice_info)
+            except Exception as e:
+                print(f"Error processing slice {slice_data.get('id')}: {e}")
+                # Add a minimal slice with just the ID if processing fails
+                slices_data.append({
+                    'id': str(slice_data.get('id', 'unknown')),
+                    'name': 'Error Loading Slice',
+                    'type': 'error',
+                    'status': 'error',
+                    'status_css': STATUS_COLORS['error'],
+                    'capacity_pct': 0,
+                    'bar_css': capacity_color(0),
+                    'connected_devices': 0,
+                    'description': 'Error loading slice data'
                 })
             
-            print(f"Retrieved {len(activities_data)} activities")
-            
-            # Generate mock data for charts if no real data
-            try:
-                if slices_data:
-                    # Get the first slice's data for the charts
-                    first_slice_id = slices_data[0]['id']
-                    print(f"Fetching throughput/latency data for slice {first_slice_id}...")
-                    result = await get_throughput_latency_from_db(first_slice_id)
-                    
-                    if isinstance(result, tuple) and len(result) == 2:
-                        throughput_data, latency_data = result
-                        # Ensure we have data
-                        if not throughput_data or not latency_data:
-                            raise ValueError("No data returned from get_throughput_latency_from_db")
-                            
-                        # Generate timestamps for the data points
-                        now = datetime.now()
-                        timestamps_data = [(now - timedelta(minutes=i*5)).strftime('%H:%M') 
-                                         for i in reversed(range(len(throughput_data)))]
-                        print(f"Retrieved {len(throughput_data)} throughput and {len(latency_data)} latency data points")
-                    else:
-                        raise ValueError("Unexpected result format from get_throughput_latency_from_db")
-                else:
-                    raise ValueError("No slices available")
-                    
-            except Exception as e:
-                print(f"Error getting throughput/latency data: {e}")
-                print("Generating mock data for charts...")
-                # Generate mock data with realistic values
-                now = datetime.now()
-                timestamps_data = [(now - timedelta(minutes=i*5)).strftime('%H:%M') 
-                                 for i in reversed(range(12))]
-                
-                # Generate realistic throughput data (Mbps)
-                base_throughput = random.uniform(50, 200)
-                throughput_data = [max(10, base_throughput + random.uniform(-20, 50)) for _ in range(12)]
-                
-                # Generate realistic latency data (ms)
-                base_latency = random.uniform(10, 30)
-                latency_data = [max(1, base_latency + random.uniform(-5, 10)) for _ in range(12)]
-                
-                print(f"Generated mock data: {len(throughput_data)} points, avg throughput: {sum(throughput_data)/len(throughput_data):.2f} Mbps, avg latency: {sum(latency_data)/len(latency_data):.2f} ms")
-                
-        except Exception as e:
-            print(f"Error fetching dashboard data: {e}")
-            import traceback
-            traceback.print_exc()
-            # Generate mock data if there's an error
-            timestamps_data = [(datetime.now() - timedelta(minutes=i*5)).strftime('%H:%M') 
-                            for i in reversed(range(12))]
-            throughput_data = [random.uniform(100, 1000) for _ in range(12)]
-            latency_data = [random.uniform(5, 50) for _ in range(12)]
-        
-        print("Rendering dashboard template...")
+        print("Fetching KPIs...")
+        kpis_from_db = await get_kpis_from_db()
         
-        # Load the new template from a separate file for better maintainability
-        template_path = os.path.join(os.path.dirname(__file__), 'templates', 'dashboard.html')
+        # Map the database KPIs to the structure expected by the template
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-        except FileNotFoundError:
-            # Fallback template if the file is not found
-            template = """
-            <!DOCTYPE html>
-    <html>
-    <head>
-        <title>5G Network Slice Manager</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css">
-        <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-        <style>
-            body {
-                font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                background-color: #f5f7fb;
-                padding: 20px;
-                color: #333;
-            }
-            .card {
-                border: none;
-                border-radius: 10px;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.05);
-                margin-bottom: 20px;
-                transition: transform 0.2s;
-            }
-            .card:hover {
-                transform: translateY(-2px);
-            }
-            .card-header {
-                background-color: white;
-                border-bottom: 1px solid rgba(0,0,0,0.05);
-                font-weight: 600;
-            }
-            .status-badge {
-                padding: 5px 10px;
-                border-radius: 20px;
-                font-size: 0.8rem;
-                font-weight: 500;
-                display: inline-block;
-            }
-            .status-active {
-                background-color: #e6f7ee;
-                color: #10b981;
-            }
-            .status-inactive {
-                background-color: #fef3f2;
-                color: #f04438;
-            }
-            .status-warning {
-                background-color: #fffaeb;
-                color: #f79009;
-            }
-            .kpi-value {
-                font-size: 1.75rem;
-                font-weight: 600;
-                margin: 5px 0;
-            }
-            .kpi-label {
-                color: #6c757d;
-                font-size: 0.875rem;
-                margin-bottom: 0.25rem;
-            }
-            .kpi-card {
-                padding: 1.25rem;
-            }
-            .chart-container {
-                height: 300px;
-                width: 100%;
-            }
-            .activity-item {
-                padding: 0.75rem 0;
-                border-bottom: 1px solid rgba(0,0,0,0.05);
-            }
-            .activity-time {
-                font-size: 0.75rem;
-                color: #6c757d;
+            kpis_data = {
+                'active_slices': int(kpis_from_db.get('active_slices', 0)) if kpis_from_db else 0,
+                'total_devices': int(kpis_from_db.get('total_devices', 0)) if kpis_from_db else 0,
+                'avg_latency': round(float(kpis_from_db.get('avg_latency', 0.0) or 0), 2),
+                'alerts': int(kpis_from_db.get('alerts', 0)) if kpis_from_db else 0
             }
-        </style>
-    </head>
-    <body>
-        <div class="container-fluid">
-            <!-- Header -->
-            <div class="d-flex justify-content-between align-items-center mb-4">
-                <div>
-                    <h1 class="mb-1">5G Network Slice Manager</h1>
-                    <p class="text-muted mb-0">Monitor and manage your 5G network slices in real-time</p>
-                </div>
-                <div class="d-flex align-items-center">
-                    <div class="me-3">
-                        <div class="text-end">
-                            <div class="text-muted small">Last updated</div>
-                            <div>{{ now.strftime('%H:%M:%S') }}</div>
-                        </div>
-                    </div>
-                    <div class="dropdown">
-                        <button class="btn btn-light dropdown-toggle" type="button" id="userDropdown" data-bs-toggle="dropdown" aria-expanded="false">
-                            <i class="bi bi-person-circle me-1"></i>
-                            Admin User
-                        </button>
-                        <ul class="dropdown-menu dropdown-menu-end" aria-labelledby="userDropdown">
-                            <li><a class="dropdown-item" href="#"><i class="bi bi-person me-2"></i>Profile</a></li>
-                            <li><a class="dropdown-item" href="#"><i class="bi bi-gear me-2"></i>Settings</a></li>
-                            <li><hr class="dropdown-divider"></li>
-                            <li><a class="dropdown-item text-danger" href="#"><i class="bi bi-box-arrow-right me-2"></i>Logout</a></li>
-                        </ul>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- KPI Cards -->
-            <div class="row g-4 mb-4">
-                <div class="col-md-3">
-                    <div class="card h-100">
-                        <div class="card-body kpi-card">
-                            <div class="d-flex justify-content-between align-items-start">
-                                <div>
-                                    <div class="kpi-label">Active Slices</div>
-                                    <div class="kpi-value text-primary">{{ kpis.active_slices }}</div>
-                                    <div class="text-success small"><i class="bi bi-arrow-up"></i> 12% from last hour</div>
-                                </div>
-                                <div class="bg-primary bg-opacity-10 p-3 rounded">
-                                    <i class="bi bi-diagram-3 text-primary" style="font-size: 1.5rem;"></i>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-3">
-                    <div class="card h-100">
-                        <div class="card-body kpi-card">
-                            <div class="d-flex justify-content-between align-items-start">
-                                <div>
-                                    <div class="kpi-label">Connected Devices</div>
-                                    <div class="kpi-value text-success">{{ "{:,}".format(kpis.total_devices) }}</div>
-                                    <div class="text-success small"><i class="bi bi-arrow-up"></i> 5.2% from last hour</div>
-                                </div>
-                                <div class="bg-success bg-opacity-10 p-3 rounded">
-                                    <i class="bi bi-phone text-success" style="font-size: 1.5rem;"></i>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-3">
-                    <div class="card h-100">
-                        <div class="card-body kpi-card">
-                            <div class="d-flex justify-content-between align-items-start">
-                                <div>
-                                    <div class="kpi-label">Avg. Latency</div>
-                                    <div class="kpi-value text-warning">{{ "%.2f"|format(kpis.avg_latency) }} ms</div>
-                                    <div class="text-danger small"><i class="bi bi-arrow-up"></i> 8.3% from last hour</div>
-                                </div>
-                                <div class="bg-warning bg-opacity-10 p-3 rounded">
-                                    <i class="bi bi-speedometer2 text-warning" style="font-size: 1.5rem;"></i>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-3">
-                    <div class="card h-100">
-                        <div class="card-body kpi-card">
-                            <div class="d-flex justify-content-between align-items-start">
-                                <div>
-                                    <div class="kpi-label">Active Alerts</div>
-                                    <div class="kpi-value text-danger">{{ kpis.alerts }}</div>
-                                    <div class="text-success small"><i class="bi bi-arrow-down"></i> 2 from last hour</div>
-                                </div>
-                                <div class="bg-danger bg-opacity-10 p-3 rounded">
-                                    <i class="bi bi-exclamation-triangle text-danger" style="font-size: 1.5rem;"></i>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Main Content -->
-            <div class="row g-4">
-                <!-- Left Column -->
-                <div class="col-lg-8">
-                    <!-- Throughput Chart -->
-                    <div class="card mb-4">
-                        <div class="card-header d-flex justify-content-between align-items-center">
-                            <h5 class="mb-0">Network Throughput</h5>
-                            <div class="btn-group" role="group">
-                                <button type="button" class="btn btn-sm btn-outline-secondary active" onclick="updateTimeRange('1h', this)">1H</button>
-                                <button type="button" class="btn btn-sm btn-outline-secondary" onclick="updateTimeRange('6h', this)">6H</button>
-                                <button type="button" class="btn btn-sm btn-outline-secondary" onclick="updateTimeRange('24h', this)">24H</button>
-                            </div>
-                        </div>
-                        <div class="card-body">
-                            <div id="throughputChart" class="chart-container" style="height: 300px;"></div>
-                            <div class="mt-2 d-flex justify-content-between">
-                                <small class="text-muted">Min: <span id="minThroughput">0</span> Mbps</small>
-                                <small class="text-muted">Avg: <span id="avgThroughput">0</span> Mbps</small>
-                                <small class="text-muted">Max: <span id="maxThroughput">0</span> Mbps</small>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Latency Chart -->
-                    <div class="card mb-4">
-                        <div class="card-header">
-                            <h5 class="mb-0">Network Latency</h5>
-                        </div>
-                        <div class="card-body">
-                            <div id="latencyChart" class="chart-container" style="height: 250px;"></div>
-                            <div class="mt-2 d-flex justify-content-between">
-                                <small class="text-muted">Min: <span id="minLatency">0</span> ms</small>
-                                <small class="text-muted">Avg: <span id="avgLatency">0</span> ms</small>
-                                <small class="text-muted">Max: <span id="maxLatency">0</span> ms</small>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Network Slices Table -->
-                    <div class="card">
-                        <div class="card-header d-flex justify-content-between align-items-center">
-                            <h5 class="mb-0">Network Slices</h5>
-                            <button class="btn btn-primary btn-sm" data-bs-toggle="modal" data-bs-target="#createSliceModal">
-                                <i class="bi bi-plus-lg me-1"></i> Create Slice
-                            </button>
-                        </div>
-                        <div class="card-body p-0">
-                            <div class="table-responsive">
-                                <table class="table table-hover mb-0">
-                                    <thead class="table-light">
-                                        <tr>
-                                            <th>Slice ID</th>
-                                            <th>Name</th>
-                                            <th>Status</th>
-                                            <th>Users</th>
-                                            <th>Type</th>
-                                            <th>Capacity</th>
-                                            <th>Actions</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-                                        {% if slices %}
-                                            <!-- Debug: Showing number of slices -->
-                                            <script>console.log('Rendering {{ slices|length }} slices');</script>
-                                            {% for slice in slices %}
-                                            <tr>
-                                                <td>{{ slice.id }}</td>
-                                                <td>{{ slice.name }}</td>
-                                                <td>
-                                                    <span class="badge bg-{{ 'success' if slice.status|lower == 'active' else 'secondary' }}">
-                                                        {{ slice.status }}
-                                                    </span>
-                                                </td>
-                                                <td>{{ slice.connected_devices or 0 }}</td>
-                                                <td>{{ slice.type }}</td>
-                                                <td>
-                                                    <div class="d-flex align-items-center">
-                                                        {% set capacity = slice.capacity|default('0%')
-                                                           if slice.capacity is string
-                                                           else '0%' %}
-                                                        {% set width = capacity|replace('%', '')|int %}
-                                                        <div class="progress flex-grow-1 me-2" style="height: 6px;">
-                                                            <div class="progress-bar bg-{{ 'success' if width < 80 else 'warning' if width < 95 else 'danger' }}" 
-                                                                 style="width: {{ width }}%">
-                                                            </div>
-                                                        </div>
-                                                        <small class="text-muted">{{ capacity }}</small>
-                                                    </div>
-                                                </td>
-                                                <td>
-                                                    <div class="dropdown">
-                                                        <button class="btn btn-link text-muted p-0" type="button" data-bs-toggle="dropdown">
-                                                            <i class="bi bi-three-dots-vertical"></i>
-                                                        </button>
-                                                        <ul class="dropdown-menu">
-                                                            <li><a class="dropdown-item" href="#"><i class="bi bi-eye me-2"></i>View</a></li>
-                                                            <li><a class="dropdown-item" href="#"><i class="bi bi-pencil me-2"></i>Edit</a></li>
-                                                            {% if slice.status|lower == 'active' %}
-                                                            <li><a class="dropdown-item text-danger" href="#"><i class="bi bi-power me-2"></i>Deactivate</a></li>
-                                                            {% else %}
-                                                            <li><a class="dropdown-item text-success" href="#"><i class="bi bi-power me-2"></i>Activate</a></li>
-                                                            {% endif %}
-                                                        </ul>
-                                                    </div>
-                                                </td>
-                                            </tr>
-                                            {% endfor %}
-                                        {% else %}
-                                            <tr>
-                                                <td colspan="7" class="text-center text-muted py-4">
-                                                    <i class="bi bi-inbox" style="font-size: 2rem; opacity: 0.5;"></i>
-                                                    <p class="mt-2 mb-0">No slices found. Create your first slice to get started.</p>
-                                                </td>
-                                            </tr>
-                                        {% endif %}
-                                    </tbody>
-                                </table>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Right Column -->
-                <div class="col-lg-4">
-                    <!-- Activity Feed -->
-                    <div class="card mb-4">
-                        <div class="card-header">
-                            <h5 class="mb-0">Activity Feed</h5>
-                        </div>
-                        <div class="card-body p-0">
-                            <div class="list-group list-group-flush">
-                                {% for activity in activities %}
-                                <div class="list-group-item border-0">
-                                    <div class="d-flex align-items-start">
-                                        <div class="me-3">
-                                            {% if activity.type == 'alert_triggered' %}
-                                            <div class="bg-danger bg-opacity-10 p-2 rounded-circle">
-                                                <i class="bi bi-exclamation-triangle-fill text-danger"></i>
-                                            </div>
-                                            {% elif activity.type == 'device_connect' %}
-                                            <div class="bg-success bg-opacity-10 p-2 rounded-circle">
-                                                <i class="bi bi-phone-fill text-success"></i>
-                                            </div>
-                                            {% else %}
-                                            <div class="bg-primary bg-opacity-10 p-2 rounded-circle">
-                                                <i class="bi bi-sliders text-primary"></i>
-                                            </div>
-                                            {% endif %}
-                                        </div>
-                                        <div class="flex-grow-1">
-                                            <div class="d-flex justify-content-between">
-                                                <h6 class="mb-1">{{ activity.message }}</h6>
-                                                <small class="text-muted">{{ activity.timestamp.split(' ')[1] }}</small>
-                                            </div>
-                                            <small class="text-muted">{{ activity.timestamp.split(' ')[0] }}</small>
-                                        </div>
-                                    </div>
-                                </div>
-                                {% endfor %}
-                            </div>
-                        </div>
-                        <div class="card-footer bg-transparent border-top-0">
-                            <a href="#" class="btn btn-link text-decoration-none p-0">View all activity</a>
-                        </div>
-                    </div>
-                    
-                    <!-- System Status -->
-                    <div class="card">
-                        <div class="card-header">
-                            <h5 class="mb-0">System Status</h5>
-                        </div>
-                        <div class="card-body">
-                            <div class="mb-3">
-                                <div class="d-flex justify-content-between mb-1">
-                                    <span>CPU Usage</span>
-                                    <span class="text-muted">45%</span>
-                                </div>
-                                <div class="progress" style="height: 8px;">
-                                    <div class="progress-bar bg-info" role="progressbar" style="width: 45%" aria-valuenow="45" aria-valuemin="0" aria-valuemax="100"></div>
-                                </div>
-                            </div>
-                            <div class="mb-3">
-                                <div class="d-flex justify-content-between mb-1">
-                                    <span>Memory</span>
-                                    <span class="text-muted">65%</span>
-                                </div>
-                                <div class="progress" style="height: 8px;">
-                                    <div class="progress-bar bg-warning" role="progressbar" style="width: 65%" aria-valuenow="65" aria-valuemin="0" aria-valuemax="100"></div>
-                                </div>
-                            </div>
-                            <div>
-                                <div class="d-flex justify-content-between mb-1">
-                                    <span>Storage</span>
-                                    <span class="text-muted">32%</span>
-                                </div>
-                                <div class="progress" style="height: 8px;">
-                                    <div class="progress-bar bg-success" role="progressbar" style="width: 32%" aria-valuenow="32" aria-valuemin="0" aria-valuemax="100"></div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Create Slice Modal -->
-        <div class="modal fade" id="createSliceModal" tabindex="-1" aria-labelledby="createSliceModalLabel" aria-hidden="true">
-            <div class="modal-dialog">
-                <div class="modal-content">
-                    <div class="modal-header">
-                        <h5 class="modal-title" id="createSliceModalLabel">Create New Slice</h5>
-                        <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-                    </div>
-                    <div class="modal-body">
-                        <form id="createSliceForm">
-                            <div class="mb-3">
-                                <label for="sliceName" class="form-label">Slice Name <span class="text-danger">*</span></label>
-                                <input type="text" class="form-control" id="sliceName" required>
-                            </div>
-                            <div class="mb-3">
-                                <label for="sliceDescription" class="form-label">Description</label>
-                                <textarea class="form-control" id="sliceDescription" rows="3" placeholder="Optional description for the slice"></textarea>
-                            </div>
-                            <div class="row g-3">
-                                <div class="col-md-4">
-                                    <label for="maxThroughput" class="form-label">Max Throughput (Mbps)</label>
-                                    <input type="number" class="form-control" id="maxThroughput" value="1000.0" min="1" step="0.1">
-                                </div>
-                                <div class="col-md-4">
-                                    <label for="maxLatency" class="form-label">Max Latency (ms)</label>
-                                    <input type="number" class="form-control" id="maxLatency" value="50.0" min="1" step="0.1">
-                                </div>
-                                <div class="col-md-4">
-                                    <label for="maxDevices" class="form-label">Max Devices</label>
-                                    <input type="number" class="form-control" id="maxDevices" value="1000" min="1">
-                                </div>
-                            </div>
-                        </form>
-                    </div>
-                    <div class="modal-footer">
-                        <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Cancel</button>
-                        <button type="button" class="btn btn-primary" id="confirmCreateSlice">Create New Slice</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Security Footer with Icons -->
-        <footer id="security-footer" class="mt-auto py-3 bg-light" style="font-size: 0.8rem; color: #6c757d; border-top: 1px solid #e9ecef;">
-            <div class="container">
-                <div class="row align-items-center">
-                    <div class="col-12">
-                        <div id="security-hash" class="d-flex flex-wrap justify-content-center align-items-center gap-4">
-                            <div class="d-flex align-items-center">
-                                <i class="bi bi-person-fill me-2" title="Developer"></i>
-                                <span>Ian Reuben Siangani</span>
-                            </div>
-                            <div class="d-flex align-items-center">
-                                <i class="bi bi-envelope-fill me-2" title="Email"></i>
-                                <a href="mailto:ireuben03@gmail.com" class="text-muted text-decoration-none">ireuben03@gmail.com</a>
-                            </div>
-                            <div class="d-flex align-items-center">
-                                <i class="bi bi-github me-2" title="GitHub"></i>
-                                <a href="https://github.com/isiangani1" target="_blank" class="text-muted text-decoration-none">github.com/isiangani1</a>
-                            </div>
-                            <div class="d-flex align-items-center">
-                                <i class="bi bi-telephone-fill me-2" title="Phone"></i>
-                                <a href="tel:+254799319387" class="text-muted text-decoration-none">+254 799 319 387</a>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </footer>
-
-        <!-- Toast Notification -->
-        <div class="position-fixed bottom-0 end-0 p-3" style="z-index: 11">
-            <div id="successToast" class="toast" role="alert" aria-live="assertive" aria-atomic="true">
-                <div class="toast-header">
-                    <strong class="me-auto toast-title">Notification</strong>
-                    <button type="button" class="btn-close" data-bs-dismiss="toast" aria-label="Close"></button>
-                </div>
-                <div class="toast-body d-flex align-items-center">
-                    <i class="bi me-2 toast-icon"></i>
-                    <span id="toastMessage">Slice created successfully!</span>
-                </div>
-            </div>
-        </div>
-
-        <!-- Scripts -->
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-        <script src="https://cdn.plot.ly/plotly-2.24.1.min.js"></script>
-        <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css">
-        <script>
-            // Initialize tooltips
-            document.addEventListener('DOMContentLoaded', function() {
-                // Initialize tooltips
-                var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]'));
-                tooltipTriggerList.forEach(function (tooltipTriggerEl) {
-                    new bootstrap.Tooltip(tooltipTriggerEl);
-                });
-                
-                // Initialize toast with options
-                const toastEl = document.getElementById('successToast');
-                if (toastEl) {
-                    window.successToast = new bootstrap.Toast(toastEl, {
-                        autohide: true,
-                        delay: 5000
-                    });
-                }
-                
-                // Initialize charts if the function exists
-                if (typeof initCharts === 'function') {
-                    initCharts();
-                }
-                
-                // Initialize stats if the function exists
-                if (typeof updateStats === 'function') {
-                    updateStats();
-                }
-            });
             
-            // Handle create slice form submission
-            document.addEventListener('DOMContentLoaded', function() {
-                console.log('DOM fully loaded, setting up event listeners...');
-                
-                const confirmButton = document.getElementById('confirmCreateSlice');
-                const createSliceForm = document.getElementById('createSliceForm');
-                
-                if (confirmButton) {
-                    console.log('Found confirm button, adding click event listener');
-                    confirmButton.addEventListener('click', handleCreateSlice);
-                } else {
-                    console.error('Create slice button not found');
-                }
-                
-                if (createSliceForm) {
-                    console.log('Found create slice form, adding submit event listener');
-                    createSliceForm.addEventListener('submit', function(e) {
-                        e.preventDefault();
-                        handleCreateSlice();
-                    });
-                    
-                    // Debug: Log all form elements
-                    console.log('Form elements:', Array.from(createSliceForm.elements).map(el => ({
-                        id: el.id,
-                        name: el.name,
-                        value: el.value,
-                        type: el.type
-                    })));
-                }
-            });
+            # If we have no active slices but we have slices_data, update the count
+            if kpis_data['active_slices'] == 0 and slices_data:
+                active_count = sum(1 for s in slices_data if s.get('status') == 'active')
+                kpis_data['active_slices'] = active_count
             
-            async function handleCreateSlice() {
-                console.log('Create slice function called');
-                const name = document.getElementById('sliceName')?.value.trim();
-                const description = document.getElementById('sliceDescription')?.value.trim();
-                const maxThroughput = parseFloat(document.getElementById('maxThroughput')?.value || '0');
-                const maxLatency = parseFloat(document.getElementById('maxLatency')?.value || '0');
-                const maxDevices = parseInt(document.getElementById('maxDevices')?.value || '0');
-                const createButton = document.getElementById('confirmCreateSlice');
-                
-                console.log('Form values:', { name, description, maxThroughput, maxLatency, maxDevices });
-                
-                // Validate inputs
-                if (!name) {
-                    showToast('Please enter a slice name', 'warning');
-                    return;
-                }
-
-                if (isNaN(maxThroughput) || maxThroughput <= 0) {
-                    showToast('Please enter a valid maximum throughput', 'warning');
-                    return;
-                }
-
-                if (isNaN(maxLatency) || maxLatency <= 0) {
-                    showToast('Please enter a valid maximum latency', 'warning');
-                    return;
-                }
-
-                if (isNaN(maxDevices) || maxDevices <= 0) {
-                    showToast('Please enter a valid maximum number of devices', 'warning');
-                    return;
-                }
-
-                try {
-                    // Show loading state
-                    createButton.disabled = true;
-                    const originalButtonText = createButton.innerHTML;
-                    createButton.innerHTML = '<span class="spinner-border spinner-border-sm" role="status" aria-hidden="true"></span> Creating...';
-
-                    console.log('Sending request to /api/create-slice with data:', {
-                        name,
-                        description,
-                        max_throughput: maxThroughput,
-                        max_latency: maxLatency,
-                        max_devices: maxDevices
-                    });
-
-                    const response = await fetch('/api/create-slice', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                            'X-Requested-With': 'XMLHttpRequest',
-                            'Accept': 'application/json'
-                        },
-                        body: JSON.stringify({
-                            name,
-                            description,
-                            max_throughput: maxThroughput,
-                            max_latency: maxLatency,
-                            max_devices: maxDevices
-                        })
-                    });
-
-                    console.log('Response status:', response.status, response.statusText);
-                    
-                    let result;
-                    try {
-                        const responseText = await response.text();
-                        console.log('Raw response:', responseText);
-                        result = responseText ? JSON.parse(responseText) : {};
-                    } catch (e) {
-                        console.error('Error parsing JSON response:', e);
-                        throw new Error('Invalid response from server');
-                    }
-
-                    if (!response.ok) {
-                        console.error('Server error:', result);
-                        const errorMessage = result.details || result.error || 'Failed to create slice';
-                        throw new Error(errorMessage);
-                    }
-
-                    // Show success message
-                    showToast('Slice created successfully!', 'success');
-                    
-                    // Close modal
-                    const modalEl = document.getElementById('createSliceModal');
-                    if (modalEl) {
-                        const modal = bootstrap.Modal.getInstance(modalEl) || new bootstrap.Modal(modalEl);
-                        modal.hide();
-                        
-                        // Reset form after modal is hidden
-                        modalEl.addEventListener('hidden.bs.modal', function onModalHidden() {
-                            const form = document.getElementById('createSliceForm');
-                            if (form) form.reset();
-                            modalEl.removeEventListener('hidden.bs.modal', onModalHidden);
-                            
-                            // Reload the page to show the new slice
-                            window.location.reload();
-                        }, { once: true });
-                    } else {
-                        // If modal can't be found, just reload after a short delay
-                        const form = document.getElementById('createSliceForm');
-                        if (form) form.reset();
-                        setTimeout(() => {
-                            window.location.reload();
-                        }, 1000);
-                    }
-                } catch (error) {
-                    console.error('Error:', error);
-                    showToast(error.message || 'An error occurred while creating the slice', 'danger');
-                } finally {
-                    // Reset button state
-                    if (createButton) {
-                        createButton.disabled = false;
-                        createButton.innerHTML = originalButtonText;
-                    }
-                }
-            }
-
-            function showToast(message, type = 'info') {
-                const toastEl = document.getElementById('successToast');
-                if (!toastEl) {
-                    console.error('Toast element not found');
-                    return;
-                }
-                
-                // Update toast content
-                const toastTitle = toastEl.querySelector('.toast-title');
-                const toastMessage = toastEl.querySelector('#toastMessage');
-                const toastIcon = toastEl.querySelector('.toast-icon');
-                
-                // Set title and message
-                const titleMap = {
-                    'success': 'Success',
-                    'warning': 'Warning',
-                    'danger': 'Error',
-                    'info': 'Info'
-                };
-                
-                const iconMap = {
-                    'success': 'bi-check-circle-fill',
-                    'warning': 'bi-exclamation-triangle-fill',
-                    'danger': 'bi-x-circle-fill',
-                    'info': 'bi-info-circle-fill'
-                };
-                
-                // Update title and icon
-                toastTitle.textContent = titleMap[type] || 'Notification';
-                
-                // Reset and set icon class
-                toastIcon.className = 'bi me-2 toast-icon ' + (iconMap[type] || 'bi-info-circle-fill');
-                
-                // Update message
-                toastMessage.textContent = message;
-                
-                // Update header color
-                const toastHeader = toastEl.querySelector('.toast-header');
-                toastHeader.className = `toast-header bg-${type} text-white`;
-                
-                // Show the toast
-                const toast = bootstrap.Toast.getInstance(toastEl) || new bootstrap.Toast(toastEl, {
-                    autohide: true,
-                    delay: 5000
-                });
-                toast.show();
-                
-                // Auto-hide after delay
-                setTimeout(() => {
-                    toast.hide();
-                }, 5000);
-            }
-            </script>
-            <script>
-            // Initialize tooltips
-            var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]'));
-            var tooltipList = tooltipTriggerList.map(function (tooltipTriggerEl) {
-                return new bootstrap.Tooltip(tooltipTriggerEl);
-            });
+            # If we have no devices but have slices, calculate from slices
+            if kpis_data['total_devices'] == 0 and slices_data:
+                total_devices = sum(int(s.get('connected_devices', 0)) for s in slices_data)
+                kpis_data['total_devices'] = total_devices
             
-            // Initialize charts when DOM is fully loaded
-            document.addEventListener('DOMContentLoaded', function() {
-                // Get data from the template
-                const timestamps = {{ timestamps|tojson|safe }} || [];
-                let throughput = {{ throughput|tojson|safe }} || [];
-                let latency = {{ latency|tojson|safe }} || [];
-                
-                // Debug logging
-                console.log('Timestamps:', timestamps);
-                console.log('Throughput:', throughput);
-                console.log('Latency:', latency);
-                
-                // Ensure we have valid data
-                if (throughput.length === 0 && latency.length === 0) {
-                    console.log('No data available, generating mock data...');
-                    const now = new Date();
-                    const mockTimestamps = [];
-                    const mockThroughput = [];
-                    const mockLatency = [];
-                    
-                    for (let i = 0; i < 12; i++) {
-                        const time = new Date(now - (11 - i) * 5 * 60000);
-                        mockTimestamps.push(time.getHours().toString().padStart(2, '0') + ':' + 
-                                         time.getMinutes().toString().padStart(2, '0'));
-                        mockThroughput.push(Math.max(10, 100 + Math.random() * 200));
-                        mockLatency.push(Math.max(1, 10 + Math.random() * 40));
-                    }
-                    
-                    // Use mock data
-                    if (timestamps.length === 0) timestamps.push(...mockTimestamps);
-                    if (throughput.length === 0) throughput.push(...mockThroughput);
-                    if (latency.length === 0) latency.push(...mockLatency);
-                    
-                    console.log('Using mock data:', {timestamps, throughput, latency});
-                }
-                
-                // Only initialize charts if Plotly is available
-                if (typeof Plotly !== 'undefined') {
-                    try {
-                        initializeCharts(timestamps, throughput, latency);
-                        
-                        // Update KPI values in the UI
-                        updateKPIValues({
-                            activeSlices: {{ kpis.active_slices|default(0) }},
-                            totalDevices: {{ kpis.total_devices|default(0) }},
-                            avgLatency: {{ kpis.avg_latency|default(0) }},
-                            activeAlerts: {{ kpis.alerts|default(0) }},
-                            minThroughput: {{ min_throughput|default(0) }},
-                            avgThroughput: {{ avg_throughput|default(0) }},
-                            maxThroughput: {{ max_throughput|default(0) }},
-                            minLatency: {{ min_latency|default(0) }},
-                            maxLatency: {{ max_latency|default(0) }}
-                        });
-                    } catch (error) {
-                        console.error('Error initializing charts:', error);
-                        // Show error message to user
-                        const container = document.getElementById('charts-container');
-                        if (container) {
-                            container.innerHTML = `
-                                <div class="alert alert-danger">
-                                    <i class="bi bi-exclamation-triangle-fill me-2"></i>
-                                    Error loading charts: ${error.message}
-                                </div>
-                            `;
-                        }
-                    }
-                } else {
-                    console.error('Plotly not loaded');
-                }
-            });
+            # If we have no latency data but have slices, calculate average
+            if kpis_data['avg_latency'] == 0 and slices_data:
+                latencies = [s.get('latency', 0) for s in slices_data if s.get('latency')]
+                if latencies:
+                    kpis_data['avg_latency'] = round(sum(latencies) / len(latencies), 2)
             
-            // Function to update KPI values in the UI
-            function updateKPIValues(kpis) {
-                // Update KPI cards
-                const updateElement = (id, value, suffix = '') => {
-                    const el = document.getElementById(id);
-                    if (el) {
-                        el.textContent = typeof value === 'number' ? value.toLocaleString() + (suffix ? ` ${suffix}` : '') : value;
-                    }
-                };
-                
-                // Update the KPI cards
-                updateElement('activeSlices', kpis.activeSlices);
-                updateElement('totalDevices', kpis.totalDevices);
-                updateElement('avgLatency', kpis.avgLatency, 'ms');
-                updateElement('activeAlerts', kpis.activeAlerts);
-                
-                // Update chart stats
-                updateElement('minThroughput', kpis.minThroughput, 'Mbps');
-                updateElement('avgThroughput', kpis.avgThroughput, 'Mbps');
-                updateElement('maxThroughput', kpis.maxThroughput, 'Mbps');
-                updateElement('minLatency', kpis.minLatency, 'ms');
-                updateElement('maxLatency', kpis.maxLatency, 'ms');
-            }
+            print(f"Final KPI Data: {kpis_data}")
             
-            function initializeCharts(timestamps, throughput, latency) {
-                console.log('Initializing charts...');
-                
-                // Calculate stats
-                function calculateStats(data) {
-                    if (!data || data.length === 0) return { min: 0, max: 0, avg: 0 };
-                    const min = Math.min(...data).toFixed(2);
-                    const max = Math.max(...data).toFixed(2);
-                    const avg = (data.reduce((a, b) => a + b, 0) / data.length).toFixed(2);
-                    return { min, max, avg };
-                }
-                
-                // Throughput Chart
-                const throughputTrace = {
-                    x: timestamps,
-                    y: throughput,
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    name: 'Throughput',
-                    line: {color: '#4361ee', width: 2},
-                    marker: {color: '#4361ee', size: 4},
-                    fill: 'tozeroy',
-                    fillcolor: 'rgba(67, 97, 238, 0.1)'
-                };
-                
-                const throughputLayout = {
-                    plot_bgcolor: 'rgba(0,0,0,0)',
-                    paper_bgcolor: 'rgba(0,0,0,0)',
-                    margin: {t: 30, b: 40, l: 50, r: 30},
-                    showlegend: false,
-                    xaxis: {
-                        showgrid: false,
-                        zeroline: false,
-                        showline: true,
-                        linecolor: '#e9ecef',
-                        linewidth: 1,
-                        tickfont: {size: 10, color: '#6c757d'}
-                    },
-                    yaxis: {
-                        title: 'Mbps',
-                        titlefont: {size: 12, color: '#6c757d'},
-                        tickfont: {size: 10, color: '#6c757d'},
-                        gridcolor: 'rgba(0,0,0,0.05)',
-                        zeroline: false,
-                        showline: true,
-                        linecolor: '#e9ecef',
-                        linewidth: 1
-                    },
-                    hovermode: 'x unified'
-                };
-                
-                // Latency Chart
-                const latencyTrace = {
-                    x: timestamps,
-                    y: latency,
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    name: 'Latency',
-                    line: {color: '#4cc9a0', width: 2},
-                    marker: {color: '#4cc9a0', size: 4},
-                    fill: 'tozeroy',
-                    fillcolor: 'rgba(76, 201, 160, 0.1)'
-                };
-                
-                const latencyLayout = {
-                    plot_bgcolor: 'rgba(0,0,0,0)',
-                    paper_bgcolor: 'rgba(0,0,0,0)',
-                    margin: {t: 30, b: 40, l: 50, r: 30},
-                    showlegend: false,
-                    xaxis: {
-                        showgrid: false,
-                        zeroline: false,
-                        showline: true,
-                        linecolor: '#e9ecef',
-                        linewidth: 1,
-                        tickfont: {size: 10, color: '#6c757d'}
-                    },
-                    yaxis: {
-                        title: 'ms',
-                        titlefont: {size: 12, color: '#6c757d'},
-                        tickfont: {size: 10, color: '#6c757d'},
-                        gridcolor: 'rgba(0,0,0,0.05)',
-                        zeroline: false,
-                        showline: true,
-                        linecolor: '#e9ecef',
-                        linewidth: 1
-                    },
-                    hovermode: 'x unified'
-                };
-                
-                // Create charts
-                const config = {responsive: true, displayModeBar: false};
-                Plotly.newPlot('throughputChart', [throughputTrace], throughputLayout, config);
-                Plotly.newPlot('latencyChart', [latencyTrace], latencyLayout, config);
+        except (TypeError, ValueError) as e:
+            print(f"Error formatting KPIs: {e}")
+            # Fallback to calculating from slices_data if available
+            if slices_data:
+                active_slices = sum(1 for s in slices_data if s.get('status') == 'active')
+                total_devices = sum(int(s.get('connected_devices', 0)) for s in slices_data)
+                latencies = [s.get('latency', 0) for s in slices_data if s.get('latency')]
+                avg_latency = round(sum(latencies) / len(latencies), 2) if latencies else 0.0
                 
-                // Update stats
-                function updateStats() {
-                    const tpStats = calculateStats(throughput);
-                    const ltStats = calculateStats(latency);
-                    
-                    const minTpEl = document.getElementById('minThroughput');
-                    const avgTpEl = document.getElementById('avgThroughput');
-                    const maxTpEl = document.getElementById('maxThroughput');
-                    const minLatEl = document.getElementById('minLatency');
-                    const avgLatEl = document.getElementById('avgLatency');
-                    const maxLatEl = document.getElementById('maxLatency');
-                    
-                    if (minTpEl) minTpEl.textContent = tpStats.min;
-                    if (avgTpEl) avgTpEl.textContent = tpStats.avg;
-                    if (maxTpEl) maxTpEl.textContent = tpStats.max;
-                    if (minLatEl) minLatEl.textContent = ltStats.min;
-                    if (avgLatEl) avgLatEl.textContent = ltStats.avg;
-                    if (maxLatEl) maxLatEl.textContent = ltStats.max;
+                kpis_data = {
+                    'active_slices': active_slices,
+                    'total_devices': total_devices,
+                    'avg_latency': avg_latency,
+                    'alerts': 0  # Default to 0 if we can't get alerts
                 }
-                
-                // Initial stats update
-                updateStats();
-                
-                // Time range selector
-                function updateTimeRange(range, element) {
-                    // Update active button
-                    document.querySelectorAll('.btn-group .btn').forEach(btn => {
-                        btn.classList.remove('active');
-                    });
-                    element.classList.add('active');
-                    
-                    // Here you would typically fetch new data based on the selected range
-                    // For now, we'll just update the x-axis range
-                    const now = new Date();
-                    let startTime;
-                    
-                    switch(range) {
-                        case '1h':
-                            startTime = new Date(now.getTime() - 60 * 60 * 1000);
-                            break;
-                        case '6h':
-                            startTime = new Date(now.getTime() - 6 * 60 * 60 * 1000);
-                            break;
-                        case '24h':
-                            startTime = new Date(now.getTime() - 24 * 60 * 60 * 1000);
-                            break;
-                        default:
-                            startTime = new Date(now.getTime() - 60 * 60 * 1000);
-                    }
-                    
-                    const update = {
-                        'xaxis.range': [startTime, now]
-                    };
-                    
-                    Plotly.relayout('throughputChart', update);
-                    Plotly.relayout('latencyChart', update);
-                    
-                    // In a real app, you would fetch new data here:
-                    // fetchNewData(range);
+            else:
+                kpis_data = {
+                    'active_slices': 0,
+                    'total_devices': 0,
+                    'avg_latency': 0.0,
+                    'alerts': 0
                 }
-                
-                // Expose the updateTimeRange function to the global scope
-                window.updateTimeRange = updateTimeRange;
-            }
-            
-            // Initial stats update
-            updateStats();
-            
-            // Handle window resize
-            function handleResize() {
-                Plotly.Plots.resize('throughputChart');
-                Plotly.Plots.resize('latencyChart');
-            }
-            
-            window.addEventListener('resize', handleResize);
-        </script>
-    </body>
-    </html>
-    """
-        
-        # Prepare the data for the template
-        now = datetime.now()
-        
-        # Ensure we have data for the charts
-        if not throughput_data or not latency_data or not timestamps_data:
-            print("No chart data available, generating mock data...")
-            # Generate mock data with realistic values
-            timestamps_data = [(now - timedelta(minutes=i*5)).strftime('%H:%M') 
-                             for i in reversed(range(12))]
-            
-            # Generate realistic throughput data (Mbps)
-            base_throughput = random.uniform(50, 200)
-            throughput_data = [max(10, base_throughput + random.uniform(-20, 50)) for _ in range(12)]
-            
-            # Generate realistic latency data (ms)
-            base_latency = random.uniform(10, 30)
-            latency_data = [max(1, base_latency + random.uniform(-5, 10)) for _ in range(12)]
         
-        # Ensure we have valid KPI data
-        if not kpis_data or all(v == 0 for v in kpis_data.values()):
-            print("No valid KPI data, using mock data...")
-            kpis_data = {
-                'active_slices': random.randint(1, 5),
-                'total_devices': random.randint(10, 100),
-                'avg_latency': round(random.uniform(5, 50), 2),
-                'alerts': random.randint(0, 5)
-            }
+        print(f"Retrieved KPIs: {kpis_data}")
         
-        # Calculate min/max/avg for the charts
-        min_throughput = min(throughput_data) if throughput_data else 0
-        max_throughput = max(throughput_data) if throughput_data else 0
-        avg_throughput = sum(throughput_data) / len(throughput_data) if throughput_data else 0
-        
-        min_latency = min(latency_data) if latency_data else 0
-        max_latency = max(latency_data) if latency_data else 0
-        avg_latency = sum(latency_data) / len(latency_data) if latency_data else 0
+        print("Fetching recent activity...")
+        # Rows arrive newest-first from the indexed alerts.timestamp column,
+        # so no Python-side sort on the formatted strings is needed
+        activity_from_db = await get_activity_from_db(limit=10)
+        activities_data = []
+        t = time.localtime()
+        fallback_date = f'{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}'
+        fallback_time = f'{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}'
         
-        # Ensure we have at least one timestamp
-        if not timestamps_data and (throughput_data or latency_data):
-            timestamps_data = [str(i) for i in range(max(len(throughput_data), len(latency_data)))]
+        # Map activity data to the format expected by the template; date and time
+        # are split here once so the feed renderer only interpolates them
+        for activity in activity_from_db:
+            timestamp = activity.get('timestamp')
+            if not timestamp:
+                date_str, time_str = fallback_date, fallback_time
+            elif isinstance(timestamp, datetime):
+                date_str = f'{timestamp.year:04d}-{timestamp.month:02d}-{timestamp.day:02d}'
+                time_str = f'{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}'
+            else:
+                date_str, _, time_str = str(timestamp).partition(' ')
+            
+            activity_type = 'alert_triggered' if activity.get('level') == 'ERROR' else 'device_connect'
+            color, icon = ACTIVITY_ICONS.get(activity_type, DEFAULT_ACTIVITY_ICON)
+            activities_data.append({
+                'type': activity_type,
+                'color': color,
+                'icon': icon,
+                'message': activity.get('message', 'No message'),
+                'timestamp': f"{date_str} {time_str}",
+                'date_str': date_str,
+                'time_str': time_str
+            })
         
-        # Debug output
-        print("Rendering template with data:")
-        print(f"- Slices: {len(slices_data)}")
-        print(f"- KPIs: {kpis_data}")
-        print(f"- Activities: {len(activities_data)}")
-        print(f"- Chart data points: {len(timestamps_data)} timestamps, {len(throughput_data)} throughput, {len(latency_data)} latency")
+        print(f"Retrieved {len(activities_data)} activities")
         
+        # Generate mock data for charts if no real data
         try:
-            return render_template_string(
-                template,
-                slices=slices_data,
-                kpis=kpis_data,
-                activities=activities_data,
-                timestamps=timestamps_data,
-                throughput=throughput_data,
-                latency=latency_data,
-                now=now,
-                min_throughput=round(min_throughput, 2),
-                max_throughput=round(max_throughput, 2),
-                avg_throughput=round(avg_throughput, 2),
-                min_latency=round(min_latency, 2),
-                max_latency=round(max_latency, 2),
-                avg_latency=round(avg_latency, 2)
-            )
+            if slices_data:
+                # Get the first slice's data for the charts
+                first_slice_id = slices_data[0]['id']
+                print(f"Fetching throughput/latency data for slice {first_slice_id}...")
+                result = await get_throughput_latency_from_db(first_slice_id)
+                
+                if isinstance(result, tuple) and len(result) == 3:
+                    timestamps_data, throughput_data, latency_data = result
+                    # Ensure we have data
+                    if not throughput_data or not latency_data:
+                        raise ValueError("No data returned from get_throughput_latency_from_db")
+                        
+                    print(f"Retrieved {len(throughput_data)} throughput and {len(latency_data)} latency data points")
+                else:
+                    raise ValueError("Unexpected result format from get_throughput_latency_from_db")
+            else:
+                raise ValueError("No slices available")
+                
         except Exception as e:
-            print(f"Error rendering template: {e}")
-            return f"Error rendering dashboard: {str(e)}", 500
+            print(f"Error getting throughput/latency data: {e}")
+            print("Generating mock data for charts...")
+            # Generate mock data with realistic values
+            timestamps_data, throughput_data, latency_data = generate_mock_chart_data()
+            
+            print(f"Generated mock data: {len(throughput_data)} points, avg throughput: {sum(throughput_data)/len(throughput_data):.2f} Mbps, avg latency: {sum(latency_data)/len(latency_data):.2f} ms")
+            
     except Exception as e:
+        print(f"Error fetching dashboard data: {e}")
         import traceback
         traceback.print_exc()
-        return f"Error rendering dashboard: {str(e)}", 500
+        # Generate mock data if there's an error
+        timestamps_data, throughput_data, latency_data = generate_mock_chart_data()
+    
+    print("Assembling dashboard payload...")
+    
+    # Ensure we have data for the charts
+    if not throughput_data or not latency_data or not timestamps_data:
+        print("No chart data available, generating mock data...")
+        # Generate mock data with realistic values
+        timestamps_data, throughput_data, latency_data = generate_mock_chart_data()
+    
+    # Ensure we have valid KPI data
+    if not kpis_data or all(v == 0 for v in kpis_data.values()):
+        print("No valid KPI data, using mock data...")
+        active_slices, total_devices, alerts = _RNG.integers((1, 10, 0), (6, 101, 6)).tolist()
+        kpis_data = {
+            'active_slices': active_slices,
+            'total_devices': total_devices,
+            'avg_latency': round(float(_RNG.uniform(5, 50)), 2),
+            'alerts': alerts
+        }
+    
+    # Calculate min/max/avg for the charts over the full series; chart_figure
+    # downsamples what is plotted. Shipped precomputed, the browser does no math
+    tp_stats = series_stats(throughput_data)
+    lt_stats = series_stats(latency_data)
+    
+    # Ensure we have at least one timestamp
+    if not timestamps_data and (throughput_data or latency_data):
+        timestamps_data = [str(i) for i in range(max(len(throughput_data), len(latency_data)))]
+    
+    # Debug output
+    print("Dashboard payload:")
+    print(f"- Slices: {len(slices_data)}")
+    print(f"- KPIs: {kpis_data}")
+    print(f"- Activities: {len(activities_data)}")
+    print(f"- Chart data points: {len(timestamps_data)} timestamps, {len(throughput_data)} throughput, {len(latency_data)} latency")
+    
+    return {
+        'slices': slices_data,
+        'kpis': kpis_data,
+        'activities': activities_data,
+        'throughput_figure': chart_figure('throughput', timestamps_data, throughput_data),
+        'latency_figure': chart_figure('latency', timestamps_data, latency_data),
+        'throughput_stats': tp_stats,
+        'latency_stats': lt_stats
+    }
 
-# API Endpoints
-@app.route('/api/slices')
-@async_route
-async def get_slices():
-    """API endpoint to get all slices."""
+# Compiled once at import: rendering skips the loader lookup and the per-request
+# source mtime check. Debug mode keeps resolving by name so edits still reload.
+DASHBOARD_TEMPLATE = app.jinja_env.get_template('dashboard.html')
+
+@app.route('/dashboard')
+@cache.cached(response_filter=_cacheable)
+def dashboard():
+    """Render the dashboard shell; its data is fetched from /api/dashboard."""
     try:
-        slices = await get_slices_from_db()
-        return jsonify(slices)
+        template = 'dashboard.html' if app.debug else DASHBOARD_TEMPLATE
+        return render_template(template, now=datetime.now())
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        print(f"Error rendering template: {e}")
+        return f"Error rendering dashboard: {str(e)}", 500
 
-@app.route('/api/kpis')
+# API Endpoints
+@app.route('/api/dashboard')
+@cache.cached(response_filter=_cacheable)
 @async_route
-async def get_kpis():
-    """API endpoint to get KPI summary."""
+async def get_dashboard():
+    """API endpoint to get everything the dashboard renders in a single payload."""
     try:
-        kpis = await get_kpis_from_db()
-        return jsonify(kpis)
+        return orjson_response(await build_dashboard_data(), max_age=CACHE_TTL)
     except Exception as e:
+        import traceback
+        traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
-@app.route('/api/activity')
+@app.route('/api/series')
+@cache.cached(query_string=True, response_filter=_cacheable)
 @async_route
-async def get_activity():
-    """API endpoint to get recent activity."""
+async def get_series():
+    """API endpoint to get downsampled throughput/latency chart figures for a time range."""
     try:
-        limit = request.args.get('limit', default=10, type=int)
-        activity = await get_activity_from_db(limit)
-        return jsonify(activity)
+        hours = SERIES_RANGES.get(request.args.get('range', '1h'))
+        if hours is None:
+            return jsonify({"error": f"range must be one of {', '.join(SERIES_RANGES)}"}), 400
+        
+        slice_id = request.args.get('slice_id')
+        if not slice_id:
+            slices = await get_slices_from_db()
+            slice_id = slices[0]['id'] if slices else None
+        
+        timestamps, throughput, latency = (
+            await get_throughput_latency_from_db(slice_id, hours) if slice_id else ([], [], [])
+        )
+        if not throughput:
+            # Placeholder data at the dashboard's 5-minute spacing
+            timestamps, throughput, latency = generate_mock_chart_data(hours * 12)
+        
+        return orjson_response({
+            'throughput_figure': chart_figure('throughput', timestamps, throughput),
+            'latency_figure': chart_figure('latency', timestamps, latency),
+            'throughput_stats': series_stats(throughput),
+            'latency_stats': series_stats(latency)
+        }, max_age=CACHE_TTL)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1863,11 +1115,6 @@ def md5_hash(text):
 # Register template filters
 app.jinja_env.filters['md5'] = md5_hash
 
-@app.template_filter('tojson')
-def to_json(value):
-    """Convert value to JSON."""
-    return json.dumps(value, indent=2)
-
 
 
 # Run directly with: python app.py
@@ -41,6 +41,7 @@ from datetime import datetime, timedelta
 
 # Import database models
 from app.db.models import Slice, Device, SliceKPI, Alert, Metric
+from app.core.cache import response_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -375,6 +376,7 @@ async def create_alert(session: AsyncSession, alert_data: Dict[str, Any]):
         alert = Alert(**alert_data)
         session.add(alert)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(alert)
         return alert
     except Exception as e:
@@ -399,6 +401,7 @@ async def update_alert(session: AsyncSession, alert_id: int, update_data: Dict[s
         alert.updated_at = datetime.utcnow()
         
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(alert)
         return alert
         
@@ -420,6 +423,7 @@ async def delete_alert(session: AsyncSession, alert_id: int):
             
         await session.delete(alert)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         return True
         
     except Exception as e:
@@ -718,6 +722,7 @@ async def create_kpi(session: AsyncSession, kpi_data: Dict[str, Any]):
         kpi = SliceKPI(**kpi_data)
         session.add(kpi)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(kpi)
         return kpi
     except Exception as e:
@@ -740,6 +745,7 @@ async def update_kpi(session: AsyncSession, kpi_id: int, update_data: Dict[str,
             setattr(kpi, key, value)
             
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(kpi)
         return kpi
         
@@ -761,6 +767,7 @@ async def delete_kpi(session: AsyncSession, kpi_id: int):
             
         await session.delete(kpi)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         return True
         
     except Exception as e:
@@ -852,6 +859,7 @@ async def create_metric(session: AsyncSession, metric_data: Dict[str, Any]):
         metric = Metric(**metric_data)
         session.add(metric)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(metric)
         return metric
     except Exception as e:
@@ -874,6 +882,7 @@ async def update_metric(session: AsyncSession, metric_id: int, update_data: Dict
             setattr(metric, key, value)
             
         await session.commit()
+        response_cache.invalidate("dashboard:")
         await session.refresh(metric)
         return metric
         
@@ -895,6 +904,7 @@ async def delete_metric(session: AsyncSession, metric_id: int):
             
         await session.delete(metric)
         await session.commit()
+        response_cache.invalidate("dashboard:")
         return True
         
     except Exception as e:
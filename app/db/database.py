@@ -6,7 +6,7 @@ import logging
 from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 from sqlalchemy.orm import sessionmaker, Session as SyncSession
 from sqlalchemy.engine import make_url
@@ -45,16 +45,21 @@ try:
         )
     else:
         # PostgreSQL/other database configuration
+        # No pre-ping: it costs a round trip on every checkout, and pool_recycle
+        # already retires connections before the server would drop them
         async_engine = create_async_engine(
-            db_url,
+            url.update_query_dict({
+                'prepared_statement_cache_size': str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+            }),
             echo=settings.DEBUG,
             future=True,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_pre_ping=False,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
             pool_timeout=30,
             pool_recycle=1800,
             connect_args={
+                'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
                 'server_settings': {
                     'application_name': '5g_slice_manager',
                     'timezone': 'UTC'
@@ -110,8 +115,13 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     finally:
         await session.close()
 
-# Alias for backward compatibility
-get_db = get_db_session
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding a session from get_db_session.
+    
+    Depends() needs a generator function, not the context manager itself.
+    """
+    async with get_db_session() as session:
+        yield session
 
 # Create sync session factory
 SessionLocal = sessionmaker(
@@ -126,9 +136,6 @@ SessionLocal = sessionmaker(
 from sqlalchemy.ext.declarative import declarative_base
 Base = declarative_base()
 
-# Alias for backward compatibility
-get_db = get_db_session
-
 # Sync database session (for migrations, etc.)
 @asynccontextmanager
 async def get_sync_db() -> AsyncGenerator[SyncSession, None]:
@@ -149,6 +156,26 @@ async def get_sync_db() -> AsyncGenerator[SyncSession, None]:
     finally:
         session.close()
 
+# Raw connection pool for hot read paths
+async def create_pg_pool():
+    """
+    Create an asyncpg pool for read endpoints that bypass ORM row materialization.
+    
+    Returns:
+        asyncpg.Pool, or None when the configured database is not PostgreSQL
+    """
+    pg_url = make_url(settings.DATABASE_URL_SYNC.split('?')[0])
+    if not pg_url.drivername.startswith("postgresql"):
+        return None
+    
+    import asyncpg
+    
+    return await asyncpg.create_pool(
+        pg_url.set(drivername="postgresql").render_as_string(hide_password=False),
+        min_size=settings.PG_POOL_MIN_SIZE,
+        max_size=settings.PG_POOL_MAX_SIZE
+    )
+
 # Database initialization
 async def init_db() -> None:
     """
@@ -165,9 +192,9 @@ async def init_db() -> None:
             logger.info("Database tables verified/created successfully")
             
         # Create default admin user if it doesn't exist
-        async with AsyncSessionLocal() as db:
+        async with async_session_factory() as db:
             from app.db.models import User
-            from app.core.security import get_password_hash
+            from app.core.security import get_password_hash_async
             
             try:
                 admin = await db.execute(
@@ -180,7 +207,7 @@ async def init_db() -> None:
                         username="admin",
                         email="admin@example.com",
                         full_name="Administrator",
-                        hashed_password=get_password_hash("admin"),
+                        hashed_password=await get_password_hash_async("admin"),
                         is_active=True,
                         is_superuser=True
                     )
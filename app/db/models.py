@@ -12,14 +12,12 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session as SQLAlchemySession
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func, text
+from sqlalchemy.sql import func, text, table, column, literal_column
 
 # Local application imports
 from .database import Base, async_engine, sync_engine
-
-# Password hashing
-from passlib.context import CryptContext
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
 
 # Pydantic configuration for models
 class BaseConfig:
@@ -111,8 +109,8 @@ class User(Base):
     )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    username: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -129,7 +127,7 @@ class User(Base):
     
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
-        self.hashed_password = pwd_context.hash(password)
+        self.hashed_password = get_password_hash(password)
     
     def verify_password(self, password: str) -> bool:
         """
@@ -141,7 +139,7 @@ class User(Base):
         Returns:
             bool: True if the password matches, False otherwise
         """
-        return pwd_context.verify(password, self.hashed_password)
+        return verify_password(password, self.hashed_password)
 
     @classmethod
     def get_user(cls, db: SQLAlchemySession, username: str):
@@ -405,15 +403,24 @@ class Metric(Base):
     """
     __tablename__ = "metrics"
     
-    # Primary key and timestamp
+    # Serves "latest metric per slice" lookups with a single ordered index scan
+    __table_args__ = (
+        Index('ix_metrics_slice_id_timestamp', 'slice_id', text('timestamp DESC')),
+    )
+    
+    # Primary key and timestamp. As a TimescaleDB hypertable (the metric_hourly
+    # migration) the key must include the partitioning column, so timestamp
+    # joins it when TIMESCALEDB_ENABLED.
     id: Mapped[int] = mapped_column(
         Integer, 
         primary_key=True, 
+        autoincrement=True,
         index=True,
         comment="Unique identifier for the metric record"
     )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        primary_key=settings.TIMESCALEDB_ENABLED,
         server_default=func.now(),
         index=True, 
         nullable=False,
@@ -516,6 +523,28 @@ class Metric(Base):
         }
 
 
+# Hourly per-slice rollup of ``metrics``, maintained by a TimescaleDB continuous
+# aggregate (see the metric_hourly Alembic migration). Declared as a lightweight
+# table so create_all() leaves it alone; only query it when TIMESCALEDB_ENABLED.
+metric_hourly = table(
+    "metric_hourly",
+    column("slice_id", String(36)),
+    column("hour", DateTime(timezone=True)),
+    column("avg_throughput", Float),
+    column("avg_latency", Float),
+    column("avg_packet_loss", Float),
+    column("samples", Integer),
+)
+
+# UTC hour bucket of a metric's timestamp. PostgreSQL indexes this expression
+# (ix_metrics_hour_bucket), so filtering on it alongside the raw timestamp lets
+# the planner skip whole buckets/chunks before reading rows. The arguments are
+# inlined literals because a bound parameter would not match the index expression.
+metric_hour_bucket = func.date_trunc(
+    literal_column("'hour'"), func.timezone(literal_column("'UTC'"), Metric.timestamp)
+)
+
+
 class Alert(Base):
     """Alert model for system and network events.
     
@@ -523,6 +552,21 @@ class Alert(Base):
     """
     __tablename__ = "alerts"
     
+    # Serves the (timestamp, id) keyset pages of active alerts in index order.
+    # Only the small fixed-width columns are included: message (Text) and
+    # context (JSON) are unbounded and would overflow a btree tuple, so they
+    # are read from the heap for the page's rows.
+    __table_args__ = (
+        Index(
+            'ix_alerts_active_timestamp',
+            text('timestamp DESC'),
+            text('id DESC'),
+            postgresql_where=text('resolved = false'),
+            postgresql_include=['level', 'entity_type', 'entity_id'],
+            sqlite_where=text('resolved = 0'),
+        ),
+    )
+    
     id: Mapped[int] = mapped_column(
         Integer, 
         primary_key=True, 
@@ -625,6 +669,11 @@ class SliceKPI(Base):
     """
     __tablename__ = "slice_kpis"
     
+    # Serves "latest KPI per slice" lookups with a single ordered index scan
+    __table_args__ = (
+        Index('ix_slice_kpis_slice_id_timestamp', 'slice_id', text('timestamp DESC')),
+    )
+    
     # Primary key and timestamp
     id = Column(Integer, primary_key=True, index=True,
               comment="Unique identifier for the KPI record")
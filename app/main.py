@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.wsgi import WSGIMiddleware
 import uvicorn
@@ -11,9 +12,14 @@ sys.path.append(str(project_root))
 
 # Import the Flask app from the dashboard module
 from app.dashboard.app import app as flask_app
+from app.api.overview import router as overview_router
 
 # Create FastAPI app
-app = FastAPI(title="5G Network Slice Manager")
+app = FastAPI(title="5G Network Slice Manager", default_response_class=ORJSONResponse)
+
+# The read-only dashboard API runs natively on the event loop. It must be
+# registered before the Flask mount below, which otherwise matches every path.
+app.include_router(overview_router)
 
 # Mount the Flask app at the root URL
 app.mount("/", WSGIMiddleware(flask_app))
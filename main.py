@@ -38,15 +38,17 @@ try:
     # Try to import Flask app
     try:
         from app.dashboard.app import app as flask_app
+        from app.api.overview import router as overview_router
         from werkzeug.middleware.proxy_fix import ProxyFix
         flask_app.wsgi_app = ProxyFix(flask_app.wsgi_app, x_proto=1, x_host=1)
         logger.info("Flask app imported successfully")
     except ImportError as e:
         logger.warning(f"Could not import Flask app: {e}")
         flask_app = None
+        overview_router = None
     
     # Import database and API components
-    from app.db.database import init_db, async_engine, Base, get_db
+    from app.db.database import init_db, async_engine, Base, get_db, create_pg_pool
     from app.db.models import User
     from app.api import api_router
     
@@ -57,13 +59,16 @@ try:
     from fastapi.middleware.wsgi import WSGIMiddleware
     from fastapi.openapi.docs import get_swagger_ui_html
     from fastapi.openapi.utils import get_openapi
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, Response
     from fastapi.staticfiles import StaticFiles
+    import orjson
     
 except Exception as e:
     logger.error(f"Failed to initialize application: {e}")
     raise
 
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application startup and shutdown events."""
@@ -76,9 +81,14 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}", exc_info=True)
         raise
     
+    # Raw asyncpg pool for the ORM-free dashboard read paths (None off PostgreSQL)
+    app.state.pg_pool = await create_pg_pool()
+    
     yield
     
     # Clean up resources on shutdown
+    if app.state.pg_pool is not None:
+        await app.state.pg_pool.close()
     await async_engine.dispose()
 
 def create_application() -> FastAPI:
@@ -93,12 +103,6 @@ def create_application() -> FastAPI:
         lifespan=lifespan
     )
     
-    # Mount Flask app if available
-    if flask_app is not None:
-        # Mount the Flask app without any static file configuration
-        app.mount("/", WSGIMiddleware(flask_app))
-        logger.info("Mounted Flask dashboard at /dashboard")
-    
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -109,7 +113,47 @@ def create_application() -> FastAPI:
     )
     
     # Include API routes
-    app.include_router(api_router, prefix="/api/v1")
+    app.include_router(api_router)
+    # Read-only feed polled by the Flask dashboard; like every route here it
+    # must be registered before the Flask mount below
+    if overview_router is not None:
+        app.include_router(overview_router)
+    
+    if settings.DEBUG:
+        # Connection pool occupancy, for sizing DB_POOL_SIZE / PG_POOL_MAX_SIZE
+        @app.get("/debug/pool", include_in_schema=False)
+        async def pool_status() -> Dict[str, Any]:
+            pool = async_engine.pool
+            stats = {
+                "sqlalchemy": {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                } if hasattr(pool, "checkedout") else {"status": pool.status()}
+            }
+            pg_pool = app.state.pg_pool
+            if pg_pool is not None:
+                stats["asyncpg"] = {
+                    "size": pg_pool.get_size(),
+                    "idle": pg_pool.get_idle_size(),
+                    "min_size": pg_pool.get_min_size(),
+                    "max_size": pg_pool.get_max_size(),
+                }
+            return stats
+    
+    # Health check endpoint. Liveness probes hit it constantly, so the body is
+    # serialized once; registered before the Flask mount, which would shadow it.
+    @app.get("/health", status_code=status.HTTP_200_OK, response_class=Response)
+    async def health_check() -> Response:
+        return Response(_HEALTH_BODY, media_type="application/json")
+    
+    # Mount Flask app if available. It catches every path, so it goes after the
+    # API routes; mounted first it would shadow them.
+    if flask_app is not None:
+        # Mount the Flask app without any static file configuration
+        app.mount("/", WSGIMiddleware(flask_app))
+        logger.info("Mounted Flask dashboard at /dashboard")
     
     # Root endpoint redirects to dashboard
     @app.get("/")
@@ -128,11 +172,6 @@ def create_application() -> FastAPI:
             swagger_css_url="/static/swagger-ui.css",
         )
     
-    # Health check endpoint
-    @app.get("/health", status_code=status.HTTP_200_OK)
-    async def health_check() -> Dict[str, str]:
-        return {"status": "ok"}
-    
     # Root endpoint
     @app.get("/")
     async def root() -> Dict[str, Any]:
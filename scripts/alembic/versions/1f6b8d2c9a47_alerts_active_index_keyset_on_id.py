@@ -0,0 +1,48 @@
+"""Rebuild the active alerts index on (timestamp, id) without unbounded columns
+
+Revision ID: 1f6b8d2c9a47
+Revises: e5a9c3f7b014
+Create Date: 2026-10-16 22:41:09.527918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f6b8d2c9a47'
+down_revision: Union[str, None] = 'e5a9c3f7b014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # message (Text) and context (JSON) are unbounded; in INCLUDE they make any
+    # alert too large for a btree tuple fail to insert
+    op.drop_index('ix_alerts_active_timestamp', table_name='alerts')
+    op.create_index(
+        'ix_alerts_active_timestamp',
+        'alerts',
+        [sa.text('timestamp DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('resolved = false'),
+        postgresql_include=['level', 'entity_type', 'entity_id'],
+        sqlite_where=sa.text('resolved = 0')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_alerts_active_timestamp', table_name='alerts')
+    op.create_index(
+        'ix_alerts_active_timestamp',
+        'alerts',
+        [sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_where=sa.text('resolved = false'),
+        postgresql_include=['id', 'level', 'message', 'entity_type', 'entity_id', 'context'],
+        sqlite_where=sa.text('resolved = 0')
+    )
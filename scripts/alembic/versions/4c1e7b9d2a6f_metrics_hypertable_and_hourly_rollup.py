@@ -0,0 +1,120 @@
+"""Convert metrics to a hypertable and add the metric_hourly rollup
+
+Revision ID: 4c1e7b9d2a6f
+Revises: 9af8ca2839e9
+Create Date: 2026-10-16 10:12:04.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e7b9d2a6f'
+down_revision: Union[str, None] = '9af8ca2839e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timescaledb_available() -> bool:
+    bind = op.get_bind()
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb'")
+    ).first() is not None
+
+
+def _metrics_is_hypertable() -> bool:
+    bind = op.get_bind()
+    if bind.execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")).first() is None:
+        return False
+    return bind.execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = 'metrics'"
+        )
+    ).first() is not None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Opt-in (TIMESCALEDB_ENABLED); plain PostgreSQL and other backends keep the
+    # plain metrics table. The Metric model declares the matching primary key.
+    if op.get_bind().dialect.name != 'postgresql' or not settings.TIMESCALEDB_ENABLED:
+        return
+    if not _timescaledb_available():
+        raise RuntimeError(
+            "TIMESCALEDB_ENABLED is set but the timescaledb extension is not "
+            "available on this PostgreSQL server"
+        )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+
+    # Every unique index on a hypertable must include the partitioning column
+    op.drop_constraint('metrics_pkey', 'metrics', type_='primary')
+    op.create_primary_key('metrics_pkey', 'metrics', ['id', 'timestamp'])
+    op.execute(
+        "SELECT create_hypertable('metrics', 'timestamp', "
+        "chunk_time_interval => INTERVAL '1 day', migrate_data => true)"
+    )
+
+    # Continuous aggregates can't be created inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE MATERIALIZED VIEW metric_hourly
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT slice_id,
+                   time_bucket(INTERVAL '1 hour', timestamp) AS hour,
+                   avg(throughput) AS avg_throughput,
+                   avg(latency) AS avg_latency,
+                   avg(packet_loss) AS avg_packet_loss,
+                   count(*) AS samples
+            FROM metrics
+            GROUP BY slice_id, hour
+            WITH NO DATA
+            """
+        )
+        op.execute(
+            "SELECT add_continuous_aggregate_policy('metric_hourly', "
+            "start_offset => INTERVAL '3 days', "
+            "end_offset => INTERVAL '1 hour', "
+            "schedule_interval => INTERVAL '30 minutes')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql' or not _metrics_is_hypertable():
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS metric_hourly")
+
+    # A hypertable can't be converted back in place, and it rejects a primary key
+    # without the partitioning column, so copy the rows into a plain table. The
+    # id sequence is detached first so dropping the hypertable keeps it.
+    op.execute("ALTER SEQUENCE metrics_id_seq OWNED BY NONE")
+    op.execute(
+        "CREATE TABLE metrics_plain "
+        "(LIKE metrics INCLUDING DEFAULTS INCLUDING COMMENTS)"
+    )
+    op.execute("INSERT INTO metrics_plain SELECT * FROM metrics")
+    op.execute("DROP TABLE metrics")
+    op.rename_table('metrics_plain', 'metrics')
+    op.execute("ALTER SEQUENCE metrics_id_seq OWNED BY metrics.id")
+
+    op.create_primary_key('metrics_pkey', 'metrics', ['id'])
+    op.create_foreign_key(
+        'metrics_device_id_fkey', 'metrics', 'devices', ['device_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'metrics_slice_id_fkey', 'metrics', 'slices', ['slice_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_index('ix_metrics_device_id', 'metrics', ['device_id'], unique=False)
+    op.create_index('ix_metrics_id', 'metrics', ['id'], unique=False)
+    op.create_index('ix_metrics_slice_id', 'metrics', ['slice_id'], unique=False)
+    op.create_index('ix_metrics_timestamp', 'metrics', ['timestamp'], unique=False)
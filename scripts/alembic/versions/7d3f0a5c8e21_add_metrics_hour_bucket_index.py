@@ -0,0 +1,41 @@
+"""Add an expression index on the hour bucket of metrics.timestamp
+
+Revision ID: 7d3f0a5c8e21
+Revises: 4c1e7b9d2a6f
+Create Date: 2026-10-16 11:03:47.190254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f0a5c8e21'
+down_revision: Union[str, None] = '4c1e7b9d2a6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # date_trunc() over timestamptz isn't immutable, so bucket in UTC to be indexable;
+    # must match app.db.models.metric_hour_bucket
+    op.create_index(
+        'ix_metrics_hour_bucket',
+        'metrics',
+        [sa.text("date_trunc('hour', timezone('UTC', timestamp))")],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_metrics_hour_bucket', table_name='metrics')
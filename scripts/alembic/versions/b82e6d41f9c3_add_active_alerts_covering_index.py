@@ -0,0 +1,36 @@
+"""Add a partial covering index for active alerts
+
+Revision ID: b82e6d41f9c3
+Revises: 7d3f0a5c8e21
+Create Date: 2026-10-16 11:48:22.603915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82e6d41f9c3'
+down_revision: Union[str, None] = '7d3f0a5c8e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_alerts_active_timestamp',
+        'alerts',
+        [sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_where=sa.text('resolved = false'),
+        postgresql_include=['id', 'level', 'message', 'entity_type', 'entity_id', 'context'],
+        sqlite_where=sa.text('resolved = 0')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_alerts_active_timestamp', table_name='alerts')
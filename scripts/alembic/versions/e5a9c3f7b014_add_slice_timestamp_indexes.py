@@ -0,0 +1,42 @@
+"""Add (slice_id, timestamp DESC) indexes to metrics and slice_kpis
+
+Revision ID: e5a9c3f7b014
+Revises: b82e6d41f9c3
+Create Date: 2026-10-16 22:05:37.184260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3f7b014'
+down_revision: Union[str, None] = 'b82e6d41f9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serve "latest row per slice" lookups with a single ordered index scan;
+    # must match the __table_args__ of app.db.models.Metric and SliceKPI
+    op.create_index(
+        'ix_metrics_slice_id_timestamp',
+        'metrics',
+        ['slice_id', sa.text('timestamp DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_slice_kpis_slice_id_timestamp',
+        'slice_kpis',
+        ['slice_id', sa.text('timestamp DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_slice_kpis_slice_id_timestamp', table_name='slice_kpis')
+    op.drop_index('ix_metrics_slice_id_timestamp', table_name='metrics')
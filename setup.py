@@ -20,8 +20,8 @@ setup(
         "sqlalchemy[asyncio]>=2.0.0",
         "asyncpg>=0.27.0",
         "python-dotenv>=1.0.0",
-        "python-jose[cryptography]>=3.3.0",
-        "passlib[bcrypt]>=1.7.4",
+        "PyJWT[crypto]>=2.8.0",
+        "bcrypt>=4.0.1",
         "python-multipart>=0.0.6",
         "jinja2>=3.0.0",
         "aiofiles>=23.1.0",